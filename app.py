@@ -41,6 +41,7 @@ if __name__ == "__main__":
     _ = Orchestrator()
     # _.save_metadata()
     # _.read_and_write_students_records()
+    # _.import_students_roster("roster.ods")
     # _.read_and_write_schedule_input_data()
     _.generate_exam_preparation_schedules()
     # _.send_schedules()        
@@ -0,0 +1,118 @@
+"""
+Schedule PDF compile benchmark.
+
+Builds synthetic schedules of growing length and times
+`ScheduleGenerator.generate_pdf_schedule` with and without the precompiled
+preamble format. For short schedules the preamble dominates, so the format
+should cut most of the per-PDF latency. Needs pdflatex, and the
+mylatexformat package for the format runs.
+
+Run from the repository root:
+
+    python -m benchmarks.pdf_preamble_format
+"""
+import argparse
+from datetime import datetime, timedelta
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import time
+
+# The database paths are resolved from the working directory at import time,
+# so run inside an empty directory to keep the real database untouched
+os.chdir(tempfile.mkdtemp(prefix="thinke-bench-"))
+
+from lib.typing.domain.schedule import (
+    DailySchedule,
+    DownloadedPastPaperMetadata,
+    ExamSchedule,
+    MonthlySchedule,
+    SchedulePaper,
+    StudentInfo,
+)
+from lib.utils import LibUtils
+from scheduler.exam_prep.schedule_generator import ScheduleGenerator
+
+
+SUBJECTS = ["Mathematics", "Biology", "Geography", "English Language", "Physical Science"]
+
+
+def build_schedule(days: int) -> ExamSchedule:
+    """Build a schedule with one subject per weekday over `days` study days."""
+    output_dir = Path.cwd() / "Output"
+    monthly: dict = {}
+    day = datetime(2025, 1, 6)
+
+    for index in range(days):
+        while day.weekday() >= 5:
+            day += timedelta(days=1)
+
+        label = day.strftime("%d-%m-%y")
+        year, month = LibUtils.get_date_parts(label)
+        subject = SUBJECTS[index % len(SUBJECTS)]
+        paper = DownloadedPastPaperMetadata(
+            grade="EGCSE",
+            subject=subject,
+            year=str(day.year - 1),
+            session="November",
+            url=f"https://e/{subject}/Paper {index % 3 + 1}.pdf",
+            path=output_dir / "src.pdf"
+        )
+        monthly.setdefault((year, month), []).append(DailySchedule(
+            day=label,
+            subject=subject,
+            papers=[SchedulePaper(paper_metadata=paper, dest_path=output_dir / "dest.pdf")]
+        ))
+        day += timedelta(days=1)
+
+    return ExamSchedule(
+        student_info=StudentInfo(id="bench", name="Benchmark", grade="EGCSE"),
+        base_path=output_dir / "EGCSE",
+        generated_pdf_path=output_dir / "pdf" / f"Benchmark {days} - Exam Preparation Schedule",
+        monthly_schedules=[
+            MonthlySchedule(year=year, month=month, daily_schedules=daily_schedules)
+            for (year, month), daily_schedules in monthly.items()
+        ]
+    )
+
+
+def time_compile(schedule: ExamSchedule, use_preamble_format: bool, repeat: int) -> float:
+    """Return the best wall time of compiling the schedule's PDF from scratch."""
+    generator = ScheduleGenerator(schedule, use_preamble_format=use_preamble_format)
+
+    # Dump the format outside the timed runs
+    if use_preamble_format and generator.preamble_format() is None:
+        return float("nan")
+
+    best = float("inf")
+    for _ in range(repeat):
+        # Drop the stored source hash so the PDF is really recompiled
+        generator.hash_path.unlink(missing_ok=True)
+        started = time.perf_counter()
+        generator.generate_pdf_schedule()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time schedule PDF compiles with and without the preamble format.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 20, 80, 320])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    if shutil.which("pdflatex") is None:
+        print("pdflatex was not found on PATH")
+        return
+
+    print(f"{'days':>6} {'plain (ms)':>11} {'format (ms)':>12} {'speedup':>8}")
+    for size in args.sizes:
+        schedule = build_schedule(size)
+        plain = time_compile(schedule, use_preamble_format=False, repeat=args.repeat)
+        with_format = time_compile(schedule, use_preamble_format=True, repeat=args.repeat)
+        print(f"{size:>6} {plain * 1000:>11.1f} {with_format * 1000:>12.1f} {plain / with_format:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
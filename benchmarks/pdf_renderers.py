@@ -0,0 +1,62 @@
+"""
+Schedule PDF renderer benchmark.
+
+Times `ScheduleGenerator.generate_pdf_schedule` with the LaTeX renderer
+(from the precompiled preamble format when available) against the
+PyMuPDF renderer, on synthetic schedules of growing length. The LaTeX
+column is skipped when pdflatex is not installed.
+
+Run from the repository root:
+
+    python -m benchmarks.pdf_renderers
+"""
+import argparse
+import shutil
+import time
+
+# Imported first: it moves into an empty working directory before the
+# database paths are resolved
+from benchmarks.pdf_preamble_format import build_schedule
+
+from lib.typing.domain.schedule import ExamSchedule
+from scheduler.exam_prep.schedule_generator import PdfRenderer, ScheduleGenerator
+
+
+def time_render(schedule: ExamSchedule, renderer: PdfRenderer, repeat: int) -> float:
+    """Return the best wall time of rendering the schedule's PDF from scratch."""
+    generator = ScheduleGenerator(schedule, renderer=renderer)
+
+    # Warm up (and dump the LaTeX preamble format) outside the timed runs
+    generator.generate_pdf_schedule()
+
+    best = float("inf")
+    for _ in range(repeat):
+        # Drop the stored source hash so the PDF is really re-rendered
+        generator.hash_path.unlink(missing_ok=True)
+        started = time.perf_counter()
+        generator.generate_pdf_schedule()
+        best = min(best, time.perf_counter() - started)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time the LaTeX and PyMuPDF schedule PDF renderers.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5, 20, 80, 320])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    has_latex = shutil.which("pdflatex") is not None
+    if not has_latex:
+        print("pdflatex was not found on PATH; timing PyMuPDF only")
+
+    print(f"{'days':>6} {'latex (ms)':>11} {'pymupdf (ms)':>13} {'speedup':>8}")
+    for size in args.sizes:
+        schedule = build_schedule(size)
+        latex = time_render(schedule, PdfRenderer.LATEX, args.repeat) if has_latex else float("nan")
+        pymupdf = time_render(schedule, PdfRenderer.PYMUPDF, args.repeat)
+        print(f"{size:>6} {latex * 1000:>11.1f} {pymupdf * 1000:>13.1f} {latex / pymupdf:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Record memory benchmark.
+
+Builds a synthetic catalog of past paper rows, as the readers do, once
+with plain dataclasses (a per-instance __dict__ and a fresh string per
+field) and once with the slotted record types and interned strings, and
+reports the memory each takes according to tracemalloc.
+
+Run from the repository root:
+
+    python -m benchmarks.record_memory --rows 1000000
+"""
+import argparse
+from dataclasses import dataclass
+import sys
+import time
+import tracemalloc
+from typing import Callable, List
+
+from lib.typing.domain.schedule import PastPaperMetadata
+
+
+@dataclass
+class PlainPastPaperMetadata:
+    """The catalog record as it was before slotting, for comparison."""
+    grade: str
+    subject: str
+    year: str
+    url: str
+    session: str
+    paper: str
+
+
+SUBJECTS = ["Mathematics", "Biology", "Geography", "English Language", "Physical Science", "History"]
+SESSIONS = ["June", "November"]
+
+
+def catalog_rows(count: int):
+    """Yield raw catalog rows with fresh strings, as a CSV reader would."""
+    for i in range(count):
+        subject = SUBJECTS[i % len(SUBJECTS)]
+        yield (
+            "".join(["IG", "CSE"]),
+            "".join(subject),
+            2000 + i % 25,
+            f"https://papers.example/{subject}/{i}.pdf",
+            "".join(SESSIONS[i % 2]),
+            f"Paper {i % 4 + 1}",
+        )
+
+
+def build_plain(count: int) -> List[PlainPastPaperMetadata]:
+    return [
+        PlainPastPaperMetadata(grade=grade, subject=subject, year=year, url=url, session=session, paper=paper)
+        for grade, subject, year, url, session, paper in catalog_rows(count)
+    ]
+
+
+def build_slotted(count: int) -> List[PastPaperMetadata]:
+    intern = sys.intern
+    return [
+        PastPaperMetadata(
+            grade=intern(grade),
+            subject=intern(subject),
+            year=year,
+            url=url,
+            session=intern(session),
+            paper=intern(paper)
+        )
+        for grade, subject, year, url, session, paper in catalog_rows(count)
+    ]
+
+
+def measure(build: Callable[[int], list], count: int) -> tuple[float, float]:
+    """Return the (MiB, seconds) a build of `count` rows takes."""
+    tracemalloc.start()
+    started = time.perf_counter()
+    records = build(count)
+    elapsed = time.perf_counter() - started
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return current / 2**20, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare catalog record memory.")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    plain_mib, plain_s = measure(build_plain, args.rows)
+    slotted_mib, slotted_s = measure(build_slotted, args.rows)
+
+    print(f"{'records':<28} {'MiB':>9} {'bytes/row':>10} {'build (s)':>10}")
+    for label, mib, seconds in (
+        ("plain dataclass", plain_mib, plain_s),
+        ("slotted + interned", slotted_mib, slotted_s),
+    ):
+        print(f"{label:<28} {mib:>9.1f} {mib * 2**20 / args.rows:>10.0f} {seconds:>10.2f}")
+    print(f"saving: {100 * (1 - slotted_mib / plain_mib):.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Scheduling cost benchmark.
+
+Builds synthetic grade contexts whose study-day count and catalog size
+grow together, then times `ExamScheduler.get_new_scheduled_papers_for_student`
+for one student. With the precomputed paper-group queues the time per
+study day should stay flat as the schedule grows.
+
+Run from the repository root:
+
+    python -m benchmarks.schedule_scaling
+"""
+import argparse
+from datetime import datetime, timedelta
+import gc
+import os
+import tempfile
+import time
+
+# The database paths are resolved from the working directory at import time,
+# so run inside an empty directory to keep the real database untouched
+os.chdir(tempfile.mkdtemp(prefix="thinke-bench-"))
+
+from lib.grade import CambridgeGrade, EceswaGrade
+from lib.typing.data.schedule import PrioritizedCouncil, ScheduleInputData
+from lib.typing.domain.schedule import PastPaperMetadata
+from lib.typing.domain.student import Student
+from scheduler.exam_prep.grade_scheduling_context import GradeSchedulingContext
+from scheduler.exam_prep.scheduler import ExamScheduler
+
+
+SUBJECTS = ["Mathematics", "Biology", "Geography", "English Language", "Physical Science"]
+COUNCILS = ["Examinations Councils of Eswatini", "Cambridge Assessment International Education"]
+
+
+def build_context(days: int) -> GradeSchedulingContext:
+    """Build a context with `days` weekdays and a catalog that grows with it."""
+    start = datetime(2025, 1, 6)
+    end = start + timedelta(days=days * 7 // 5)
+    years = max(1, days // 20)
+
+    subject_papers = {}
+    for subject in SUBJECTS:
+        subject_papers[subject] = {
+            EceswaGrade.EGCSE.value: [
+                PastPaperMetadata(
+                    grade=EceswaGrade.EGCSE.value,
+                    subject=subject,
+                    year=2000 + year,
+                    session="November",
+                    url=f"https://e/{subject}/{2000 + year}/EGCSE {subject} Paper {number}.pdf",
+                    paper=f"Paper {number}"
+                )
+                for year in range(years)
+                for number in (1, 2, 3)
+            ],
+            CambridgeGrade.IGCSE.value: [
+                PastPaperMetadata(
+                    grade=CambridgeGrade.IGCSE.value,
+                    subject=subject,
+                    year=2000 + year,
+                    session=session,
+                    url=f"https://c/{subject}/0580_{code}{year:02d}_{kind}_{number}.pdf",
+                    paper=f"Paper {number}"
+                )
+                for year in range(years)
+                for session, code in (("June", "s"), ("November", "w"))
+                for number in (11, 21, 41)
+                for kind in ("qp", "in")
+            ],
+        }
+
+    input_data = ScheduleInputData(
+        start_date=start.strftime("%d-%m-%y"),
+        end_date=end.strftime("%d-%m-%y"),
+        excluded_days=["Saturday", "Sunday"],
+        prioritized_councils=[PrioritizedCouncil(subject=s, councils=COUNCILS) for s in SUBJECTS]
+    )
+    return GradeSchedulingContext.from_data(EceswaGrade.EGCSE, input_data, subject_papers)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Time schedule generation against schedule length.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 200, 400, 800, 1600, 3200])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    student = Student(name="Benchmark", phone="", grade=EceswaGrade.EGCSE.value, subjects=SUBJECTS, id="bench")
+
+    print(f"{'days':>6} {'papers':>8} {'best (ms)':>10} {'us/day':>8}")
+    for size in args.sizes:
+        context = build_context(size)
+        papers = sum(len(p) for by_grade in context.subject_papers.values() for p in by_grade.values())
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            scheduler = ExamScheduler(student, context)
+            gc.disable()
+            started = time.perf_counter()
+            scheduler.get_new_scheduled_papers_for_student()
+            best = min(best, time.perf_counter() - started)
+            gc.enable()
+
+        days = len(context.study_days)
+        print(f"{days:>6} {papers:>8} {best * 1000:>10.2f} {best / days * 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
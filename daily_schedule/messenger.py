@@ -8,6 +8,7 @@ from lib.symbols import Symbols
 from lib.typing.domain.schedule import MsgRecord, ScheduledPastPaperMetadata
 from lib.typing.domain.student import Student, StudentRecord
 from lib.utils import LibUtils
+from scheduler.exam_prep.schedule_snapshot import ScheduleSnapshot
 
 class Messenger:
     """
@@ -19,6 +20,23 @@ class Messenger:
         
         self._student = student
         self._past_paper = past_paper
+    
+    @classmethod
+    def for_day(cls, snapshot: ScheduleSnapshot, day: str) -> List["Messenger"]:
+        """
+        Create one messenger per paper scheduled on a day.
+
+        Args:
+            snapshot (ScheduleSnapshot): The student's stored schedule snapshot.
+            day (str): The study day, as 'dd-mm-yy'.
+
+        Returns:
+            List[Messenger]: The day's messengers.
+        """
+        return [
+            cls(student=snapshot.student, past_paper=past_paper)
+            for past_paper in snapshot.records_by_day(day)
+        ]
         
     
     def send_whatsapp_msg(self) -> Optional[MsgRecord]:
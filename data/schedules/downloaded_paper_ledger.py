@@ -0,0 +1,105 @@
+import threading
+from typing import Iterable, List, Optional, Set
+
+from data.storage.storage_backend_factory import StorageBackendFactory
+from lib.shared_instance import SharedInstance
+from lib.typing.domain.schedule import DownloadedPastPaperMetadata
+
+
+class DownloadedPaperLedger(SharedInstance):
+    """
+    Process-wide, URL-keyed ledger of a grade's downloaded papers, buffered until `flush()`;
+    reloaded when the stored records change and flushed under a cross-process lock.
+    """
+
+    def __init__(self, grade: str):
+        self._grade = grade.lower()
+        self._backend = StorageBackendFactory.get()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._version: Optional[tuple] = None
+        self._stored_urls: Set[str] = set()
+        self._pending: List[DownloadedPastPaperMetadata] = []
+        self._pending_urls: Set[str] = set()
+        self._refresh()
+
+    @classmethod
+    def instance(cls, grade: str) -> "DownloadedPaperLedger":
+        """Return the shared ledger of a grade, loading it on first use."""
+        return cls._shared(grade.lower(), lambda: cls(grade))
+
+    def contains(self, url: str) -> bool:
+        """Return True if the paper at the URL is recorded as downloaded."""
+        with self._lock:
+            self._refresh()
+            return url in self._stored_urls or url in self._pending_urls
+
+    def contains_all(self, urls: Iterable[str]) -> bool:
+        """Return True if every given URL is recorded as downloaded."""
+        with self._lock:
+            self._refresh()
+            return all(url in self._stored_urls or url in self._pending_urls for url in urls)
+
+    def add(self, records: Iterable[DownloadedPastPaperMetadata]) -> int:
+        """
+        Record downloaded papers, ignoring URLs already in the ledger.
+
+        The records are only buffered; call `flush()` to persist them.
+
+        Returns:
+            int: The number of new records accepted.
+        """
+        accepted = 0
+        with self._lock:
+            self._refresh()
+            for record in records:
+                if record.url in self._stored_urls or record.url in self._pending_urls:
+                    continue
+                self._pending_urls.add(record.url)
+                self._pending.append(record)
+                accepted += 1
+        return accepted
+
+    def flush(self) -> int:
+        """
+        Persist all buffered records in one append.
+
+        Records whose URL another process stored since the ledger was last
+        loaded are dropped instead of appended again.
+
+        Returns:
+            int: The number of records written.
+        """
+        with self._flush_lock:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return 0
+
+            with self._backend.lock_downloaded_papers(self._grade):
+                with self._lock:
+                    self._refresh()
+                    new_records = [record for record in pending if record.url not in self._stored_urls]
+
+                # A failed append leaves the records buffered so a later flush can retry them
+                if new_records:
+                    self._backend.append_downloaded_paper_metadata_records(self._grade, new_records)
+
+                with self._lock:
+                    self._stored_urls.update(record.url for record in new_records)
+                    # Still under the file lock, so the new signature only reflects this append
+                    self._version = self._backend.get_downloaded_papers_version(self._grade)
+                    del self._pending[:len(pending)]
+                    self._pending_urls = {record.url for record in self._pending}
+
+            return len(new_records)
+
+    def _refresh(self) -> None:
+        """Reload the stored URLs if the backend's records have changed."""
+        version = self._backend.get_downloaded_papers_version(self._grade)
+        if version != self._version:
+            self._stored_urls = {
+                record.url
+                for record in self._backend.get_downloaded_paper_metadata_records(self._grade)
+            }
+            self._version = version
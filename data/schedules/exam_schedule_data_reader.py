@@ -1,8 +1,8 @@
 import csv
-import os
 from pathlib import Path
 from typing import Optional
 
+from data.storage.storage_backend_factory import StorageBackendFactory
 from lib.typing.data.schedule import ScheduleInputData, PrioritizedCouncil
 from lib.paths import ExamScheduleCSVPaths
 from lib.typing.domain.schedule import DownloadedPastPaperMetadata
@@ -18,6 +18,7 @@ class ExamSchedulerDataReader:
     def __init__(self, grade: EceswaGrade):
         self.grade = grade.value.lower()
         self._paths = ExamScheduleCSVPaths(grade=self.grade)
+        self._backend = StorageBackendFactory.get()
 
     def get_schedule_input_data(self) -> Optional[ScheduleInputData]:
         """Reads exam schedule data from CSV files and returns a structured ScheduleInputData object."""
@@ -49,6 +50,16 @@ class ExamSchedulerDataReader:
                     prioritized.append(PrioritizedCouncil(subject=subject, councils=councils))
 
             return prioritized
+        
+        def read_holidays() -> list[str]:
+            """Reads the optional public holidays from CSV."""
+            if not self._paths.holidays_file.exists():
+                return []
+            
+            with self._paths.holidays_file.open(mode="r", newline="") as file:
+                reader = csv.reader(file)
+                next(reader, None)  # Skip header
+                return [row[0].strip() for row in reader if row and row[0].strip()]
     
         try:
             start_date, end_date = read_dates()
@@ -59,25 +70,12 @@ class ExamSchedulerDataReader:
                 start_date=start_date,
                 end_date=end_date,
                 excluded_days=excluded_days,
-                prioritized_councils=prioritized_councils
+                prioritized_councils=prioritized_councils,
+                holidays=read_holidays()
             )
         except FileNotFoundError:
             # One or more required files not found
             return None
     
     def get_downloaded_paper_metadata_records(self) -> list[DownloadedPastPaperMetadata]:
-        file_path = self._paths.downloaded_past_papers_file
-
-        if not os.path.exists(file_path):
-            return [] 
-
-        records = []
-        
-        with open(file_path, mode='r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if not any(row.values()):
-                    continue
-                records.append(DownloadedPastPaperMetadata(**row))
-
-        return records
+        return self._backend.get_downloaded_paper_metadata_records(self.grade)
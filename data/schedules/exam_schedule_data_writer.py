@@ -1,6 +1,6 @@
 import csv
-from dataclasses import asdict
-import os
+from typing import Iterable
+from data.schedules.downloaded_paper_ledger import DownloadedPaperLedger
 from lib.grade import EceswaGrade
 from lib.paths import ExamScheduleCSVPaths
 from lib.typing.data.schedule import ScheduleInputData
@@ -13,9 +13,13 @@ class ExamSchedulerDataWriter:
     - dates.csv: stores start and end dates
     - excluded_days.csv: stores a list of excluded days
     - prioritized_councils.csv: stores subject-to-council mappings
+    - holidays.csv: stores the public holidays to skip
+
+    Downloaded paper records go through the grade's `DownloadedPaperLedger`.
     """
 
     def __init__(self, grade: EceswaGrade):
+        self._grade = grade.value
         self._paths = ExamScheduleCSVPaths(grade=grade.value)
         self._ensure_base_directory()
 
@@ -50,32 +54,31 @@ class ExamSchedulerDataWriter:
                 for prioritized in input_data.prioritized_councils:
                     writer.writerow([prioritized.subject] + prioritized.councils)
                 
+        def write_holidays():
+            """Write the public holidays in dd-mm-yy format to holidays.csv."""
+            with self._paths.holidays_file.open(mode="w", newline="") as file:
+                writer = csv.writer(file)
+                writer.writerow(["date"])
+                writer.writerows([day] for day in input_data.holidays)
+                
         write_dates()
         write_excluded_days()
         write_prioritized_councils()
+        write_holidays()
     
     def write_downloaded_paper_metadata_record(self, record: DownloadedPastPaperMetadata) -> bool:
-        file_path = self._paths.downloaded_past_papers_file
-        headers = list(DownloadedPastPaperMetadata.__annotations__.keys())
-        record_dict = asdict(record)
-
-        # Ensure the file exists with headers
-        file_exists = os.path.exists(file_path)
-        if not file_exists:
-            with open(file_path, mode='w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
+        return self.write_downloaded_paper_metadata_records([record]) == 1
 
-        # Check if record already exists
-        with open(file_path, mode='r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if all(row[key] == record_dict[key] for key in headers):
-                    return False 
+    def write_downloaded_paper_metadata_records(self, records: Iterable[DownloadedPastPaperMetadata]) -> int:
+        """
+        Record downloaded papers in the grade's ledger and persist them in one append.
 
-        # Write the new record
-        with open(file_path, mode='a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writerow(record_dict)
+        Papers whose URL is already recorded are skipped.
 
-        return True
+        Returns:
+            int: The number of new records accepted.
+        """
+        ledger = DownloadedPaperLedger.instance(self._grade)
+        accepted = ledger.add(records)
+        ledger.flush()
+        return accepted
@@ -0,0 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
+import os
+from pathlib import Path
+import threading
+from typing import Iterable, List, Optional, Set, Union
+
+from lib.paths import ResourcesPaths
+from lib.shared_instance import SharedInstance
+
+
+class ResourcesIndex(SharedInstance):
+    """
+    Process-wide set of the files under `Resources/`, walked once with `os.scandir`;
+    downloads are added with `record_download()`, removals are only seen after `refresh()`.
+    """
+
+    def __init__(self, root: Optional[Path] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            root (Path, optional): The directory to index. Defaults to `Resources/`.
+            max_workers (int, optional): Threads walking the grade directories;
+                1 walks them one after the other. Defaults to at most 8.
+        """
+        root = Path(root or ResourcesPaths().base_dir)
+        self._root = root.resolve()
+        # Files are keyed relative to the root, so every spelling of it finds them
+        self._root_keys = tuple({self._key(root), self._key(self._root)})
+        self._max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._lock = threading.Lock()
+        self._paths = self._scan()
+
+    @classmethod
+    def instance(cls, root: Optional[Path] = None) -> "ResourcesIndex":
+        """Return the shared index of a directory, walking it on first use."""
+        root = Path(root or ResourcesPaths().base_dir)
+        index = cls._shared(root.resolve(), lambda: cls(root))
+        index._add_root_spelling(root)
+        return index
+
+    @classmethod
+    def record_download(cls, path: Union[str, Path]) -> None:
+        """
+        Add a downloaded file to every loaded index that covers it.
+
+        Indexes that are not loaded yet pick the file up when they walk the tree.
+
+        Args:
+            path (Union[str, Path]): The downloaded file.
+        """
+        with cls._instances_lock:
+            indexes = list(cls._instances.values())
+
+        for index in indexes:
+            key = index._relative_key(path)
+            if key is not None:
+                with index._lock:
+                    index._paths.add(key)
+
+    def contains(self, path: Union[str, Path]) -> bool:
+        """Return True if the file is in the index."""
+        key = self._relative_key(path)
+        with self._lock:
+            return key in self._paths
+
+    def contains_all(self, paths: Iterable[Union[str, Path]]) -> bool:
+        """Return True if every given file is in the index."""
+        keys = [self._relative_key(path) for path in paths]
+        with self._lock:
+            return all(key in self._paths for key in keys)
+
+    def refresh(self) -> None:
+        """Walk the tree again, e.g. after files were removed from it."""
+        paths = self._scan()
+        with self._lock:
+            self._paths = paths
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._paths)
+
+    def _scan(self) -> Set[str]:
+        """Walk the root, one grade directory per worker thread."""
+        try:
+            with os.scandir(self._root) as it:
+                entries = list(it)
+        except FileNotFoundError:
+            return set()
+        except OSError as e:
+            print(f"[ResourcesIndex] Could not scan {self._root}: {e}")
+            return set()
+
+        paths = {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+        grade_dirs = [entry.path for entry in entries if entry.is_dir()]
+
+        if grade_dirs:
+            with ThreadPoolExecutor(max_workers=min(self._max_workers, len(grade_dirs))) as executor:
+                for grade_paths in executor.map(self._scan_tree, grade_dirs):
+                    paths.update(grade_paths)
+
+        return paths
+
+    def _scan_tree(self, top: str) -> List[str]:
+        """Return the key of every file below a directory."""
+        prefix_length = len(os.fspath(self._root)) + 1
+        paths: List[str] = []
+        pending = [top]
+
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        if entry.is_dir():
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            paths.append(os.path.normcase(entry.path[prefix_length:]))
+            except OSError as e:
+                print(f"[ResourcesIndex] Could not scan {directory}: {e}")
+
+        return paths
+
+    def _add_root_spelling(self, root: Path) -> None:
+        """Let paths under another spelling of the root find the indexed files."""
+        key = self._key(root)
+        with self._lock:
+            if key not in self._root_keys:
+                self._root_keys += (key,)
+
+    def _relative_key(self, path: Union[str, Path]) -> Optional[str]:
+        """Return a file's path below the root, or None if it is not below it."""
+        key = self._key(path)
+        for root_key in self._root_keys:
+            if key.startswith(root_key + os.sep):
+                return key[len(root_key) + 1:]
+        return None
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        # Matches the same file however its path was spelled (and case-insensitively on Windows)
+        return os.path.normcase(os.path.abspath(os.fspath(path)))
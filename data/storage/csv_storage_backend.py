@@ -0,0 +1,455 @@
+import csv
+from collections import defaultdict
+from dataclasses import asdict
+import json
+import os
+from pathlib import Path
+import sys
+from typing import ContextManager, Dict, Iterable, List, Optional
+import uuid
+
+from data.storage.storage_backend import StorageBackend, StorageBackendType
+from data.students.partitioned_schedule_store import PartitionedScheduleStore
+from data.students.student_store import StudentStore
+from lib.paths import ExamScheduleCSVPaths, PastPaperCSVPaths, StudentCSVPaths
+from lib.typing.data.downloader import DownloadLinks
+from lib.typing.domain.schedule import (
+    DownloadedPastPaperMetadata,
+    MsgRecord,
+    PastPaperMetadata,
+    ScheduleCursor,
+    ScheduledPastPaperMetadata
+)
+from lib.typing.domain.student import Student, StudentRecord
+from lib.utils import LibUtils
+
+
+class CsvStorageBackend(StorageBackend):
+    """
+    Stores all data as flat CSV files under ./database:
+
+    - students/: student info, contacts, subjects and sent messages
+    - students/assigned_schedules/: assigned schedules, one segment per student
+    - students/schedule_cursors.csv: where each rolling-window schedule stopped
+    - exam_preparation/<grade>/downloaded_past_papers.csv: downloaded paper ledger
+    - subjects/<grade>/<subject>.csv: the past paper catalog
+    """
+
+    BACKEND_TYPE = StorageBackendType.CSV
+
+    EXAM_SCHEDULE_RECORD_FIELDNAMES = ["student_id", "date", "grade", "subject", "paper", "year", "session", "url"]
+    SCHEDULE_CURSOR_FIELDNAMES = ["student_id", "last_day", "subject_index", "council_indices", "reset_days"]
+
+    def __init__(self):
+        self._paths = StudentCSVPaths()
+        self._student_store = StudentStore.instance(self._paths)
+        self._schedule_store = PartitionedScheduleStore.instance(
+            self._paths,
+            self.EXAM_SCHEDULE_RECORD_FIELDNAMES
+        )
+
+    # Students
+
+    def get_students_by_grade(self, grade: str) -> List[Student]:
+        return self._student_store.get_students_by_grade(grade)
+
+    def get_student_by_id(self, student_id: str) -> Optional[Student]:
+        return self._student_store.get_student_by_id(student_id)
+
+    def get_all_students(self) -> List[Student]:
+        return self._student_store.get_all_students()
+
+    def write_student_record(self, record: StudentRecord) -> str:
+        student_id = self._student_store.find_student_id(record.name, record.grade) or str(uuid.uuid4())
+
+        # A known student only gets the subjects or contact row it may be missing
+        self.write_students([Student(
+            id=student_id,
+            name=record.name.strip(),
+            phone=record.phone,
+            grade=record.grade,
+            subjects=record.subjects
+        )])
+
+        return student_id
+
+    def write_students(self, students: Iterable[Student]) -> int:
+        # A known ID still gets a subjects or contact row lost to an interrupted earlier write
+        info_ids, subjects_ids, contact_ids = self._student_store.stored_ids()
+        seen_ids = set()
+        new_students, missing_subjects, missing_contacts = [], [], []
+
+        for student in students:
+            if student.id in seen_ids:
+                continue
+            seen_ids.add(student.id)
+
+            if student.id not in info_ids:
+                new_students.append(student)
+            if student.id not in subjects_ids:
+                missing_subjects.append(student)
+            if student.id not in contact_ids:
+                missing_contacts.append(student)
+
+        if not (new_students or missing_subjects or missing_contacts):
+            return 0
+
+        max_subjects = max((len(student.subjects) for student in missing_subjects), default=0)
+
+        self._paths.base_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_csv_with_header(self._paths.info_file, ["id", "name", "grade"])
+        self._ensure_csv_with_header(
+            self._paths.subjects_file,
+            ["id"] + [f"subject{i+1}" for i in range(max_subjects)]
+        )
+        self._ensure_csv_with_header(self._paths.contacts_file, ["id", "phone"])
+
+        if new_students:
+            with self._paths.info_file.open("a", newline='', encoding="utf-8") as f:
+                csv.writer(f).writerows(
+                    [student.id, student.name.strip(), student.grade] for student in new_students
+                )
+
+        if missing_subjects:
+            with self._paths.subjects_file.open("a", newline='', encoding="utf-8") as f:
+                csv.writer(f).writerows(
+                    [student.id] + student.subjects for student in missing_subjects
+                )
+
+        if missing_contacts:
+            with self._paths.contacts_file.open("a", newline='', encoding="utf-8") as f:
+                csv.writer(f).writerows(
+                    [student.id, student.phone.strip()] for student in missing_contacts
+                )
+
+        # Make the shared store pick up the new rows on its next lookup
+        self._student_store.invalidate()
+
+        return len(new_students)
+
+    # Assigned schedules
+
+    def exam_schedule_record_exists(self, record: ScheduledPastPaperMetadata) -> bool:
+        return self._schedule_store.contains(record)
+
+    def write_exam_schedule_records(self, records: Iterable[ScheduledPastPaperMetadata]) -> int:
+        return self._schedule_store.append(records)
+
+    def get_exam_schedules_by_id(self, student_id: str) -> List[ScheduledPastPaperMetadata]:
+        return list(self._schedule_store.read(student_id))
+
+    def get_exam_schedules_by_id_and_day(self, student_id: str, day: str) -> List[ScheduledPastPaperMetadata]:
+        return [
+            record
+            for record in self._schedule_store.read(str(student_id))
+            if record.date == day
+        ]
+
+    def get_all_exam_schedules(self) -> List[ScheduledPastPaperMetadata]:
+        return list(self._schedule_store.read_all())
+
+    def get_exam_schedules_version(self, student_id: str) -> Optional[tuple]:
+        return self._schedule_store.segment_signature(str(student_id))
+
+    # Schedule cursors
+
+    def get_schedule_cursor(self, student_id: str) -> Optional[ScheduleCursor]:
+        return next(
+            (cursor for cursor in self.get_all_schedule_cursors() if cursor.student_id == student_id),
+            None
+        )
+
+    def get_all_schedule_cursors(self) -> List[ScheduleCursor]:
+        file_path = self._paths.schedule_cursors_file
+        if not file_path.exists():
+            return []
+
+        with file_path.open(mode='r', newline='', encoding='utf-8') as f:
+            return [
+                ScheduleCursor(
+                    student_id=row["student_id"],
+                    last_day=row["last_day"],
+                    subject_index=int(row["subject_index"]),
+                    council_indices=json.loads(row["council_indices"] or "{}"),
+                    reset_days=json.loads(row["reset_days"] or "{}")
+                )
+                for row in csv.DictReader(f)
+            ]
+
+    def write_schedule_cursors(self, cursors: Iterable[ScheduleCursor]) -> int:
+        updates = {cursor.student_id: cursor for cursor in cursors}
+        if not updates:
+            return 0
+
+        merged = {cursor.student_id: cursor for cursor in self.get_all_schedule_cursors()}
+        merged.update(updates)
+
+        # One row per student, so the whole file is rewritten atomically
+        file_path = self._paths.schedule_cursors_file
+        tmp_path = file_path.with_suffix(".tmp")
+        self._paths.base_dir.mkdir(parents=True, exist_ok=True)
+
+        with tmp_path.open(mode='w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(self.SCHEDULE_CURSOR_FIELDNAMES)
+            writer.writerows(
+                [
+                    cursor.student_id,
+                    cursor.last_day,
+                    cursor.subject_index,
+                    json.dumps(cursor.council_indices),
+                    json.dumps(cursor.reset_days)
+                ]
+                for cursor in merged.values()
+            )
+
+        os.replace(tmp_path, file_path)
+        return len(updates)
+
+    # Sent messages
+
+    def msgs_for_id_and_day_exist(self, student_id: str, day: str) -> bool:
+        return any(
+            record.student_id == student_id and record.date == day
+            for record in self.get_all_msg_records()
+        )
+
+    def write_msg_records(self, records: Iterable[MsgRecord]) -> int:
+        file_path = self._paths.sent_msgs_file
+        headers = list(MsgRecord.__annotations__.keys())
+
+        existing = {tuple(asdict(record).values()) for record in self.get_all_msg_records()}
+        new_rows = []
+        for record in records:
+            row = asdict(record)
+            key = tuple(row.values())
+            if key not in existing:
+                existing.add(key)
+                new_rows.append(row)
+
+        if not new_rows:
+            return 0
+
+        self._paths.base_dir.mkdir(parents=True, exist_ok=True)
+        write_header = not os.path.exists(file_path)
+
+        with open(file_path, mode='a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(new_rows)
+
+        return len(new_rows)
+
+    def get_all_msg_records(self) -> List[MsgRecord]:
+        file_path = self._paths.sent_msgs_file
+        if not os.path.exists(file_path):
+            return []
+
+        with open(file_path, mode='r', newline='', encoding='utf-8') as f:
+            return [MsgRecord(**row) for row in csv.DictReader(f)]
+
+    # Downloaded past papers
+
+    def get_downloaded_paper_metadata_records(self, grade: str) -> List[DownloadedPastPaperMetadata]:
+        file_path = ExamScheduleCSVPaths(grade=grade).downloaded_past_papers_file
+
+        if not os.path.exists(file_path):
+            return []
+
+        records = []
+
+        with open(file_path, mode='r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                if not any(row.values()):
+                    continue
+                records.append(DownloadedPastPaperMetadata(**row))
+
+        return records
+
+    def write_downloaded_paper_metadata_records(
+        self,
+        grade: str,
+        records: Iterable[DownloadedPastPaperMetadata]
+    ) -> int:
+        paths = ExamScheduleCSVPaths(grade=grade)
+        file_path = paths.downloaded_past_papers_file
+        headers = list(DownloadedPastPaperMetadata.__annotations__.keys())
+
+        def row_key(record: DownloadedPastPaperMetadata) -> tuple[str, ...]:
+            return tuple(str(getattr(record, key)) for key in headers)
+
+        existing = {row_key(record) for record in self.get_downloaded_paper_metadata_records(grade)}
+        new_rows = []
+        for record in records:
+            key = row_key(record)
+            if key not in existing:
+                existing.add(key)
+                new_rows.append(dict(zip(headers, key)))
+
+        if not new_rows:
+            return 0
+
+        paths.base_dir.mkdir(parents=True, exist_ok=True)
+        write_header = not os.path.exists(file_path)
+
+        with open(file_path, mode='a', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=headers)
+            if write_header:
+                writer.writeheader()
+            writer.writerows(new_rows)
+
+        return len(new_rows)
+
+    def append_downloaded_paper_metadata_records(
+        self,
+        grade: str,
+        records: Iterable[DownloadedPastPaperMetadata]
+    ) -> None:
+        paths = ExamScheduleCSVPaths(grade=grade)
+        file_path = paths.downloaded_past_papers_file
+        headers = list(DownloadedPastPaperMetadata.__annotations__.keys())
+
+        paths.base_dir.mkdir(parents=True, exist_ok=True)
+        write_header = not os.path.exists(file_path)
+
+        with open(file_path, mode='a', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            if write_header:
+                writer.writerow(headers)
+            writer.writerows(
+                [str(getattr(record, key)) for key in headers]
+                for record in records
+            )
+
+    def get_downloaded_papers_version(self, grade: str) -> Optional[tuple]:
+        try:
+            stat = ExamScheduleCSVPaths(grade=grade).downloaded_past_papers_file.stat()
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def lock_downloaded_papers(self, grade: str) -> ContextManager[None]:
+        file_path = ExamScheduleCSVPaths(grade=grade).downloaded_past_papers_file
+        return LibUtils.file_lock(file_path.with_name(f"{file_path.name}.lock"))
+
+    # Past paper catalog
+
+    def get_subject_metadata(self, grade: str, subject: str) -> List[PastPaperMetadata]:
+        metadata = []
+        subject_file = PastPaperCSVPaths(grade).subject_file(subject)
+
+        if subject_file.exists():
+            with subject_file.open(mode='r', newline='', encoding='utf-8') as file:
+                reader = csv.DictReader(file)
+                for row in reader:
+                    try:
+                        paper = PastPaperMetadata(
+                            grade=sys.intern(row['grade'].strip()),
+                            subject=sys.intern(row['subject'].strip()),
+                            year=int(row['year'].strip()),
+                            session=sys.intern(row['session'].strip()),
+                            url=row['url'].strip(),
+                            paper=sys.intern(LibUtils.extract_paper_label(row['url'].strip()))
+                        )
+                        metadata.append(paper)
+                    except KeyError:
+                        continue
+                    except ValueError:
+                        continue
+
+        return metadata
+
+    def get_past_paper_sources(self, grade: str) -> Dict[str, tuple]:
+        subjects_dir = PastPaperCSVPaths(grade).base_dir
+        if not subjects_dir.exists():
+            return {}
+
+        sources = {}
+        with os.scandir(subjects_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".csv"):
+                    stat = entry.stat()
+                    sources[entry.name[:-len(".csv")]] = (stat.st_mtime_ns, stat.st_size)
+        return sources
+
+    def write_past_paper_urls(self, urls: DownloadLinks) -> Dict[str, int]:
+        base_dir = os.path.join(os.getcwd(), "database", "subjects")
+
+        # Group incoming rows by their target subject file
+        rows_by_file: Dict[str, list[list[str]]] = defaultdict(list)
+        header_by_file: Dict[str, List[str]] = {}
+
+        for key, url_list in urls.items():
+            parts = key.split(",")
+            if len(parts) < 3:
+                print(f"Skipping malformed key: {key}")
+                continue
+
+            grade = parts[0].strip().lower()
+            subject = parts[1].strip().lower()
+            csv_path = os.path.join(base_dir, grade, f"{subject}.csv")
+
+            # Build header dynamically based on parts length
+            header = ["grade", "subject", "year"]
+            if len(parts) > 3:
+                header.append("session")
+            header.append("url")
+
+            header_by_file.setdefault(csv_path, header)
+            rows_by_file[csv_path].extend(parts + [url] for url in url_list)
+
+        deltas: Dict[str, int] = {}
+
+        for csv_path, rows in rows_by_file.items():
+            path = Path(csv_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            file_has_rows = path.exists() and path.stat().st_size > 0
+
+            # Load existing rows once per file to avoid duplicates
+            existing_rows = set()
+            if file_has_rows:
+                with path.open(mode="r", encoding="utf-8", newline="") as f:
+                    reader = csv.reader(f)
+                    next(reader, None)  # skip header
+                    existing_rows.update(tuple(row) for row in reader)
+
+            new_rows = []
+            for row in rows:
+                row_tuple = tuple(row)
+                if row_tuple not in existing_rows:
+                    existing_rows.add(row_tuple)
+                    new_rows.append(row)
+
+            if new_rows:
+                if file_has_rows:
+                    # Single append to the existing file
+                    with path.open(mode="a", encoding="utf-8", newline="") as f:
+                        csv.writer(f).writerows(new_rows)
+                else:
+                    # Write header and rows to a temp file, then move it into place
+                    tmp_path = path.with_suffix(".csv.tmp")
+                    with tmp_path.open(mode="w", encoding="utf-8", newline="") as f:
+                        writer = csv.writer(f)
+                        writer.writerow(header_by_file[csv_path])
+                        writer.writerows(new_rows)
+                    os.replace(tmp_path, path)
+
+            deltas[csv_path] = len(new_rows)
+
+        return deltas
+
+    @staticmethod
+    def _ensure_csv_with_header(path: Path, header: List[str]) -> None:
+        """
+        Ensures that the given CSV file exists and starts with the correct header.
+
+        Args:
+            path (Path): The full path to the CSV file.
+            header (List[str]): The header row to write if the file is new or empty.
+        """
+        if not path.exists() or path.stat().st_size == 0:
+            with path.open(mode="w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
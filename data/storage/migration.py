@@ -0,0 +1,88 @@
+import argparse
+import csv
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Optional
+
+from data.storage.csv_storage_backend import CsvStorageBackend
+from data.storage.sqlite_storage_backend import SqliteStorageBackend
+from lib.grade import EceswaGrade
+from lib.paths import DatabasePaths
+from lib.typing.data.downloader import DownloadLinks
+
+
+class CsvToSqliteMigration:
+    """
+    One-shot copy of the CSV database into the SQLite backend.
+
+    The CSV files are only read, never modified, so the migration can be
+    re-run safely: rows already present in the SQLite database are ignored.
+    Set `THINKE_STORAGE_BACKEND=sqlite` afterwards to switch over.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self._source = CsvStorageBackend()
+        self._target = SqliteStorageBackend(db_path)
+        self._subjects_dir = DatabasePaths().base_dir / "subjects"
+
+    def run(self) -> Dict[str, int]:
+        """
+        Copy every table from CSV to SQLite.
+
+        Returns:
+            Dict[str, int]: The number of rows written per table.
+        """
+        counts = {
+            "students": self._target.write_students(self._source.get_all_students()),
+            "assigned_schedules": self._target.write_exam_schedule_records(
+                self._source.get_all_exam_schedules()
+            ),
+            "schedule_cursors": self._target.write_schedule_cursors(
+                self._source.get_all_schedule_cursors()
+            ),
+            "sent_msgs": self._target.write_msg_records(self._source.get_all_msg_records()),
+            "downloaded_papers": sum(
+                self._target.write_downloaded_paper_metadata_records(
+                    grade.value,
+                    self._source.get_downloaded_paper_metadata_records(grade.value)
+                )
+                for grade in EceswaGrade
+            ),
+            "past_papers": self._migrate_past_papers(),
+        }
+        return counts
+
+    def _migrate_past_papers(self) -> int:
+        """
+        Copy the raw catalog rows of every subject file.
+
+        Rows are regrouped into the same `DownloadLinks` shape the scrapers
+        produce, so they go through the regular catalog writer.
+
+        Returns:
+            int: The number of catalog rows written.
+        """
+        if not self._subjects_dir.exists():
+            return 0
+
+        urls: DownloadLinks = defaultdict(list)
+
+        for subject_file in sorted(self._subjects_dir.glob("*/*.csv")):
+            with subject_file.open(mode="r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # skip header
+                for row in reader:
+                    if len(row) < 4:
+                        continue
+                    urls[",".join(row[:-1])].append(row[-1])
+
+        return sum(self._target.write_past_paper_urls(urls).values())
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Migrate the CSV database to SQLite.")
+    parser.add_argument("--db", type=Path, default=None, help="Target SQLite file (default: database/thinke.db)")
+    args = parser.parse_args()
+
+    for table, count in CsvToSqliteMigration(args.db).run().items():
+        print(f"{table}: {count}")
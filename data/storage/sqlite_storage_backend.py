@@ -0,0 +1,480 @@
+from collections import defaultdict
+import json
+import os
+from pathlib import Path
+import sqlite3
+import sys
+import threading
+from typing import ContextManager, Dict, Iterable, List, Optional
+import uuid
+
+from data.storage.storage_backend import StorageBackend, StorageBackendType
+from lib.paths import DatabasePaths
+from lib.typing.data.downloader import DownloadLinks
+from lib.typing.domain.schedule import (
+    DownloadedPastPaperMetadata,
+    MsgRecord,
+    PastPaperMetadata,
+    ScheduleCursor,
+    ScheduledPastPaperMetadata,
+    date_ordinal
+)
+from lib.typing.domain.student import Student, StudentRecord
+from lib.utils import LibUtils
+
+
+class SqliteStorageBackend(StorageBackend):
+    """
+    Stores all data in a single SQLite database (./database/thinke.db).
+
+    The database runs in WAL mode so readers never block the writer, and
+    every lookup the readers make is served by an index:
+
+    - assigned_schedules / sent_msgs: (student_id, date)
+    - downloaded_papers: url
+    - past_papers: (grade, subject)
+
+    Each thread gets its own connection, so the backend can be shared by the
+    download workers.
+    """
+
+    BACKEND_TYPE = StorageBackendType.SQLITE
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS students (
+            id TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            grade TEXT NOT NULL,
+            phone TEXT NOT NULL DEFAULT ''
+        );
+        CREATE INDEX IF NOT EXISTS idx_students_grade ON students (grade);
+        CREATE INDEX IF NOT EXISTS idx_students_name_grade ON students (name, grade);
+
+        CREATE TABLE IF NOT EXISTS student_subjects (
+            student_id TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            subject TEXT NOT NULL,
+            PRIMARY KEY (student_id, position)
+        );
+
+        CREATE TABLE IF NOT EXISTS assigned_schedules (
+            student_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            grade TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            paper TEXT NOT NULL,
+            year TEXT NOT NULL,
+            session TEXT NOT NULL,
+            url TEXT NOT NULL,
+            UNIQUE (student_id, date, grade, subject, paper, year, session, url)
+        );
+
+        CREATE TABLE IF NOT EXISTS schedule_cursors (
+            student_id TEXT PRIMARY KEY,
+            last_day TEXT NOT NULL,
+            subject_index INTEGER NOT NULL,
+            council_indices TEXT NOT NULL,
+            reset_days TEXT NOT NULL
+        );
+
+        CREATE TABLE IF NOT EXISTS sent_msgs (
+            student_id TEXT NOT NULL,
+            date TEXT NOT NULL,
+            exam_council TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            session TEXT NOT NULL,
+            attached_url TEXT NOT NULL,
+            UNIQUE (student_id, date, exam_council, subject, session, attached_url)
+        );
+
+        CREATE TABLE IF NOT EXISTS downloaded_papers (
+            ledger_grade TEXT NOT NULL,
+            grade TEXT NOT NULL,
+            subject TEXT NOT NULL,
+            year TEXT NOT NULL,
+            session TEXT NOT NULL,
+            url TEXT NOT NULL,
+            path TEXT NOT NULL,
+            UNIQUE (ledger_grade, grade, subject, year, session, url, path)
+        );
+        CREATE INDEX IF NOT EXISTS idx_downloaded_papers_url ON downloaded_papers (url);
+
+        CREATE TABLE IF NOT EXISTS past_papers (
+            grade TEXT NOT NULL COLLATE NOCASE,
+            subject TEXT NOT NULL COLLATE NOCASE,
+            year TEXT NOT NULL,
+            session TEXT,
+            url TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_past_papers_grade_subject ON past_papers (grade, subject);
+        CREATE UNIQUE INDEX IF NOT EXISTS idx_past_papers_row
+            ON past_papers (grade, subject, year, ifnull(session, ''), url);
+    """
+
+    SCHEDULE_COLUMNS = ["student_id", "date", "grade", "subject", "paper", "year", "session", "url"]
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self._db_path = db_path or DatabasePaths().sqlite_file
+        self._local = threading.local()
+
+        with self._connect() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return this thread's connection, opening it on first use.
+
+        A connection inherited through `fork()` (e.g. by a process pool worker)
+        must not be used by the child, so it is dropped, without being closed,
+        and the child opens its own.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            self._db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._db_path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    # Students
+
+    def _build_students(self, rows: list[tuple]) -> List[Student]:
+        """Attach subjects to (id, name, grade, phone) rows."""
+        if not rows:
+            return []
+
+        conn = self._connect()
+        subjects: dict[str, list[str]] = {row[0]: [] for row in rows}
+        placeholders = ",".join("?" * len(subjects))
+        for student_id, subject in conn.execute(
+            f"SELECT student_id, subject FROM student_subjects "
+            f"WHERE student_id IN ({placeholders}) ORDER BY student_id, position",
+            list(subjects)
+        ):
+            subjects[student_id].append(subject)
+
+        return [
+            Student(id=student_id, name=name, phone=phone, grade=grade, subjects=subjects[student_id])
+            for student_id, name, grade, phone in rows
+        ]
+
+    def get_students_by_grade(self, grade: str) -> List[Student]:
+        rows = self._connect().execute(
+            "SELECT id, name, grade, phone FROM students WHERE grade = ? ORDER BY rowid",
+            (grade,)
+        ).fetchall()
+        return self._build_students(rows)
+
+    def get_student_by_id(self, student_id: str) -> Optional[Student]:
+        rows = self._connect().execute(
+            "SELECT id, name, grade, phone FROM students WHERE id = ?",
+            (student_id,)
+        ).fetchall()
+        students = self._build_students(rows)
+        return students[0] if students else None
+
+    def get_all_students(self) -> List[Student]:
+        rows = self._connect().execute(
+            "SELECT id, name, grade, phone FROM students ORDER BY rowid"
+        ).fetchall()
+        return self._build_students(rows)
+
+    def write_student_record(self, record: StudentRecord) -> str:
+        row = self._connect().execute(
+            "SELECT id FROM students WHERE name = ? AND grade = ? ORDER BY rowid LIMIT 1",
+            (record.name.strip(), record.grade)
+        ).fetchone()
+
+        if row:
+            return row[0]
+
+        student_id = str(uuid.uuid4())
+        self.write_students([Student(
+            id=student_id,
+            name=record.name.strip(),
+            phone=record.phone,
+            grade=record.grade,
+            subjects=record.subjects
+        )])
+        return student_id
+
+    def write_students(self, students: Iterable[Student]) -> int:
+        conn = self._connect()
+        written = 0
+
+        with conn:
+            for student in students:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO students (id, name, grade, phone) VALUES (?, ?, ?, ?)",
+                    (student.id, student.name.strip(), student.grade, student.phone.strip())
+                )
+                if cursor.rowcount:
+                    conn.executemany(
+                        "INSERT INTO student_subjects (student_id, position, subject) VALUES (?, ?, ?)",
+                        [(student.id, i, subject) for i, subject in enumerate(student.subjects)]
+                    )
+                    written += 1
+
+        return written
+
+    # Assigned schedules
+
+    @staticmethod
+    def _intern(value):
+        """Intern repeated strings (grades, subjects, sessions, dates) to share their memory."""
+        return sys.intern(value) if isinstance(value, str) else value
+
+    def _schedule_values(self, record: ScheduledPastPaperMetadata) -> tuple[str, ...]:
+        return tuple(str(getattr(record, column)).strip() for column in self.SCHEDULE_COLUMNS)
+
+    def _build_schedules(self, rows: list[tuple]) -> List[ScheduledPastPaperMetadata]:
+        records = []
+        for row in rows:
+            fields = dict(zip(self.SCHEDULE_COLUMNS, map(self._intern, row)))
+            fields["date_ordinal"] = date_ordinal(fields.pop("date"))
+            records.append(ScheduledPastPaperMetadata(**fields))
+        return records
+
+    def exam_schedule_record_exists(self, record: ScheduledPastPaperMetadata) -> bool:
+        conditions = " AND ".join(f"{column} = ?" for column in self.SCHEDULE_COLUMNS)
+        row = self._connect().execute(
+            f"SELECT 1 FROM assigned_schedules WHERE {conditions} LIMIT 1",
+            self._schedule_values(record)
+        ).fetchone()
+        return row is not None
+
+    def write_exam_schedule_records(self, records: Iterable[ScheduledPastPaperMetadata]) -> int:
+        conn = self._connect()
+        columns = ", ".join(self.SCHEDULE_COLUMNS)
+        placeholders = ", ".join("?" * len(self.SCHEDULE_COLUMNS))
+
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                f"INSERT OR IGNORE INTO assigned_schedules ({columns}) VALUES ({placeholders})",
+                (self._schedule_values(record) for record in records)
+            )
+            return conn.total_changes - before
+
+    def get_exam_schedules_by_id(self, student_id: str) -> List[ScheduledPastPaperMetadata]:
+        rows = self._connect().execute(
+            f"SELECT {', '.join(self.SCHEDULE_COLUMNS)} FROM assigned_schedules "
+            f"WHERE student_id = ? ORDER BY rowid",
+            (student_id.strip(),)
+        ).fetchall()
+        return self._build_schedules(rows)
+
+    def get_exam_schedules_by_id_and_day(self, student_id: str, day: str) -> List[ScheduledPastPaperMetadata]:
+        rows = self._connect().execute(
+            f"SELECT {', '.join(self.SCHEDULE_COLUMNS)} FROM assigned_schedules "
+            f"WHERE student_id = ? AND date = ? ORDER BY rowid",
+            (str(student_id), day)
+        ).fetchall()
+        return self._build_schedules(rows)
+
+    def get_all_exam_schedules(self) -> List[ScheduledPastPaperMetadata]:
+        rows = self._connect().execute(
+            f"SELECT {', '.join(self.SCHEDULE_COLUMNS)} FROM assigned_schedules ORDER BY rowid"
+        ).fetchall()
+        return self._build_schedules(rows)
+
+    def get_exam_schedules_version(self, student_id: str) -> Optional[tuple]:
+        count, max_rowid = self._connect().execute(
+            "SELECT COUNT(*), MAX(rowid) FROM assigned_schedules WHERE student_id = ?",
+            (student_id.strip(),)
+        ).fetchone()
+        return (count, max_rowid) if count else None
+
+    # Schedule cursors
+
+    @staticmethod
+    def _build_schedule_cursor(row: tuple) -> ScheduleCursor:
+        student_id, last_day, subject_index, council_indices, reset_days = row
+        return ScheduleCursor(
+            student_id=student_id,
+            last_day=last_day,
+            subject_index=subject_index,
+            council_indices=json.loads(council_indices),
+            reset_days=json.loads(reset_days)
+        )
+
+    def get_schedule_cursor(self, student_id: str) -> Optional[ScheduleCursor]:
+        row = self._connect().execute(
+            "SELECT student_id, last_day, subject_index, council_indices, reset_days "
+            "FROM schedule_cursors WHERE student_id = ?",
+            (student_id,)
+        ).fetchone()
+        return self._build_schedule_cursor(row) if row else None
+
+    def get_all_schedule_cursors(self) -> List[ScheduleCursor]:
+        rows = self._connect().execute(
+            "SELECT student_id, last_day, subject_index, council_indices, reset_days "
+            "FROM schedule_cursors ORDER BY rowid"
+        ).fetchall()
+        return [self._build_schedule_cursor(row) for row in rows]
+
+    def write_schedule_cursors(self, cursors: Iterable[ScheduleCursor]) -> int:
+        rows = [
+            (
+                cursor.student_id,
+                cursor.last_day,
+                cursor.subject_index,
+                json.dumps(cursor.council_indices),
+                json.dumps(cursor.reset_days)
+            )
+            for cursor in cursors
+        ]
+
+        with self._connect() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO schedule_cursors "
+                "(student_id, last_day, subject_index, council_indices, reset_days) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+        return len(rows)
+
+    # Sent messages
+
+    def msgs_for_id_and_day_exist(self, student_id: str, day: str) -> bool:
+        row = self._connect().execute(
+            "SELECT 1 FROM sent_msgs WHERE student_id = ? AND date = ? LIMIT 1",
+            (student_id, day)
+        ).fetchone()
+        return row is not None
+
+    def write_msg_records(self, records: Iterable[MsgRecord]) -> int:
+        conn = self._connect()
+
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO sent_msgs "
+                "(student_id, date, exam_council, subject, session, attached_url) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (r.student_id, r.date, r.exam_council, r.subject, r.session, r.attached_url)
+                    for r in records
+                )
+            )
+            return conn.total_changes - before
+
+    def get_all_msg_records(self) -> List[MsgRecord]:
+        rows = self._connect().execute(
+            "SELECT student_id, date, exam_council, subject, session, attached_url "
+            "FROM sent_msgs ORDER BY rowid"
+        ).fetchall()
+        return [MsgRecord(*row) for row in rows]
+
+    # Downloaded past papers
+
+    def get_downloaded_paper_metadata_records(self, grade: str) -> List[DownloadedPastPaperMetadata]:
+        rows = self._connect().execute(
+            "SELECT grade, subject, year, session, url, path FROM downloaded_papers "
+            "WHERE ledger_grade = ? ORDER BY rowid",
+            (grade.lower(),)
+        ).fetchall()
+        return [DownloadedPastPaperMetadata(*row) for row in rows]
+
+    def write_downloaded_paper_metadata_records(
+        self,
+        grade: str,
+        records: Iterable[DownloadedPastPaperMetadata]
+    ) -> int:
+        conn = self._connect()
+
+        with conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO downloaded_papers "
+                "(ledger_grade, grade, subject, year, session, url, path) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    (grade.lower(), r.grade, r.subject, str(r.year), r.session, r.url, str(r.path))
+                    for r in records
+                )
+            )
+            return conn.total_changes - before
+
+    def append_downloaded_paper_metadata_records(
+        self,
+        grade: str,
+        records: Iterable[DownloadedPastPaperMetadata]
+    ) -> None:
+        self.write_downloaded_paper_metadata_records(grade, records)
+
+    def get_downloaded_papers_version(self, grade: str) -> Optional[tuple]:
+        count, max_rowid = self._connect().execute(
+            "SELECT COUNT(*), MAX(rowid) FROM downloaded_papers WHERE ledger_grade = ?",
+            (grade.lower(),)
+        ).fetchone()
+        return (count, max_rowid) if count else None
+
+    def lock_downloaded_papers(self, grade: str) -> ContextManager[None]:
+        return LibUtils.file_lock(
+            self._db_path.with_name(f"{self._db_path.name}.downloaded-{grade.lower()}.lock")
+        )
+
+    # Past paper catalog
+
+    def get_subject_metadata(self, grade: str, subject: str) -> List[PastPaperMetadata]:
+        metadata = []
+        rows = self._connect().execute(
+            "SELECT grade, subject, year, session, url FROM past_papers "
+            "WHERE grade = ? AND subject = ? ORDER BY rowid",
+            (grade, subject)
+        )
+
+        for row_grade, row_subject, year, session, url in rows:
+            # Rows catalogued without a session are skipped, as in the CSV reader
+            if session is None:
+                continue
+            try:
+                metadata.append(PastPaperMetadata(
+                    grade=sys.intern(row_grade.strip()),
+                    subject=sys.intern(row_subject.strip()),
+                    year=int(year.strip()),
+                    session=sys.intern(session.strip()),
+                    url=url.strip(),
+                    paper=sys.intern(LibUtils.extract_paper_label(url.strip()))
+                ))
+            except ValueError:
+                continue
+
+        return metadata
+
+    def get_past_paper_sources(self, grade: str) -> Dict[str, tuple]:
+        rows = self._connect().execute(
+            "SELECT subject, COUNT(*), MAX(rowid) FROM past_papers WHERE grade = ? GROUP BY subject",
+            (grade,)
+        )
+        return {subject: (count, max_rowid) for subject, count, max_rowid in rows}
+
+    def write_past_paper_urls(self, urls: DownloadLinks) -> Dict[str, int]:
+        rows_by_target: Dict[str, list[tuple]] = defaultdict(list)
+        for key, url_list in urls.items():
+            parts = key.split(",")
+            if len(parts) < 3:
+                print(f"Skipping malformed key: {key}")
+                continue
+
+            target = f"{parts[0].strip().lower()}/{parts[1].strip().lower()}"
+            session = parts[3] if len(parts) > 3 else None
+            rows_by_target[target].extend((parts[0], parts[1], parts[2], session, url) for url in url_list)
+
+        conn = self._connect()
+        deltas: Dict[str, int] = {}
+
+        with conn:
+            for target, rows in rows_by_target.items():
+                before = conn.total_changes
+                conn.executemany(
+                    "INSERT OR IGNORE INTO past_papers (grade, subject, year, session, url) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                deltas[target] = conn.total_changes - before
+
+        return deltas
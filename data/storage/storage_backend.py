@@ -0,0 +1,225 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import ContextManager, Dict, Iterable, List, Optional
+
+from lib.typing.data.downloader import DownloadLinks
+from lib.typing.domain.schedule import (
+    DownloadedPastPaperMetadata,
+    MsgRecord,
+    PastPaperMetadata,
+    ScheduleCursor,
+    ScheduledPastPaperMetadata
+)
+from lib.typing.domain.student import Student, StudentRecord
+
+
+class StorageBackendType(Enum):
+    """
+    Lists the supported storage backends.
+    """
+    CSV = "csv"
+    SQLITE = "sqlite"
+
+
+class StorageBackend(ABC):
+    """
+    Storage interface behind the data/ readers and writers.
+
+    The readers and writers keep their public methods and delegate the
+    actual persistence to a backend, so the storage format can be switched
+    without touching the scheduler or the orchestrator.
+
+    Grades are passed as their enum values (e.g. 'EGCSE'); backends are
+    responsible for any normalisation they need.
+    """
+
+    BACKEND_TYPE: StorageBackendType
+
+    # Students
+
+    @abstractmethod
+    def get_students_by_grade(self, grade: str) -> List[Student]:
+        """Return all students registered under the given grade."""
+
+    @abstractmethod
+    def get_student_by_id(self, student_id: str) -> Optional[Student]:
+        """Return the student with the given ID, or None."""
+
+    @abstractmethod
+    def get_all_students(self) -> List[Student]:
+        """Return every stored student."""
+
+    @abstractmethod
+    def write_student_record(self, record: StudentRecord) -> str:
+        """
+        Store a student record, reusing the ID of an existing student with
+        the same name and grade.
+
+        Returns:
+            str: The student's ID.
+        """
+
+    @abstractmethod
+    def write_students(self, students: Iterable[Student]) -> int:
+        """
+        Store fully identified students, skipping IDs that already exist.
+
+        Returns:
+            int: The number of students written.
+        """
+
+    # Assigned schedules
+
+    @abstractmethod
+    def exam_schedule_record_exists(self, record: ScheduledPastPaperMetadata) -> bool:
+        """Return True if an identical schedule record is stored."""
+
+    @abstractmethod
+    def write_exam_schedule_records(self, records: Iterable[ScheduledPastPaperMetadata]) -> int:
+        """
+        Store schedule records, dropping exact duplicates.
+
+        Returns:
+            int: The number of records written.
+        """
+
+    @abstractmethod
+    def get_exam_schedules_by_id(self, student_id: str) -> List[ScheduledPastPaperMetadata]:
+        """Return all schedule records of a student."""
+
+    @abstractmethod
+    def get_exam_schedules_by_id_and_day(self, student_id: str, day: str) -> List[ScheduledPastPaperMetadata]:
+        """Return a student's schedule records for one 'dd-mm-yy' day."""
+
+    @abstractmethod
+    def get_all_exam_schedules(self) -> List[ScheduledPastPaperMetadata]:
+        """Return every stored schedule record."""
+
+    @abstractmethod
+    def get_exam_schedules_version(self, student_id: str) -> Optional[tuple]:
+        """
+        Return a change signature of a student's schedule records.
+
+        Returns:
+            Optional[tuple]: A value that changes whenever the student's records
+                change, or None if the student has no records.
+        """
+
+    # Schedule cursors
+
+    @abstractmethod
+    def get_schedule_cursor(self, student_id: str) -> Optional[ScheduleCursor]:
+        """Return where the student's rolling-window schedule stopped, or None."""
+
+    @abstractmethod
+    def get_all_schedule_cursors(self) -> List[ScheduleCursor]:
+        """Return every stored schedule cursor."""
+
+    @abstractmethod
+    def write_schedule_cursors(self, cursors: Iterable[ScheduleCursor]) -> int:
+        """
+        Store schedule cursors, replacing any earlier cursor of the same student.
+
+        Returns:
+            int: The number of cursors written.
+        """
+
+    # Sent messages
+
+    @abstractmethod
+    def msgs_for_id_and_day_exist(self, student_id: str, day: str) -> bool:
+        """Return True if messages were sent to the student on the given day."""
+
+    @abstractmethod
+    def write_msg_records(self, records: Iterable[MsgRecord]) -> int:
+        """
+        Store sent message records, dropping exact duplicates.
+
+        Returns:
+            int: The number of records written.
+        """
+
+    @abstractmethod
+    def get_all_msg_records(self) -> List[MsgRecord]:
+        """Return every stored message record."""
+
+    # Downloaded past papers
+
+    @abstractmethod
+    def get_downloaded_paper_metadata_records(self, grade: str) -> List[DownloadedPastPaperMetadata]:
+        """Return the papers downloaded for students of the given grade."""
+
+    @abstractmethod
+    def write_downloaded_paper_metadata_records(
+        self,
+        grade: str,
+        records: Iterable[DownloadedPastPaperMetadata]
+    ) -> int:
+        """
+        Store downloaded paper records for students of the given grade,
+        dropping exact duplicates.
+
+        Returns:
+            int: The number of records written.
+        """
+
+    @abstractmethod
+    def append_downloaded_paper_metadata_records(
+        self,
+        grade: str,
+        records: Iterable[DownloadedPastPaperMetadata]
+    ) -> None:
+        """
+        Append downloaded paper records without checking for duplicates.
+
+        Used by callers that already deduplicate in memory, such as the
+        downloaded paper ledger.
+        """
+
+    @abstractmethod
+    def get_downloaded_papers_version(self, grade: str) -> Optional[tuple]:
+        """
+        Return a change signature of the downloaded paper records of a grade.
+
+        Returns:
+            Optional[tuple]: A value that changes whenever records are added for
+                the grade, or None if it has no records.
+        """
+
+    @abstractmethod
+    def lock_downloaded_papers(self, grade: str) -> ContextManager[None]:
+        """
+        Hold an exclusive lock, shared with other processes, on the downloaded
+        paper records of a grade, so a check and the append it guards are atomic.
+        """
+
+    # Past paper catalog
+
+    @abstractmethod
+    def get_subject_metadata(self, grade: str, subject: str) -> List[PastPaperMetadata]:
+        """Return the catalogued past papers of a subject for a grade."""
+
+    @abstractmethod
+    def get_past_paper_sources(self, grade: str) -> Dict[str, tuple]:
+        """
+        Return a change signature for every catalogued subject of a grade.
+
+        Returns:
+            Dict[str, tuple]: Maps each subject's source name (as accepted by
+                `get_subject_metadata`) to a value that changes whenever that
+                subject's catalog rows change.
+        """
+
+    @abstractmethod
+    def write_past_paper_urls(self, urls: DownloadLinks) -> Dict[str, int]:
+        """
+        Store catalogued past paper URLs, dropping exact duplicates.
+
+        Args:
+            urls (DownloadLinks): Maps comma-separated metadata keys
+                (e.g. "IGCSE,Mathematics,2023,November") to download URLs.
+
+        Returns:
+            Dict[str, int]: The number of new rows written per target
+                (subject file or grade/subject pair).
+        """
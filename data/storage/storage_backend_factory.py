@@ -0,0 +1,44 @@
+import threading
+from typing import Dict, Optional
+
+from data.storage.csv_storage_backend import CsvStorageBackend
+from data.storage.sqlite_storage_backend import SqliteStorageBackend
+from data.storage.storage_backend import StorageBackend, StorageBackendType
+from lib.constants import STORAGE_BACKEND
+
+
+class StorageBackendFactory:
+    """
+    Creates and shares the storage backend used by the data/ readers and writers.
+
+    The backend is chosen by `STORAGE_BACKEND` (set through the
+    `THINKE_STORAGE_BACKEND` environment variable) unless a type is given
+    explicitly. One instance per type is kept for the whole process.
+    """
+
+    _backends: Dict[StorageBackendType, StorageBackend] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, backend_type: Optional[StorageBackendType] = None) -> StorageBackend:
+        """
+        Return the shared backend of the given type.
+
+        Args:
+            backend_type (StorageBackendType, optional): The backend to use.
+                Defaults to the configured `STORAGE_BACKEND`.
+
+        Returns:
+            StorageBackend: The process-wide backend instance.
+        """
+        backend_type = backend_type or StorageBackendType(STORAGE_BACKEND.lower())
+
+        with cls._lock:
+            backend = cls._backends.get(backend_type)
+            if backend is None:
+                if backend_type == StorageBackendType.SQLITE:
+                    backend = SqliteStorageBackend()
+                else:
+                    backend = CsvStorageBackend()
+                cls._backends[backend_type] = backend
+            return backend
@@ -0,0 +1,223 @@
+import csv
+from collections import defaultdict
+import os
+from pathlib import Path
+import re
+import sys
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from data.students.schedule_record_index import ScheduleRecordIndex
+from lib.paths import StudentCSVPaths
+from lib.shared_instance import SharedInstance
+from lib.typing.domain.schedule import ScheduledPastPaperMetadata, date_ordinal
+
+
+class PartitionedScheduleStore(SharedInstance):
+    """
+    Assigned schedules split into one segment file per student, listed in a `manifest.csv`;
+    a legacy single-file `assigned_schedules.csv` is split on first use.
+    """
+
+    MANIFEST_FIELDNAMES = ["student_id", "segment", "rows"]
+
+    def __init__(self, paths: StudentCSVPaths, fieldnames: list[str]):
+        self._paths = paths
+        self._fieldnames = fieldnames
+        self._lock = threading.RLock()
+        self._manifest_signature: Optional[tuple[int, int]] = None
+        self._manifest: Dict[str, tuple[str, int]] = {}
+        self._migrated = False
+
+    @classmethod
+    def instance(cls, paths: StudentCSVPaths, fieldnames: list[str]) -> "PartitionedScheduleStore":
+        """Return the shared store of the student files' directory, creating it on first use."""
+        return cls._shared(paths.base_dir, lambda: cls(paths, fieldnames))
+
+    def student_ids(self) -> List[str]:
+        """Return the IDs of all students that have a segment."""
+        with self._lock:
+            self._refresh_manifest()
+            return list(self._manifest)
+
+    def segment_path(self, student_id: str) -> Optional[Path]:
+        """Return the segment file of a student, or None if they have no rows."""
+        with self._lock:
+            self._refresh_manifest()
+            entry = self._manifest.get(student_id.strip())
+            return self._paths.assigned_schedules_dir / entry[0] if entry else None
+
+    def segment_signature(self, student_id: str) -> Optional[tuple[int, int]]:
+        """Return the (mtime, size) signature of a student's segment, or None if it has no rows."""
+        path = self.segment_path(student_id)
+        try:
+            stat = path.stat() if path else None
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size) if stat else None
+
+    def contains(self, record: ScheduledPastPaperMetadata) -> bool:
+        """Return True if an identical record is stored in the student's segment."""
+        path = self.segment_path(str(record.student_id))
+        return path is not None and self._index(path).contains(record)
+
+    def read(self, student_id: str) -> Iterator[ScheduledPastPaperMetadata]:
+        """Stream every record of one student's segment."""
+        path = self.segment_path(student_id)
+        if path is None or not path.exists():
+            return
+
+        with path.open(mode='r', newline='', encoding='utf-8') as file:
+            reader = csv.DictReader(file, fieldnames=self._fieldnames)
+            next(reader, None)
+
+            for row in reader:
+                try:
+                    yield ScheduledPastPaperMetadata(
+                        student_id=row["student_id"],
+                        date_ordinal=date_ordinal(row["date"]),
+                        grade=sys.intern(row["grade"]),
+                        subject=sys.intern(row["subject"]),
+                        year=sys.intern(row["year"]),
+                        session=sys.intern(row["session"]),
+                        url=row["url"],
+                        paper=row["paper"]
+                    )
+                except Exception as e:
+                    print(f"[PartitionedScheduleStore] Skipping row due to error: {e}")
+
+    def read_all(self) -> Iterator[ScheduledPastPaperMetadata]:
+        """Stream the records of every segment, one student after the other."""
+        for student_id in self.student_ids():
+            yield from self.read(student_id)
+
+    def append(self, records: Iterable[ScheduledPastPaperMetadata]) -> int:
+        """
+        Append records to their students' segments, dropping exact duplicates.
+
+        Records are grouped by student so each touched segment gets a single
+        buffered append, and the manifest is rewritten once per batch.
+
+        Returns:
+            int: The number of records written.
+        """
+        by_student: Dict[str, list[ScheduledPastPaperMetadata]] = defaultdict(list)
+        for record in records:
+            by_student[str(record.student_id).strip()].append(record)
+
+        if not by_student:
+            return 0
+
+        written = 0
+
+        with self._lock:
+            self._refresh_manifest()
+            self._paths.assigned_schedules_dir.mkdir(parents=True, exist_ok=True)
+
+            for student_id, student_records in by_student.items():
+                segment, row_count = self._manifest.get(student_id, (self._segment_name(student_id), 0))
+                path = self._paths.assigned_schedules_dir / segment
+                index = self._index(path)
+
+                with index.lock:
+                    new_records = index.filter_new(student_records)
+                    if not new_records:
+                        continue
+
+                    write_header = not path.exists() or path.stat().st_size == 0
+                    with path.open("a", newline="", encoding="utf-8") as f:
+                        writer = csv.writer(f)
+                        if write_header:
+                            writer.writerow(self._fieldnames)
+                        writer.writerows(
+                            [getattr(record, key) for key in self._fieldnames]
+                            for record in new_records
+                        )
+                    index.mark_written(new_records)
+
+                self._manifest[student_id] = (segment, row_count + len(new_records))
+                written += len(new_records)
+
+            if written:
+                self._write_manifest()
+
+        return written
+
+    def _index(self, path: Path) -> ScheduleRecordIndex:
+        return ScheduleRecordIndex.instance(path, self._fieldnames)
+
+    @staticmethod
+    def _segment_name(student_id: str) -> str:
+        """Build a filesystem-safe segment filename for a student ID."""
+        return re.sub(r'[^A-Za-z0-9_-]', '_', student_id) + ".csv"
+
+    def _manifest_current_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self._paths.assigned_schedules_manifest_file.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
+    def _refresh_manifest(self) -> None:
+        """Load the manifest, splitting the legacy file first if needed."""
+        if not self._migrated:
+            self._migrated = True
+            self._migrate_legacy_file()
+
+        signature = self._manifest_current_signature()
+        if signature == self._manifest_signature:
+            return
+
+        manifest: Dict[str, tuple[str, int]] = {}
+        if signature is not None:
+            with self._paths.assigned_schedules_manifest_file.open("r", newline="", encoding="utf-8") as f:
+                for row in csv.DictReader(f):
+                    manifest[row["student_id"]] = (row["segment"], int(row["rows"] or 0))
+
+        self._manifest = manifest
+        self._manifest_signature = signature
+
+    def _write_manifest(self) -> None:
+        """Atomically rewrite the manifest from the in-memory copy."""
+        manifest_file = self._paths.assigned_schedules_manifest_file
+        tmp_file = manifest_file.with_suffix(".tmp")
+
+        with tmp_file.open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(self.MANIFEST_FIELDNAMES)
+            writer.writerows(
+                [student_id, segment, rows]
+                for student_id, (segment, rows) in self._manifest.items()
+            )
+
+        os.replace(tmp_file, manifest_file)
+        self._manifest_signature = self._manifest_current_signature()
+
+    def _migrate_legacy_file(self) -> None:
+        """Split a legacy single-file schedule store into per-student segments."""
+        legacy_file = self._paths.assigned_schedules_file
+        if not legacy_file.exists() or self._paths.assigned_schedules_manifest_file.exists():
+            return
+
+        by_student: Dict[str, list[list[str]]] = defaultdict(list)
+        with legacy_file.open("r", newline="", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # skip header
+            for row in reader:
+                if len(row) == len(self._fieldnames):
+                    by_student[row[0].strip()].append(row)
+
+        self._paths.assigned_schedules_dir.mkdir(parents=True, exist_ok=True)
+        manifest: Dict[str, tuple[str, int]] = {}
+
+        for student_id, rows in by_student.items():
+            segment = self._segment_name(student_id)
+            with (self._paths.assigned_schedules_dir / segment).open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(self._fieldnames)
+                writer.writerows(rows)
+            manifest[student_id] = (segment, len(rows))
+
+        self._manifest = manifest
+        self._write_manifest()
+        os.replace(legacy_file, legacy_file.with_name("assigned_schedules.legacy.csv"))
@@ -0,0 +1,101 @@
+import csv
+from pathlib import Path
+import threading
+from typing import Iterable, Optional
+
+from lib.shared_instance import SharedInstance
+from lib.typing.domain.schedule import ScheduledPastPaperMetadata
+
+
+ScheduleRowKey = tuple[str, ...]
+
+
+class ScheduleRecordIndex(SharedInstance):
+    """
+    Process-wide set of the rows in `assigned_schedules.csv`, reloaded when the file changes.
+    """
+
+    def __init__(self, path: Path, fieldnames: list[str]):
+        self._path = path
+        self._fieldnames = fieldnames
+        self._lock = threading.RLock()
+        self._signature: Optional[tuple[int, int]] = None
+        self._keys: set[ScheduleRowKey] = set()
+
+    @classmethod
+    def instance(cls, path: Path, fieldnames: list[str]) -> "ScheduleRecordIndex":
+        """Return the shared index of a schedule file, loading it on first use."""
+        return cls._shared(path, lambda: cls(path, fieldnames))
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock that callers hold while checking and appending a batch."""
+        return self._lock
+
+    def key(self, record: ScheduledPastPaperMetadata) -> ScheduleRowKey:
+        """Build the hashable row key of a schedule record."""
+        return tuple(str(getattr(record, name)).strip() for name in self._fieldnames)
+
+    def contains(self, record: ScheduledPastPaperMetadata) -> bool:
+        """Return True if an identical record is already stored."""
+        with self._lock:
+            self._refresh()
+            return self.key(record) in self._keys
+
+    def filter_new(self, records: Iterable[ScheduledPastPaperMetadata]) -> list[ScheduledPastPaperMetadata]:
+        """
+        Drop records that are already stored or repeated within the batch.
+
+        Args:
+            records (Iterable[ScheduledPastPaperMetadata]): Candidate records.
+
+        Returns:
+            list[ScheduledPastPaperMetadata]: Records not yet present, in input order.
+        """
+        with self._lock:
+            self._refresh()
+            seen: set[ScheduleRowKey] = set()
+            new_records = []
+            for record in records:
+                key = self.key(record)
+                if key in self._keys or key in seen:
+                    continue
+                seen.add(key)
+                new_records.append(record)
+            return new_records
+
+    def mark_written(self, records: Iterable[ScheduledPastPaperMetadata]) -> None:
+        """
+        Register records that were just appended to the file.
+
+        The signature is refreshed too, so the index's own writes do not
+        trigger a reload on the next lookup.
+        """
+        with self._lock:
+            self._keys.update(self.key(record) for record in records)
+            self._signature = self._current_signature()
+
+    def _current_signature(self) -> Optional[tuple[int, int]]:
+        try:
+            stat = self._path.stat()
+            return stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            return None
+
+    def _refresh(self) -> None:
+        """Reload the keys if the file changed since it was last indexed."""
+        signature = self._current_signature()
+        if signature == self._signature:
+            return
+
+        keys: set[ScheduleRowKey] = set()
+        if signature is not None:
+            with self._path.open("r", newline="", encoding="utf-8") as f:
+                reader = csv.reader(f)
+                next(reader, None)  # skip header
+                for row in reader:
+                    if len(row) == len(self._fieldnames):
+                        keys.add(tuple(value.strip() for value in row))
+
+        self._keys = keys
+        self._signature = signature
@@ -1,7 +1,8 @@
-
+from data.storage.storage_backend_factory import StorageBackendFactory
 from lib.paths import StudentCSVPaths
 
 class StudentData:
     def __init__(self):
         self._paths = StudentCSVPaths()
         self._exam_schedule_record_fieldnames = ["student_id", "date", "grade", "subject", "paper", "year", "session", "url"]
+        self._backend = StorageBackendFactory.get()
@@ -1,17 +1,13 @@
-import csv
-from dataclasses import asdict
-import os
-from pathlib import Path
-import uuid
+from typing import Iterable
 
 from data.students.student_data import StudentData
 from data.students.student_data_reader import StudentDataReader
-from lib.typing.domain.schedule import MsgRecord, ScheduledPastPaperMetadata
+from lib.typing.domain.schedule import MsgRecord, ScheduleCursor, ScheduledPastPaperMetadata
 from lib.typing.domain.student import StudentRecord
 
 class StudentDataWriter(StudentData):
     """
-    Handles the storage of student records into structured CSV files.
+    Handles the storage of student records through the configured storage backend.
     """
 
     def __init__(self):
@@ -20,95 +16,14 @@ class StudentDataWriter(StudentData):
 
     def write_student_record(self, record: StudentRecord) -> bool:
         """
-        Write the student record to the appropriate CSV files.
+        Write the student record, reusing the ID of an existing student
+        with the same name and grade.
 
         Returns:
             bool: True if the record was saved successfully, False otherwise.
         """
-
-        def ensure_file(path: Path):
-            """Ensure file exists with proper headers."""
-            if not path.exists() or path.stat().st_size == 0:
-                with path.open("w", newline='', encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    if path == self._paths.info_file:
-                        writer.writerow(["id", "name", "grade"])
-                    elif path == self._paths.subjects_file:
-                        headers = ["id"] + [f"subject{i+1}" for i in range(len(record.subjects))]
-                        writer.writerow(headers)
-                    elif path == self._paths.contacts_file:
-                        writer.writerow(["id", "phone"])
-
-        def get_or_create_student_info(info_file: Path) -> str:
-            """
-            Retrieve or create student ID based on name + grade match.
-
-            Returns:
-                str: UUID string as the student ID.
-            """
-            student_id = None
-
-            with info_file.open("r", newline='', encoding="utf-8") as f:
-                reader = csv.reader(f)
-                next(reader, None)  # skip header
-                for row in reader:
-                    if (
-                        len(row) >= 3 and
-                        row[1].strip() == record.name.strip() and
-                        row[2].strip() == record.grade
-                    ):
-                        student_id = row[0]  # ID is already a string
-                        break
-
-            if student_id is None:
-                student_id = str(uuid.uuid4())
-                with info_file.open("a", newline='', encoding="utf-8") as f:
-                    writer = csv.writer(f)
-                    writer.writerow([
-                        student_id,
-                        record.name.strip(),
-                        record.grade
-                    ])
-
-            return student_id
-
-        def write_subjects_if_missing(subjects_file: Path, student_id: str):
-            """Write subjects only if not already present."""
-            with subjects_file.open("r", newline='', encoding="utf-8") as f:
-                reader = csv.reader(f)
-                next(reader, None)
-                for row in reader:
-                    if row and row[0] == student_id:
-                        return
-
-            with subjects_file.open("a", newline='', encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([student_id] + record.subjects)
-
-        def write_contact_if_missing(contacts_file: Path, student_id: str):
-            """Write contact if not already present."""
-            with contacts_file.open("r", newline='', encoding="utf-8") as f:
-                reader = csv.reader(f)
-                next(reader, None)
-                for row in reader:
-                    if row and row[0] == student_id:
-                        return
-
-            with contacts_file.open("a", newline='', encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([student_id, record.phone.strip()])
-
         try:
-            self._paths.base_dir.mkdir(parents=True, exist_ok=True)
-
-            ensure_file(self._paths.info_file)
-            ensure_file(self._paths.subjects_file)
-            ensure_file(self._paths.contacts_file)
-
-            student_id = get_or_create_student_info(self._paths.info_file)
-            write_subjects_if_missing(self._paths.subjects_file, student_id)
-            write_contact_if_missing(self._paths.contacts_file, student_id)
-
+            self._backend.write_student_record(record)
             return True
 
         except Exception as err:
@@ -116,57 +31,58 @@ class StudentDataWriter(StudentData):
             return False
 
     def write_exam_schedule_record(self, record: ScheduledPastPaperMetadata) -> bool:
-        fieldnames = self._exam_schedule_record_fieldnames
+        """
+        Append a single schedule record unless an identical one is already stored.
+
+        Returns:
+            bool: True if the record was written, False if it was a duplicate or failed.
+        """
+        return self.write_exam_schedule_records([record]) == 1
+
+    def write_exam_schedule_records(
+        self,
+        records: Iterable[ScheduledPastPaperMetadata],
+        strict: bool = False
+    ) -> int:
+        """
+        Append a batch of schedule records in one write.
 
-        def ensure_file(path: Path):
-            if not path.exists() or path.stat().st_size == 0:
-                with path.open("w", newline="", encoding="utf-8") as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
+        Duplicates, whether already stored or repeated within the batch, are dropped.
 
-        file_path = self._paths.assigned_schedules_file
+        Args:
+            records (Iterable[ScheduledPastPaperMetadata]): The records to store.
+            strict (bool): Raise storage errors instead of reporting them and
+                returning 0, for callers whose next write depends on this one.
 
+        Returns:
+            int: The number of records actually written.
+        """
         try:
-            ensure_file(file_path)
-            new_row = {key: asdict(record)[key] for key in fieldnames}
-        
-            if self._reader.exam_schedule_record_exists(record):
-                return False
+            return self._backend.write_exam_schedule_records(records)
+
+        except Exception as e:
+            if strict:
+                raise
+            print(f"Failed to write schedule records: {e}")
+            return 0
 
-            # Append new row
-            with file_path.open("a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writerow(new_row)
+    def write_schedule_cursors(self, cursors: Iterable[ScheduleCursor]) -> int:
+        """
+        Store where the students' rolling-window schedules stopped.
 
-            return True
+        Args:
+            cursors (Iterable[ScheduleCursor]): One cursor per student; replaces
+                any earlier cursor of that student.
+
+        Returns:
+            int: The number of cursors written.
+        """
+        try:
+            return self._backend.write_schedule_cursors(cursors)
 
         except Exception as e:
-            print(f"Failed to write schedule record: {e}")
-            return False
+            print(f"Failed to write schedule cursors: {e}")
+            return 0
 
     def write_msg_record(self, record: MsgRecord) -> bool:
-        file_path = self._paths.sent_msgs_file
-        headers = list(MsgRecord.__annotations__.keys())
-        record_dict = asdict(record)
-
-        # Ensure the file exists with headers
-        file_exists = os.path.exists(file_path)
-        
-        if not file_exists:
-            with open(file_path, mode='w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=headers)
-                writer.writeheader()
-
-        # Check if record already exists
-        with open(file_path, mode='r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                if all(row[key] == record_dict[key] for key in headers):
-                    return False  # Duplicate found
-
-        # Write the new record
-        with open(file_path, mode='a', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writerow(record_dict)
-
-        return True
\ No newline at end of file
+        return self._backend.write_msg_records([record]) == 1
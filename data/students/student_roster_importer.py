@@ -0,0 +1,197 @@
+import argparse
+import csv
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+import uuid
+from xml.etree import ElementTree
+import zipfile
+
+from data.storage.storage_backend_factory import StorageBackendFactory
+from lib.grade import EceswaGrade
+from lib.typing.domain.student import Student, StudentRecord
+
+
+class StudentRosterImporter:
+    """
+    Bulk import of a school roster into the student database.
+
+    The roster is an ODS or CSV sheet whose first row is a header and whose
+    columns are, in order: name, phone, grade and one column per subject.
+    Rows are streamed, checked against a single in-memory (name, grade)
+    index of the stored students and of the rows already accepted, and all
+    new students are written in one batch.
+    """
+
+    SUPPORTED_SUFFIXES = (".ods", ".csv")
+
+    # OpenDocument namespaces of the elements read from an ODS roster
+    ODF_TABLE = "{urn:oasis:names:tc:opendocument:xmlns:table:1.0}"
+    ODF_OFFICE = "{urn:oasis:names:tc:opendocument:xmlns:office:1.0}"
+    ODF_TEXT = "{urn:oasis:names:tc:opendocument:xmlns:text:1.0}"
+    ODF_NUMERIC_TYPES = frozenset({"float", "percentage", "currency"})
+
+    def __init__(self):
+        self._backend = StorageBackendFactory.get()
+        self._grades = {grade.value.lower(): grade.value for grade in EceswaGrade}
+
+    def import_file(self, path: Path) -> Dict[str, int]:
+        """
+        Import every student of a roster file.
+
+        Args:
+            path (Path): The roster, an .ods or .csv file.
+
+        Returns:
+            Dict[str, int]: The number of 'imported', 'duplicate' and 'invalid' rows.
+
+        Raises:
+            ValueError: If the file type is not supported.
+        """
+        return self.import_records(self._read_records(Path(path)))
+
+    def import_records(self, records: Iterator[Optional[StudentRecord]]) -> Dict[str, int]:
+        """
+        Import a stream of student records.
+
+        Args:
+            records (Iterator[Optional[StudentRecord]]): The records to import;
+                None marks a row that could not be parsed.
+
+        Returns:
+            Dict[str, int]: The number of 'imported', 'duplicate' and 'invalid' rows.
+        """
+        known = {
+            (student.name.strip(), student.grade)
+            for student in self._backend.get_all_students()
+        }
+        new_students: List[Student] = []
+        counts = {"imported": 0, "duplicate": 0, "invalid": 0}
+
+        for record in records:
+            if record is None:
+                counts["invalid"] += 1
+                continue
+
+            key = (record.name, record.grade)
+            if key in known:
+                counts["duplicate"] += 1
+                continue
+
+            known.add(key)
+            new_students.append(Student(
+                id=str(uuid.uuid4()),
+                name=record.name,
+                phone=record.phone,
+                grade=record.grade,
+                subjects=record.subjects
+            ))
+
+        if new_students:
+            counts["imported"] = self._backend.write_students(new_students)
+
+        return counts
+
+    def _read_records(self, path: Path) -> Iterator[Optional[StudentRecord]]:
+        """Yield a parsed record (or None) for every data row of the roster."""
+        suffix = path.suffix.lower()
+
+        if suffix == ".csv":
+            rows = self._read_csv_rows(path)
+        elif suffix == ".ods":
+            rows = self._read_ods_rows(path)
+        else:
+            raise ValueError(
+                f"Unsupported roster type '{path.suffix}', expected one of {self.SUPPORTED_SUFFIXES}"
+            )
+
+        next(rows, None)  # skip header
+        for row in rows:
+            cells = [str(cell).strip() for cell in row]
+            if any(cells):
+                yield self._parse_row(cells)
+
+    @staticmethod
+    def _read_csv_rows(path: Path) -> Iterator[list]:
+        """Stream the rows of a CSV roster."""
+        with path.open("r", newline='', encoding="utf-8") as f:
+            yield from csv.reader(f)
+
+    @classmethod
+    def _read_ods_rows(cls, path: Path) -> Iterator[list]:
+        """
+        Stream the rows of the first sheet of an ODS roster.
+
+        The sheet's `content.xml` is parsed incrementally and each row is
+        dropped from the tree once yielded, so memory does not grow with
+        the roster.
+        """
+        table_tag, row_tag = f"{cls.ODF_TABLE}table", f"{cls.ODF_TABLE}table-row"
+        parents = []
+
+        with zipfile.ZipFile(path) as archive, archive.open("content.xml") as content:
+            for event, element in ElementTree.iterparse(content, events=("start", "end")):
+                if event == "start":
+                    parents.append(element)
+                    continue
+
+                parents.pop()
+                if element.tag == table_tag:
+                    return
+
+                if element.tag == row_tag:
+                    cells = cls._read_ods_cells(element)
+                    # Blank rows are often stored once with a huge repeat count
+                    repeat = int(element.get(f"{cls.ODF_TABLE}number-rows-repeated", 1)) if cells else 1
+                    for _ in range(repeat):
+                        yield list(cells)
+                    parents[-1].remove(element)
+
+    @classmethod
+    def _read_ods_cells(cls, row: ElementTree.Element) -> List[str]:
+        """Return the cell values of an ODS row, without its trailing blank cells."""
+        cells: List[str] = []
+        blanks = 0
+
+        for cell in row:
+            if cell.get(f"{cls.ODF_OFFICE}value-type") in cls.ODF_NUMERIC_TYPES:
+                value = cell.get(f"{cls.ODF_OFFICE}value", "")
+            else:
+                value = "\n".join("".join(p.itertext()) for p in cell.iter(f"{cls.ODF_TEXT}p"))
+            repeat = int(cell.get(f"{cls.ODF_TABLE}number-columns-repeated", 1))
+
+            # Blank cells are only expanded once a value follows them
+            if not value:
+                blanks += repeat
+                continue
+
+            cells.extend([""] * blanks)
+            cells.extend([value] * repeat)
+            blanks = 0
+
+        return cells
+
+    def _parse_row(self, cells: List[str]) -> Optional[StudentRecord]:
+        """Turn a roster row into a student record, or None if it is invalid."""
+        if len(cells) < 4:
+            return None
+
+        name, phone, grade = cells[0], cells[1], self._grades.get(cells[2].lower())
+        subjects = [subject for subject in cells[3:] if subject]
+
+        if not name or grade is None or not subjects:
+            return None
+
+        # Spreadsheets tend to turn phone numbers into floats
+        if phone.endswith(".0"):
+            phone = phone[:-2]
+
+        return StudentRecord(name=name, phone=phone, grade=grade, subjects=subjects)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import a student roster (.ods or .csv).")
+    parser.add_argument("roster", type=Path, help="Roster with name, phone, grade and subject columns")
+    args = parser.parse_args()
+
+    for outcome, count in StudentRosterImporter().import_file(args.roster).items():
+        print(f"{outcome}: {count}")
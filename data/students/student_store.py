@@ -0,0 +1,188 @@
+import csv
+from dataclasses import replace
+from pathlib import Path
+import threading
+from typing import AbstractSet, Dict, List, Optional, Set, Tuple
+
+from lib.paths import StudentCSVPaths
+from lib.shared_instance import SharedInstance
+from lib.typing.domain.student import Student
+
+
+class StudentStore(SharedInstance):
+    """
+    Process-wide index of the student CSV files, reloaded when any of them changes.
+    """
+
+    def __init__(self, paths: StudentCSVPaths):
+        self._paths = paths
+        self._lock = threading.RLock()
+        self._signature: Optional[tuple] = None
+
+        self._students_by_id: Dict[str, Student] = {}
+        self._ids_by_grade: Dict[str, List[str]] = {}
+        self._ids_by_name_and_grade: Dict[tuple[str, str], str] = {}
+        self._ids_with_subjects: Set[str] = set()
+        self._ids_with_contact: Set[str] = set()
+
+    @classmethod
+    def instance(cls, paths: Optional[StudentCSVPaths] = None) -> "StudentStore":
+        """Return the shared store of the student files, loading it on first use."""
+        paths = paths or StudentCSVPaths()
+        return cls._shared(paths.base_dir, lambda: cls(paths))
+
+    def invalidate(self) -> None:
+        """Drop the loaded indexes so the next lookup reloads from disk."""
+        with self._lock:
+            self._signature = None
+
+    def get_students_by_grade(self, grade: str) -> list[Student]:
+        """
+        Retrieve all students registered under the given grade.
+
+        Args:
+            grade (str): The grade value, e.g. 'EGCSE'.
+
+        Returns:
+            list[Student]: Students in file order, or [] if none match.
+        """
+        with self._lock:
+            self._refresh()
+            return [
+                self._copy(self._students_by_id[student_id])
+                for student_id in self._ids_by_grade.get(grade, [])
+            ]
+
+    def get_all_students(self) -> list[Student]:
+        """
+        Retrieve every stored student.
+
+        Returns:
+            list[Student]: All students in file order.
+        """
+        with self._lock:
+            self._refresh()
+            return [self._copy(student) for student in self._students_by_id.values()]
+
+    def get_student_by_id(self, student_id: str) -> Optional[Student]:
+        """
+        Retrieve a single student by ID.
+
+        Args:
+            student_id (str): The student's ID.
+
+        Returns:
+            Optional[Student]: The student, or None if the ID is unknown.
+        """
+        with self._lock:
+            self._refresh()
+            student = self._students_by_id.get(student_id)
+            return self._copy(student) if student else None
+
+    def find_student_id(self, name: str, grade: str) -> Optional[str]:
+        """
+        Look up a student's ID by name and grade.
+
+        Args:
+            name (str): The student's name.
+            grade (str): The student's grade value.
+
+        Returns:
+            Optional[str]: The matching ID, or None if no student matches.
+        """
+        with self._lock:
+            self._refresh()
+            return self._ids_by_name_and_grade.get((name.strip(), grade))
+
+    def stored_ids(self) -> Tuple[AbstractSet[str], AbstractSet[str], AbstractSet[str]]:
+        """
+        Return the IDs that have a row in each of the student files, without copying any student.
+
+        The sets are replaced, never modified, on reload, so they must be treated as read-only.
+
+        Returns:
+            Tuple[AbstractSet[str], AbstractSet[str], AbstractSet[str]]: The IDs in
+                `student_info.csv`, `student_subjects.csv` and `student_contacts.csv`.
+        """
+        with self._lock:
+            self._refresh()
+            return self._students_by_id.keys(), self._ids_with_subjects, self._ids_with_contact
+
+    @staticmethod
+    def _copy(student: Student) -> Student:
+        """Return a copy that callers may mutate without touching the index."""
+        return replace(student, subjects=list(student.subjects))
+
+    def _current_signature(self) -> tuple:
+        """Return the (mtime, size) signature of the three student files."""
+        signature = []
+        for path in (self._paths.info_file, self._paths.contacts_file, self._paths.subjects_file):
+            try:
+                stat = path.stat()
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _refresh(self) -> None:
+        """Reload the indexes if any of the student files has changed."""
+        signature = self._current_signature()
+        if signature != self._signature:
+            self._load()
+            self._signature = signature
+
+    def _load(self) -> None:
+        """Parse the student files into the id, grade and name indexes."""
+        infos: list[tuple[str, str, str]] = []
+        contacts: Dict[str, str] = {}
+        subjects: Dict[str, list[str]] = {}
+
+        for row in self._read_rows(self._paths.info_file):
+            if len(row) >= 3:
+                infos.append((row[0], row[1].strip(), row[2].strip()))
+
+        ids_with_contact: Set[str] = set()
+        for row in self._read_rows(self._paths.contacts_file):
+            if row:
+                ids_with_contact.add(row[0])
+            if len(row) >= 2:
+                contacts[row[0]] = row[1].strip()
+
+        ids_with_subjects: Set[str] = set()
+        for row in self._read_rows(self._paths.subjects_file):
+            if row:
+                ids_with_subjects.add(row[0])
+            if len(row) >= 2:
+                subjects[row[0]] = [s.strip() for s in row[1:] if s.strip()]
+
+        students_by_id: Dict[str, Student] = {}
+        ids_by_grade: Dict[str, List[str]] = {}
+        ids_by_name_and_grade: Dict[tuple[str, str], str] = {}
+
+        for student_id, name, grade in infos:
+            students_by_id[student_id] = Student(
+                id=student_id,
+                name=name,
+                phone=contacts.get(student_id, ""),
+                grade=grade,
+                subjects=subjects.get(student_id, [])
+            )
+            ids_by_grade.setdefault(grade, []).append(student_id)
+            ids_by_name_and_grade.setdefault((name, grade), student_id)
+
+        self._students_by_id = students_by_id
+        self._ids_by_grade = ids_by_grade
+        self._ids_by_name_and_grade = ids_by_name_and_grade
+        self._ids_with_subjects = ids_with_subjects
+        self._ids_with_contact = ids_with_contact
+
+    @staticmethod
+    def _read_rows(path: Path) -> list[list[str]]:
+        """Read all data rows of a CSV file, skipping the header."""
+        if not path.exists():
+            return []
+
+        with path.open("r", newline='', encoding="utf-8") as f:
+            reader = csv.reader(f)
+            next(reader, None)  # skip header
+            return list(reader)
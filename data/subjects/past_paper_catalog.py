@@ -0,0 +1,131 @@
+import os
+import pickle
+import threading
+from typing import Dict, List
+
+from data.storage.storage_backend_factory import StorageBackendFactory
+from lib.paths import DatabasePaths
+from lib.shared_instance import SharedInstance
+from lib.typing.domain.schedule import PastPaperMetadata
+
+
+class PastPaperCatalog(SharedInstance):
+    """
+    Process-wide catalog of a grade's past papers, compiled once into a per-subject pickle cache;
+    call `invalidate()` after writing new catalog rows.
+    """
+
+    CACHE_VERSION = 1
+    COLUMNS = ("grade", "subject", "year", "session", "url", "paper")
+
+    def __init__(self, grade: str):
+        self._grade = grade
+        self._backend = StorageBackendFactory.get()
+        self._cache_file = (
+            DatabasePaths().catalog_cache_dir /
+            f"{self._backend.BACKEND_TYPE.value}-{grade.lower()}.pickle"
+        )
+        self._lock = threading.Lock()
+        self._columns: Dict[str, Dict[str, list]] = {}
+        self._papers: Dict[str, List[PastPaperMetadata]] = {}
+        self._load()
+
+    @classmethod
+    def instance(cls, grade: str) -> "PastPaperCatalog":
+        """Return the shared catalog of a grade, loading it on first use."""
+        return cls._shared(grade.lower(), lambda: cls(grade))
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop every loaded catalog so the next lookup revalidates the cache."""
+        with cls._instances_lock:
+            cls._instances.clear()
+
+    def get_subject_metadata(self, subject: str) -> List[PastPaperMetadata]:
+        """
+        Return the catalogued papers of a subject.
+
+        Args:
+            subject (str): The subject name (case-insensitive).
+
+        Returns:
+            List[PastPaperMetadata]: The subject's papers, or [] if none.
+        """
+        key = subject.lower()
+
+        with self._lock:
+            papers = self._papers.get(key)
+            if papers is None:
+                columns = self._columns.get(key)
+                papers = self._build_papers(columns) if columns else []
+                self._papers[key] = papers
+
+        return list(papers)
+
+    def subjects(self) -> List[str]:
+        """Return the (lower-cased) names of all catalogued subjects."""
+        return list(self._columns)
+
+    def _load(self) -> None:
+        """Load the compiled cache, re-parsing only subjects whose source changed."""
+        with self._lock:
+            sources = self._backend.get_past_paper_sources(self._grade)
+            cached = self._read_cache_file()
+            subjects: Dict[str, dict] = {}
+            changed = set(cached) != {name.lower() for name in sources}
+
+            for source, signature in sources.items():
+                key = source.lower()
+                entry = cached.get(key)
+
+                if entry is None or entry["signature"] != signature:
+                    papers = self._backend.get_subject_metadata(self._grade, source)
+                    entry = {
+                        "signature": signature,
+                        "columns": {
+                            column: [getattr(paper, column) for paper in papers]
+                            for column in self.COLUMNS
+                        },
+                    }
+                    changed = True
+
+                subjects[key] = entry
+                self._columns[key] = entry["columns"]
+
+            if changed:
+                self._write_cache_file(subjects)
+
+    def _build_papers(self, columns: Dict[str, list]) -> List[PastPaperMetadata]:
+        """Rebuild metadata objects from the cached columns."""
+        return [
+            PastPaperMetadata(**dict(zip(self.COLUMNS, values)))
+            for values in zip(*(columns[column] for column in self.COLUMNS))
+        ]
+
+    def _read_cache_file(self) -> Dict[str, dict]:
+        """Read the compiled cache, treating a missing or stale format as empty."""
+        try:
+            with self._cache_file.open("rb") as f:
+                data = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            return {}
+
+        if not isinstance(data, dict) or data.get("version") != self.CACHE_VERSION:
+            return {}
+        return data.get("subjects", {})
+
+    def _write_cache_file(self, subjects: Dict[str, dict]) -> None:
+        """Atomically replace the compiled cache."""
+        try:
+            self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self._cache_file.with_suffix(".tmp")
+            with tmp_file.open("wb") as f:
+                pickle.dump(
+                    {"version": self.CACHE_VERSION, "subjects": subjects},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_file, self._cache_file)
+        except OSError as e:
+            # The cache is only an optimisation; the in-memory catalog is still valid
+            print(f"[PastPaperCatalog] Could not write catalog cache: {e}")
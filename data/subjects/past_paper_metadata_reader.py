@@ -1,38 +1,12 @@
-
-
-import csv
-from typing import Dict, List
-from lib.paths import PastPaperCSVPaths
+from typing import List
+from data.subjects.past_paper_catalog import PastPaperCatalog
 from lib.typing.domain.schedule import PastPaperMetadata
-from lib.utils import LibUtils
 
 
 # data/subjects/past_paper_metadata_reader.py
 class PastPaperMetadataReader:
     def __init__(self, grade: str):
-        self._paths = PastPaperCSVPaths(grade)
+        self._grade = grade
     
     def get_subject_metadata(self, subject: str) -> List[PastPaperMetadata]:
-        metadata = []
-        subject_file = self._paths.subject_file(subject)
-
-        if subject_file.exists():
-            with subject_file.open(mode='r', newline='', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    try:
-                        paper = PastPaperMetadata(
-                            grade=row['grade'].strip(),
-                            subject=row['subject'].strip(),
-                            year=int(row['year'].strip()),
-                            session=row['session'].strip(),
-                            url=row['url'].strip(),
-                            paper=LibUtils.extract_paper_label(row['url'].strip())
-                        )
-                        metadata.append(paper)
-                    except KeyError:
-                        continue
-                    except ValueError:
-                        continue
-
-        return metadata
\ No newline at end of file
+        return PastPaperCatalog.instance(self._grade).get_subject_metadata(subject)
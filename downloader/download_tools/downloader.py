@@ -4,6 +4,7 @@ from urllib.parse import urlparse
 import time
 from tqdm import tqdm
 
+from data.schedules.resources_index import ResourcesIndex
 from downloader.scraper_tools.save_my_exams import SaveMyExamsScraper
 from lib.grade import Grade
 from lib.subject import EceswaSubject, PapaCambridgeIgcseSubject, Subject
@@ -43,7 +44,10 @@ class PastPaperDownloader:
         Returns:
             bool: True if the download completed successfully, False otherwise.
         """
-        return LibUtils.download_file(self.session, url, path)
+        success = LibUtils.download_file(self.session, url, path)
+        if success:
+            ResourcesIndex.record_download(path)
+        return success
 
     def download(
         self,
@@ -96,6 +100,8 @@ class PastPaperDownloader:
         # Wrap the download function to include tqdm and sleep
         def task_wrapper(url: str, path: str) -> tuple[str, bool]:
             success = LibUtils.download_file(self.session, url, path)
+            if success:
+                ResourcesIndex.record_download(path)
             time.sleep(0.5)
             return (os.path.basename(path), success)
 
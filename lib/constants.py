@@ -1,3 +1,21 @@
+import os
 from pathlib import Path
 
-BASE_DIR = Path(r"E:\Studying and Learning\Thinke.com\Exam_Prep")
\ No newline at end of file
+BASE_DIR = Path(r"E:\Studying and Learning\Thinke.com\Exam_Prep")
+
+# Storage backend used by the data/ readers and writers: "csv" or "sqlite"
+STORAGE_BACKEND = os.getenv("THINKE_STORAGE_BACKEND", "csv")
+
+# Weeks of exam schedule materialised ahead of today; 0 schedules the whole date range at once
+SCHEDULE_WINDOW_WEEKS = int(os.getenv("THINKE_SCHEDULE_WINDOW_WEEKS", "0"))
+
+# Compile schedule PDFs from a precompiled preamble format (needs the mylatexformat package); "0" disables it
+PDF_PREAMBLE_FORMAT = os.getenv("THINKE_PDF_PREAMBLE_FORMAT", "1") != "0"
+
+# Schedule PDF renderer: "latex" (pdflatex) or "pymupdf" (drawn in-process, no LaTeX needed)
+PDF_RENDERER = os.getenv("THINKE_PDF_RENDERER", "latex")
+
+# How papers are materialised in Output/: "copy" (reflink where supported, else copy) or "link"
+# (reflink, else hardlink, else copy). Hardlinked outputs share their bytes with Resources/,
+# so an edit in place changes the downloaded paper too; only opt in when Output/ is read-only
+OUTPUT_LINK_MODE = os.getenv("THINKE_OUTPUT_LINK_MODE", "copy")
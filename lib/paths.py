@@ -1,6 +1,8 @@
 from pathlib import Path
 from dataclasses import dataclass
 
+from lib.constants import BASE_DIR
+
 
 @dataclass(frozen=True)
 class StudentCSVPaths:
@@ -21,6 +23,18 @@ class StudentCSVPaths:
     @property
     def assigned_schedules_file(self) -> Path:
         return self.base_dir / "assigned_schedules.csv"
+
+    @property
+    def assigned_schedules_dir(self) -> Path:
+        return self.base_dir / "assigned_schedules"
+
+    @property
+    def assigned_schedules_manifest_file(self) -> Path:
+        return self.assigned_schedules_dir / "manifest.csv"
+    
+    @property
+    def schedule_cursors_file(self) -> Path:
+        return self.base_dir / "schedule_cursors.csv"
     
     @property
     def sent_msgs_file(self) -> Path:
@@ -47,6 +61,10 @@ class ExamScheduleCSVPaths:
     def prioritized_councils_file(self) -> Path:
         return self.base_dir / "prioritized_councils.csv"
     
+    @property
+    def holidays_file(self) -> Path:
+        return self.base_dir / "holidays.csv"
+    
     @property
     def downloaded_past_papers_file(self) -> Path:
         return self.base_dir / "downloaded_past_papers.csv"
@@ -59,4 +77,54 @@ class PastPaperCSVPaths:
 
     def subject_file(self, subject: str) -> Path:
         return self.base_dir / f"{subject}.csv"
-        
\ No newline at end of file
+
+
+@dataclass(frozen=True)
+class DatabasePaths:
+    base_dir: Path = Path.cwd() / "database"
+
+    @property
+    def sqlite_file(self) -> Path:
+        return self.base_dir / "thinke.db"
+
+    @property
+    def catalog_cache_dir(self) -> Path:
+        return self.base_dir / "cache" / "catalog"
+
+    @property
+    def latex_format_dir(self) -> Path:
+        return self.base_dir / "cache" / "latex"
+
+
+@dataclass(frozen=True)
+class ResourcesPaths:
+    base_dir: Path = BASE_DIR / "Resources"
+
+    def grade_dir(self, grade: str) -> Path:
+        return self.base_dir / grade
+
+
+@dataclass(frozen=True)
+class OutputPaths:
+    base_dir: Path = BASE_DIR / "Output"
+
+    def grade_dir(self, grade: str) -> Path:
+        return self.base_dir / grade
+
+    @property
+    def pdf_dir(self) -> Path:
+        return self.base_dir / "pdf"
+
+    @property
+    def snapshots_dir(self) -> Path:
+        return self.base_dir / "snapshots"
+
+    def snapshot_file(self, student_id: str) -> Path:
+        return self.snapshots_dir / f"{student_id}.json"
+
+    @property
+    def manifests_dir(self) -> Path:
+        return self.base_dir / "manifests"
+
+    def manifest_file(self, student_id: str) -> Path:
+        return self.manifests_dir / f"{student_id}.json"
@@ -0,0 +1,29 @@
+import threading
+from typing import Any, Callable, Dict, Hashable, Type, TypeVar
+
+T = TypeVar("T", bound="SharedInstance")
+
+
+class SharedInstance:
+    """
+    Keeps one process-wide instance of a class per key.
+    """
+
+    _instances: Dict[Hashable, Any]
+    _instances_lock: threading.Lock
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Every class gets its own registry
+        cls._instances = {}
+        cls._instances_lock = threading.Lock()
+
+    @classmethod
+    def _shared(cls: Type[T], key: Hashable, create: Callable[[], T]) -> T:
+        """Return the instance stored under the key, creating it on first use."""
+        with cls._instances_lock:
+            instance = cls._instances.get(key)
+            if instance is None:
+                instance = create()
+                cls._instances[key] = instance
+            return instance
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List
 
@@ -22,6 +22,8 @@ class ScheduleInputData:
     end_date: str
     excluded_days: List[DayOfWeek]
     prioritized_councils: List[PrioritizedCouncil]
+    # Public holidays to skip, as 'dd-mm-yy'
+    holidays: List[str] = field(default_factory=list)
     
 
 @dataclass
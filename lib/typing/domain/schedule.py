@@ -1,7 +1,13 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
-@dataclass
+# Catalog and schedule rows exist in the hundreds of thousands, so their record
+# types are slotted (no per-instance __dict__) and frozen (safe to share between
+# students). The readers intern their repeated grade, subject and session strings.
+
+@dataclass(frozen=True, slots=True)
 class PastPaperMetadata:
     grade: str
     subject: str
@@ -10,11 +16,32 @@ class PastPaperMetadata:
     session: str
     paper: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ScheduledPastPaperMetadata(PastPaperMetadata):
     student_id: str
-    date: str
+    # The study day as a day ordinal; 'dd-mm-yy' strings only exist at the storage boundary
+    date_ordinal: int
+
+    @property
+    def date(self) -> str:
+        """The study day as 'dd-mm-yy'."""
+        return ordinal_date(self.date_ordinal)
     
+@dataclass
+class ScheduleCursor:
+    """
+    Where a student's rolling-window schedule stopped, so it can be extended.
+    """
+    student_id: str
+    # Last study day materialised, as 'dd-mm-yy'
+    last_day: str
+    # Position in the round-robin subject rotation for the next day
+    subject_index: int
+    # Next council to try, per subject
+    council_indices: dict[str, int] = field(default_factory=dict)
+    # Study day of the latest ECESWA paper reset, per ECESWA grade
+    reset_days: dict[str, str] = field(default_factory=dict)
+
 @dataclass
 class MsgRecord:
     student_id: str
@@ -30,7 +57,7 @@ class StudentInfo:
     name: str
     grade: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DownloadedPastPaperMetadata:
     grade: str
     subject: str
@@ -39,12 +66,16 @@ class DownloadedPastPaperMetadata:
     url: str
     path: Path
     
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SchedulePaper:
     paper_metadata: DownloadedPastPaperMetadata
-    src_path: Path
     dest_path: Path
 
+    @property
+    def src_path(self) -> Path:
+        """Where the downloaded paper lives under Resources/."""
+        return self.paper_metadata.path
+
 @dataclass
 class DailySchedule:
     day: str
@@ -62,4 +93,23 @@ class ExamSchedule:
     student_info: StudentInfo
     base_path: Path
     generated_pdf_path: Path
-    monthly_schedules: list[MonthlySchedule]
\ No newline at end of file
+    monthly_schedules: list[MonthlySchedule]
+
+
+# A schedule spans a few hundred distinct days, so both conversions are cached
+
+@lru_cache(maxsize=None)
+def date_ordinal(day: str) -> int:
+    """
+    Convert a 'dd-mm-yy' date to its proleptic Gregorian ordinal.
+
+    Two-digit years follow strptime's '%y' pivot (69-99 -> 1900s, 00-68 -> 2000s).
+    """
+    year = int(day[6:8])
+    return date(year + (1900 if year >= 69 else 2000), int(day[3:5]), int(day[0:2])).toordinal()
+
+
+@lru_cache(maxsize=None)
+def ordinal_date(ordinal: int) -> str:
+    """Convert a proleptic Gregorian ordinal back to its 'dd-mm-yy' date."""
+    return date.fromordinal(ordinal).strftime("%d-%m-%y")
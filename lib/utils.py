@@ -12,6 +12,12 @@ from typing import Any, Generator, Iterable, Literal
 from halo import Halo
 from tqdm import tqdm
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
 class LibUtils:
     """
     A class that defines static library utility methods
@@ -132,6 +138,40 @@ class LibUtils:
         finally:
             spinner.stop()
             
+    @staticmethod
+    @contextmanager
+    def file_lock(lock_path: Path) -> Generator[None, None, None]:
+        """
+        A context manager that holds an exclusive lock on a lock file,
+        blocking until any other process holding it lets go.
+        
+        Args:
+            lock_path (Path): The lock file; created if missing and left in place.
+        """
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(lock_path, "a+b") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            else:
+                f.seek(0)
+                while True:
+                    try:
+                        # LK_LOCK itself gives up after about ten seconds
+                        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                        break
+                    except OSError:
+                        continue
+            
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                else:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            
     @staticmethod
     @contextmanager
     def progress_bar(
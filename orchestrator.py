@@ -2,12 +2,14 @@
 import asyncio
 import os
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 from daily_schedule.messenger import Messenger
+from data.schedules.downloaded_paper_ledger import DownloadedPaperLedger
 from data.schedules.exam_schedule_data_reader import ExamSchedulerDataReader
 from data.schedules.exam_schedule_data_writer import ExamSchedulerDataWriter
 from data.students.student_data_reader import StudentDataReader
 from data.students.student_data_writer import StudentDataWriter
+from data.students.student_roster_importer import StudentRosterImporter
 from downloader.download_tools.downloader import PastPaperDownloader
 from downloader.save_tools.saver import PastPaperSaver
 from downloader.scraper_tools.criterion import PaperCount
@@ -19,7 +21,12 @@ from lib.symbols import Symbols
 from lib.typing.data.schedule import ScheduleInputData
 from lib.typing.domain.student import Student, StudentRecord
 from lib.utils import LibUtils
-from scheduler.exam_prep.schedule_generator import ScheduleGenerator
+from scheduler.exam_prep.batch_scheduler import BatchExamScheduler
+from scheduler.exam_prep.grade_scheduling_context import GradeSchedulingContext
+from scheduler.exam_prep.output_materialiser import OutputMaterialiser
+from scheduler.exam_prep.schedule_generator import PdfRenderer
+from scheduler.exam_prep.schedule_pdf_renderer import SchedulePdfRenderer
+from scheduler.exam_prep.schedule_snapshot import ScheduleSnapshot
 from scheduler.exam_prep.scheduler import ExamScheduler
 from ui.exam_scheduler_ui import ExamSchedulerUI
 from ui.student_data_reader_ui import StudentDataReaderUI
@@ -62,6 +69,19 @@ class Orchestrator:
                     
         asyncio.run(async_read_and_write_helper())
     
+    @staticmethod
+    def import_students_roster(roster_path: str):
+        with LibUtils.spinner(
+            start_text=f"Importing student roster - {roster_path}",
+            success_text=f"Successfully imported student roster - {roster_path}"
+        ):
+            counts = StudentRosterImporter().import_file(roster_path)
+        
+        print(
+            f"{Colors.GREEN} {Symbols.arrow} Imported {counts['imported']} students "
+            f"({counts['duplicate']} already registered, {counts['invalid']} invalid rows){Colors.RESET}"
+        )
+    
     @staticmethod
     def read_and_write_schedule_input_data():
         async def async_read_and_write_helper():
@@ -94,22 +114,18 @@ class Orchestrator:
         )
     
     @staticmethod
-    def generate_exam_preparation_schedules():
+    def generate_exam_preparation_schedules(pdf_renderer: Optional[PdfRenderer] = None):
         
-        def create_schedule_helper(scheduler: ExamScheduler, student: Student) -> None:
-            # Create schedule if not already created                
-            if not scheduler.has_complete_schedule():  
-                scheduled_papers = scheduler.get_new_scheduled_papers_for_student()
-                
-                with LibUtils.spinner(
-                        start_text=f"Writing schedule to database - {student.name}",
-                        success_text=f"Successfully written schedule to database - {student.name}"
-                    ):
-                    for schedule_paper in scheduled_papers:
-                        student_writer.write_exam_schedule_record(schedule_paper)
+        def create_schedules_helper(grade: EceswaGrade, context: GradeSchedulingContext, students: List[Student]) -> None:
+            # Create the schedules of every student without one, across a process pool
+            with LibUtils.spinner(
+                    start_text=f"Writing {grade.value} schedules to database",
+                    success_text=f"Successfully written {grade.value} schedules to database"
+                ):
+                BatchExamScheduler(context).schedule(students)
                             
         def download_papers_write_metadata_helper(grade: EceswaGrade, scheduler: ExamScheduler, student: Student) -> None:
-            schedule_writer = ExamSchedulerDataWriter(grade)
+            ledger = DownloadedPaperLedger.instance(grade.value)
             if not scheduler.schedule_written_to_database() or not scheduler.papers_exist_in_src_dir(): 
                 with LibUtils.progress_bar(
                     tasks=scheduler.get_exam_schedule_papers(),
@@ -118,26 +134,12 @@ class Orchestrator:
                 ) as progress:
                     for p in progress:  
                         if PastPaperDownloader().download_pure(p.paper_metadata.url, p.src_path):
-                            schedule_writer.write_downloaded_paper_metadata_record(p.paper_metadata)
+                            ledger.add([p.paper_metadata])
                             time.sleep(0.2) 
-                                
-        def copy_schedule_helper(scheduler: ExamScheduler, student: Student, generator: ScheduleGenerator) -> None:
-            if not scheduler.schedule_copied_to_output_dir() and scheduler.papers_exist_in_src_dir(): 
-                with LibUtils.spinner(
-                    start_text=f"Copying schedule to output directory - {student.name}",
-                    success_text=f"Successfully copied schedule - {student.name}"
-                ):    
-                    generator.save_schedule_to_disk()
-        
-        def generate_pdf(scheduler: ExamScheduler, student: Student, generator: ScheduleGenerator) -> None:
-            if not scheduler.schedule_pdf_generated():
-                with LibUtils.spinner(
-                    start_text=f"Generating PDF file for schedule - {student.name}",
-                    success_text=f"Successfully generated PDF file - {student.name}"
-                ):
-                    generator.generate_pdf_schedule()
-                    time.sleep(0.5)
                 
+                # Persist the whole batch of downloaded papers in one append
+                ledger.flush()
+                                
         for grade in EceswaGrade:
             students = StudentDataReader().get_students_by_grade(grade)
             
@@ -145,17 +147,68 @@ class Orchestrator:
                 print(f"{Symbols.arrow} No {grade.value} students were found in the database")
                 continue
                 
-            student_writer = StudentDataWriter()
+            context = GradeSchedulingContext.build(grade)
+            
+            if context is None:
+                print(f"{Symbols.arrow} No {grade.value} exam schedule input data was found in the database")
+                continue
             
+            create_schedules_helper(grade, context, students)
+                
             for student in students:
-                scheduler = ExamScheduler(student)
+                scheduler = ExamScheduler(student, context)
            
-                create_schedule_helper(scheduler, student)
                 download_papers_write_metadata_helper(grade, scheduler, student)
                 
-                generator = ScheduleGenerator(scheduler.get_schedule())
-                copy_schedule_helper(scheduler, student, generator)
-                generate_pdf(scheduler, student, generator)
+                # Hand the schedule to the copy, PDF and send stages
+                scheduler.get_snapshot().save()
+            
+            Orchestrator.render_schedules(grade, pdf_renderer)
+    
+    @staticmethod
+    def render_schedules(grade: EceswaGrade, pdf_renderer: Optional[PdfRenderer] = None):
+        """
+        Copy the papers and generate the PDF of every stored schedule snapshot
+        of a grade, without loading the catalog or the student store.
+        
+        The PDFs are rendered with `pdf_renderer`, or the THINKE_PDF_RENDERER setting.
+        """
+        
+        def copy_schedules_helper(snapshots: List[ScheduleSnapshot]) -> None:
+            pending = [
+                snapshot for snapshot in snapshots
+                if not snapshot.schedule_copied_to_output_dir() and snapshot.papers_exist_in_src_dir()
+            ]
+            if not pending:
+                return
+            
+            # One thread pool links or copies the papers of every pending student
+            with LibUtils.spinner(
+                start_text=f"Copying {len(pending)} {grade.value} schedules to output directory",
+                success_text=f"Successfully copied {len(pending)} {grade.value} schedules"
+            ):
+                OutputMaterialiser().materialise(
+                    paper for snapshot in pending for paper in snapshot.schedule_papers()
+                )
+                
+                # Later checks compare against the manifests instead of walking the output tree
+                for snapshot in pending:
+                    snapshot.save_output_manifest()
+        
+        def generate_pdfs(snapshots: List[ScheduleSnapshot]) -> None:
+            # Up-to-date PDFs are recognised by their source hash and skipped by the renderer
+            with LibUtils.spinner(
+                start_text=f"Generating {grade.value} PDF schedules",
+                success_text=f"Successfully generated {grade.value} PDF schedules"
+            ):
+                SchedulePdfRenderer(renderer=pdf_renderer).render([snapshot.exam_schedule for snapshot in snapshots])
+        
+        snapshots = list(ScheduleSnapshot.load_all(grade.value))
+        
+        copy_schedules_helper(snapshots)
+        
+        # PDFs are built in parallel, each in its own working directory
+        generate_pdfs(snapshots)
         
     @staticmethod
     def send_schedules():
@@ -164,13 +217,13 @@ class Orchestrator:
             reader = StudentDataReader()
             writer = StudentDataWriter()
             
-            students = reader.get_students_by_grade(grade)
-        
-            for student in students:
+            # The scheduling stage's snapshots carry the students and their records
+            for snapshot in ScheduleSnapshot.load_all(grade.value):
+                student = snapshot.student
                 day = '12-08-25'
                 id = student.id
                 
-                schedule_records = ExamScheduler(student).get_scheduled_records_by_day(day)
+                messengers = Messenger.for_day(snapshot, day)
                 readable_day = LibUtils.get_human_readable_date(day)
                 
                 # if reader.msgs_for_id_and_day_exist(id, day):
@@ -178,11 +231,7 @@ class Orchestrator:
                 #     continue
                 
                 
-                for past_paper in schedule_records:  
-                    if not past_paper:
-                        continue
-                    
-                    messenger = Messenger(student=student, past_paper=past_paper)
+                for messenger in messengers:
                     msg = messenger.send_whatsapp_msg()
                     
                     if msg:
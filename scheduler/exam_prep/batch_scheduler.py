@@ -0,0 +1,258 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+import os
+from typing import Dict, List, Optional, Tuple
+
+from data.students.student_data_reader import StudentDataReader
+from data.students.student_data_writer import StudentDataWriter
+from lib.constants import SCHEDULE_WINDOW_WEEKS
+from lib.typing.domain.schedule import ScheduleCursor, ScheduledPastPaperMetadata
+from lib.typing.domain.student import Student
+from scheduler.exam_prep.grade_scheduling_context import GradeSchedulingContext
+from scheduler.exam_prep.scheduler import ExamScheduler
+
+
+# New schedule records of a student, and the cursor to store with them in rolling-window mode
+StudentScheduleUpdate = Tuple[List[ScheduledPastPaperMetadata], Optional[ScheduleCursor]]
+
+# The grade context and window of a worker process, installed once by `_init_worker`
+_worker_context: Optional[GradeSchedulingContext] = None
+_worker_window_weeks: int = 0
+
+
+def _init_worker(context: GradeSchedulingContext, window_weeks: int) -> None:
+    global _worker_context, _worker_window_weeks
+    _worker_context = context
+    _worker_window_weeks = window_weeks
+
+
+def _schedule_shard(students: List[Student]) -> Dict[str, StudentScheduleUpdate]:
+    """Compute the new schedules of a shard of students in a worker process."""
+    return BatchExamScheduler.schedule_students(_worker_context, students, _worker_window_weeks)
+
+
+class BatchExamScheduler:
+    """
+    Computes the exam schedules of all students of a grade in one batch.
+
+    Students are sharded across a process pool; every worker receives the
+    shared `GradeSchedulingContext` once, computes the schedules of its
+    shards with a regular `ExamScheduler` per student, and returns the
+    records. The parent merges them into a single bulk write. A shard that
+    fails is reported and its students are left for the next run; the
+    rest of the grade is still written.
+
+    With a rolling window, only the next `window_weeks` weeks are
+    materialised and each student's `ScheduleCursor` is stored alongside.
+
+    Students without any stored schedule history get exactly the same paper
+    sequence whenever they share a subject set (the grade, councils and date
+    range are fixed by the context). They are grouped by a subject bitmask,
+    the schedule is computed once per group and copied to every member.
+    """
+
+    SHARDS_PER_WORKER = 4
+
+    def __init__(
+        self,
+        context: GradeSchedulingContext,
+        max_workers: Optional[int] = None,
+        window_weeks: int = SCHEDULE_WINDOW_WEEKS
+    ):
+        """
+        Args:
+            context (GradeSchedulingContext): The shared context of the students' grade.
+            max_workers (int, optional): Size of the process pool. Defaults to the
+                number of CPUs; 1 computes everything in this process.
+            window_weeks (int): Weeks to materialise ahead of today; 0 schedules the
+                whole date range at once.
+        """
+        self._context = context
+        self._window_weeks = window_weeks
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._reader = StudentDataReader()
+        self._writer = StudentDataWriter()
+
+    def schedule(self, students: List[Student]) -> int:
+        """
+        Compute and store the schedules of every student without a complete one,
+        or extend every student's rolling window.
+
+        Args:
+            students (List[Student]): Students of the context's grade.
+
+        Returns:
+            int: The number of schedule records written.
+        """
+        updates = self.compute(students)
+
+        try:
+            written = self._writer.write_exam_schedule_records(
+                (
+                    record
+                    for student in students
+                    for record in updates.get(student.id, ([], None))[0]
+                ),
+                strict=True
+            )
+        except Exception as e:
+            # Cursors only move once their records are stored
+            print(f"[BatchExamScheduler] Failed to write schedule records; schedule cursors left unchanged: {e}")
+            return 0
+
+        self._writer.write_schedule_cursors(
+            cursor for _, cursor in updates.values() if cursor is not None
+        )
+
+        return written
+
+    def compute(self, students: List[Student]) -> Dict[str, StudentScheduleUpdate]:
+        """
+        Compute the new schedules of every student without a complete one.
+
+        Args:
+            students (List[Student]): Students of the context's grade.
+
+        Returns:
+            Dict[str, StudentScheduleUpdate]: The new schedule records, and the
+                new cursor in rolling-window mode, per student ID.
+        """
+        representatives, followers = self._group_by_subject_set(students)
+        updates = self._compute_students(representatives)
+
+        # Stamp the shared schedules out for the rest of each group
+        for representative_id, members in followers.items():
+            update = updates.get(representative_id)
+            if update is None:
+                continue
+
+            records, cursor = update
+            for member in members:
+                updates[member.id] = (
+                    [replace(record, student_id=member.id) for record in records],
+                    replace(
+                        cursor,
+                        student_id=member.id,
+                        council_indices=dict(cursor.council_indices),
+                        reset_days=dict(cursor.reset_days)
+                    ) if cursor else None
+                )
+
+        return updates
+
+    def _group_by_subject_set(
+        self,
+        students: List[Student]
+    ) -> Tuple[List[Student], Dict[str, List[Student]]]:
+        """
+        Group the students without schedule history by subject bitmask.
+
+        In window mode, students whose cursor already covers the window are
+        left out, so no scheduler is built for them.
+
+        Returns:
+            Tuple[List[Student], Dict[str, List[Student]]]: The students to actually
+                schedule (one per subject set, plus every student with history), and
+                the other members of each group keyed by their representative's ID.
+        """
+        representatives: List[Student] = []
+        followers: Dict[str, List[Student]] = {}
+        representative_by_mask: Dict[int, Student] = {}
+        window_end = self._context.window_end(self._window_weeks) if self._window_weeks else 0
+
+        for student in students:
+            cursor = self._reader.get_schedule_cursor(student.id) if self._window_weeks else None
+            if cursor is not None and self._context.study_days_through(cursor.last_day) >= window_end:
+                continue
+
+            has_history = (
+                cursor is not None
+                or self._reader.get_exam_schedules_version(student.id) is not None
+            )
+
+            if has_history:
+                representatives.append(student)
+                continue
+
+            mask = self._context.subject_mask(student.subjects)
+            representative = representative_by_mask.get(mask)
+
+            if representative is None:
+                representative_by_mask[mask] = student
+                representatives.append(student)
+            else:
+                followers.setdefault(representative.id, []).append(student)
+
+        return representatives, followers
+
+    def _compute_students(self, students: List[Student]) -> Dict[str, StudentScheduleUpdate]:
+        """Compute the schedules of the given students, across the process pool if worthwhile."""
+        if not students:
+            return {}
+
+        workers = min(self._max_workers, len(students))
+
+        if workers <= 1:
+            try:
+                return self.schedule_students(self._context, students, self._window_weeks)
+            except Exception as e:
+                self._report_failed_shard(students, e)
+                return {}
+
+        shard_count = min(len(students), workers * self.SHARDS_PER_WORKER)
+        shards = [students[i::shard_count] for i in range(shard_count)]
+        updates: Dict[str, StudentScheduleUpdate] = {}
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self._context, self._window_weeks)
+        ) as executor:
+            futures = {executor.submit(_schedule_shard, shard): shard for shard in shards}
+
+            for future in as_completed(futures):
+                try:
+                    updates.update(future.result())
+                except Exception as e:
+                    self._report_failed_shard(futures[future], e)
+
+        return updates
+
+    @staticmethod
+    def _report_failed_shard(students: List[Student], error: Exception) -> None:
+        """Report a shard whose schedules could not be computed; its students are retried on the next run."""
+        names = ", ".join(student.name for student in students)
+        print(f"[BatchExamScheduler] Could not schedule {len(students)} students ({names}): {error}")
+
+    @staticmethod
+    def schedule_students(
+        context: GradeSchedulingContext,
+        students: List[Student],
+        window_weeks: int = 0
+    ) -> Dict[str, StudentScheduleUpdate]:
+        """
+        Compute the new schedules of students sequentially.
+
+        Args:
+            context (GradeSchedulingContext): The shared context of the students' grade.
+            students (List[Student]): The students to schedule.
+            window_weeks (int): Weeks to materialise ahead of today; 0 schedules the
+                whole date range of every student without a complete schedule.
+
+        Returns:
+            Dict[str, StudentScheduleUpdate]: The new schedule records, and the new
+                cursor in rolling-window mode, of every student with new work.
+        """
+        updates: Dict[str, StudentScheduleUpdate] = {}
+
+        for student in students:
+            scheduler = ExamScheduler(student, context)
+
+            if window_weeks:
+                records = scheduler.extend_schedule(window_weeks)
+                if records:
+                    updates[student.id] = (records, scheduler.schedule_cursor)
+            elif not scheduler.has_complete_schedule():
+                updates[student.id] = (scheduler.get_new_scheduled_papers_for_student(), None)
+
+        return updates
@@ -0,0 +1,228 @@
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import PurePosixPath
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from data.schedules.exam_schedule_data_reader import ExamSchedulerDataReader
+from data.subjects.past_paper_metadata_reader import PastPaperMetadataReader
+from lib.exam_council import ExamCouncil
+from lib.grade import CambridgeGrade, EceswaGrade
+from lib.typing.data.schedule import ScheduleInputData
+from lib.typing.domain.schedule import PastPaperMetadata
+from scheduler.exam_prep.study_calendar import StudyCalendar
+
+
+@dataclass(frozen=True)
+class GradeSchedulingContext:
+    """
+    Everything the schedulers of one grade share, built once per grade.
+
+    Holds the grade's schedule input data, the prioritized councils per
+    subject, the past paper catalog of those subjects across all catalog
+    grades and the study-day calendar. Every per-student `ExamScheduler`
+    borrows it read-only instead of re-reading the same data.
+
+    Attributes:
+        grade (str): The students' grade, e.g. 'EGCSE'.
+        input_data (ScheduleInputData): Dates, excluded days and prioritized councils.
+        subject_councils (Dict[str, List[ExamCouncil]]): Prioritized councils per subject,
+            in the configured subject order.
+        subject_papers (Dict[str, Dict[str, List[PastPaperMetadata]]]): Catalogued papers
+            per subject and catalog grade.
+        calendar (StudyCalendar): The grade's study days as a business-day calendar.
+        monthly_schedules (List[Dict]): Study days grouped by month, as
+            {'year', 'month', 'days'} blocks.
+        study_days (List[str]): All study days in chronological order, as 'dd-mm-yy'.
+        cambridge_paper_groups (Dict[str, List[List[PastPaperMetadata]]]): Cambridge IGCSE
+            papers per subject, grouped so related documents (e.g. QP and IN) are assigned
+            together, in assignment order.
+        eceswa_paper_groups (Dict[str, Dict[str, List[List[PastPaperMetadata]]]]): ECESWA
+            papers per subject and ECESWA grade, grouped by (year, session, paper number)
+            and sorted latest year first, then lowest paper number.
+        eceswa_paper_urls (Dict[str, Dict[str, frozenset]]): The URLs of those papers per
+            subject and ECESWA grade.
+    """
+    grade: str
+    input_data: ScheduleInputData
+    subject_councils: Dict[str, List[ExamCouncil]]
+    subject_papers: Dict[str, Dict[str, List[PastPaperMetadata]]]
+    calendar: StudyCalendar
+    monthly_schedules: List[Dict]
+    study_days: List[str]
+    cambridge_paper_groups: Dict[str, List[List[PastPaperMetadata]]]
+    eceswa_paper_groups: Dict[str, Dict[str, List[List[PastPaperMetadata]]]]
+    eceswa_paper_urls: Dict[str, Dict[str, frozenset]]
+
+    @classmethod
+    def build(cls, grade: EceswaGrade) -> Optional["GradeSchedulingContext"]:
+        """
+        Load the scheduling context of a grade.
+
+        Args:
+            grade (EceswaGrade): The students' grade.
+
+        Returns:
+            Optional[GradeSchedulingContext]: The context, or None if the grade
+                has no schedule input data yet.
+        """
+        input_data = ExamSchedulerDataReader(grade).get_schedule_input_data()
+        if input_data is None:
+            return None
+
+        past_paper_readers = {
+            catalog_grade.value: PastPaperMetadataReader(catalog_grade.value)
+            for catalog_grade in list(list(EceswaGrade) + list(CambridgeGrade))
+        }
+
+        subject_papers: Dict[str, Dict[str, List[PastPaperMetadata]]] = {}
+        for subject in (council.subject for council in input_data.prioritized_councils):
+            subject_papers[subject] = {}
+            for grade_key, reader in past_paper_readers.items():
+                papers = reader.get_subject_metadata(subject)
+                if papers:
+                    subject_papers[subject][grade_key] = papers
+
+        return cls.from_data(grade, input_data, subject_papers)
+
+    @classmethod
+    def from_data(
+        cls,
+        grade: EceswaGrade,
+        input_data: ScheduleInputData,
+        subject_papers: Dict[str, Dict[str, List[PastPaperMetadata]]]
+    ) -> "GradeSchedulingContext":
+        """
+        Build the scheduling context from already loaded data.
+
+        Args:
+            grade (EceswaGrade): The students' grade.
+            input_data (ScheduleInputData): The grade's schedule input data.
+            subject_papers (Dict[str, Dict[str, List[PastPaperMetadata]]]): Catalogued
+                papers per subject and catalog grade.
+
+        Returns:
+            GradeSchedulingContext: The context.
+        """
+        subject_councils = {
+            council.subject: [ExamCouncil.from_value(c) for c in council.councils]
+            for council in input_data.prioritized_councils
+        }
+
+        study_calendar = StudyCalendar(input_data)
+        eceswa_grades = [eceswa_grade.value for eceswa_grade in EceswaGrade]
+
+        return cls(
+            grade=grade.value,
+            input_data=input_data,
+            subject_councils=subject_councils,
+            subject_papers=subject_papers,
+            calendar=study_calendar,
+            monthly_schedules=study_calendar.monthly_schedules(),
+            study_days=study_calendar.labels,
+            cambridge_paper_groups={
+                subject: cls._group_cambridge_papers(
+                    papers_by_grade.get(CambridgeGrade.IGCSE.value, [])
+                )
+                for subject, papers_by_grade in subject_papers.items()
+            },
+            eceswa_paper_groups={
+                subject: {
+                    eceswa_grade: cls._group_eceswa_papers(papers_by_grade.get(eceswa_grade, []))
+                    for eceswa_grade in eceswa_grades
+                }
+                for subject, papers_by_grade in subject_papers.items()
+            },
+            eceswa_paper_urls={
+                subject: {
+                    eceswa_grade: frozenset(paper.url for paper in papers_by_grade.get(eceswa_grade, []))
+                    for eceswa_grade in eceswa_grades
+                }
+                for subject, papers_by_grade in subject_papers.items()
+            }
+        )
+
+    def subject_mask(self, subjects: List[str]) -> int:
+        """
+        Encode a student's scheduled subjects as a bitmask.
+
+        Bit i is set if the i-th prioritized subject is among `subjects`;
+        subjects without prioritized councils are never scheduled and are ignored.
+
+        Args:
+            subjects (List[str]): The student's subjects.
+
+        Returns:
+            int: The subject bitmask.
+        """
+        chosen = set(subjects)
+        return sum(
+            1 << position
+            for position, subject in enumerate(self.subject_councils)
+            if subject in chosen
+        )
+
+    def study_days_through(self, day: str) -> int:
+        """Return the number of study days on or before a 'dd-mm-yy' day."""
+        day64 = np.datetime64(datetime.strptime(day, "%d-%m-%y").date(), "D")
+        return int(np.searchsorted(self.calendar.days, day64, side="right"))
+
+    def window_end(self, window_weeks: int, today: Optional[date] = None) -> int:
+        """Return the number of study days on or before the end of a rolling window."""
+        horizon = np.datetime64(today or date.today(), "D") + np.timedelta64(7 * window_weeks, "D")
+        return int(np.searchsorted(self.calendar.days, horizon, side="right"))
+
+    @staticmethod
+    def _group_eceswa_papers(papers: List[PastPaperMetadata]) -> List[List[PastPaperMetadata]]:
+        """
+        Group ECESWA papers by year, session and paper number.
+
+        Groups are sorted by year descending, then paper number ascending;
+        ties keep catalog order.
+
+        Args:
+            papers (List[PastPaperMetadata]): A subject's papers for one ECESWA grade.
+
+        Returns:
+            List[List[PastPaperMetadata]]: The paper groups, in assignment order.
+        """
+        grouped: Dict[tuple[int, str, Optional[int]], List[PastPaperMetadata]] = defaultdict(list)
+
+        for paper in papers:
+            match = re.search(r"Paper\s*(\d+)", paper.url, re.IGNORECASE)
+            paper_number = int(match.group(1)) if match else None
+            grouped[(paper.year, paper.session, paper_number)].append(paper)
+
+        return [
+            papers
+            for _, papers in sorted(grouped.items(), key=lambda x: (-x[0][0], x[0][2] or 0))
+        ]
+
+    @staticmethod
+    def _group_cambridge_papers(papers: List[PastPaperMetadata]) -> List[List[PastPaperMetadata]]:
+        """
+        Group Cambridge papers by grade, subject, year, session and filename stem.
+
+        The question paper and insert of a paper share a stem once their
+        `_qp_`/`_in_` marker is removed. Groups keep catalog order.
+
+        Args:
+            papers (List[PastPaperMetadata]): A subject's IGCSE papers.
+
+        Returns:
+            List[List[PastPaperMetadata]]: The paper groups, in assignment order.
+        """
+        grouped: Dict[str, List[PastPaperMetadata]] = defaultdict(list)
+
+        for paper in papers:
+            try:
+                filename = PurePosixPath(paper.url).name
+            except Exception:
+                continue
+            normalized = re.sub(r'_(qp|in)_', '_', filename)
+            grouped[f"{paper.grade}::{paper.subject}::{paper.year}::{paper.session}::{normalized}"].append(paper)
+
+        return list(grouped.values())
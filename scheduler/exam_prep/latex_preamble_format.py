@@ -0,0 +1,96 @@
+import hashlib
+import os
+from pathlib import Path
+import subprocess
+import tempfile
+import threading
+from typing import Optional
+
+from lib.paths import DatabasePaths
+from lib.shared_instance import SharedInstance
+
+
+class LatexPreambleFormat(SharedInstance):
+    """
+    Precompiled format of the schedule PDFs' fixed LaTeX preamble, named after the preamble's hash;
+    a format pdflatex can no longer load is dropped by the caller with `discard()`.
+    """
+
+    def __init__(self, compiler: str = "pdflatex"):
+        self._compiler = compiler
+        self._format_dir = DatabasePaths().latex_format_dir
+        self._lock = threading.Lock()
+        self._unavailable = False
+
+    @classmethod
+    def instance(cls, compiler: str = "pdflatex") -> "LatexPreambleFormat":
+        """Return the shared preamble format of a LaTeX compiler."""
+        return cls._shared(compiler, lambda: cls(compiler))
+
+    def get(self, preamble: str) -> Optional[Path]:
+        """
+        Return the format file of a preamble, dumping it on first use.
+
+        Args:
+            preamble (str): The LaTeX source up to `\\begin{document}`.
+
+        Returns:
+            Optional[Path]: The format file, or None if no format can be built
+                (e.g. mylatexformat is not installed); compile without one then.
+        """
+        if self._unavailable:
+            return None
+
+        name = f"schedule-{hashlib.sha256(preamble.encode('utf-8')).hexdigest()[:16]}"
+        format_file = self._format_dir / f"{name}.fmt"
+
+        with self._lock:
+            if format_file.exists():
+                return format_file
+
+            try:
+                self._dump(name, preamble, format_file)
+            except (OSError, subprocess.CalledProcessError) as e:
+                print(f"[LatexPreambleFormat] Could not build the preamble format, compiling without it: {e}")
+                self._unavailable = True
+                return None
+
+        return format_file
+
+    def discard(self, format_file: Path) -> None:
+        """
+        Remove a format file that could not be loaded, so the next `get` rebuilds it.
+
+        Args:
+            format_file (Path): The format file returned by `get`.
+        """
+        with self._lock:
+            try:
+                format_file.unlink(missing_ok=True)
+            except OSError as e:
+                # e.g. still open in another compile on Windows; later compiles keep falling back until it is gone
+                print(f"[LatexPreambleFormat] Could not remove the preamble format {format_file.name}: {e}")
+
+    def _dump(self, name: str, preamble: str, format_file: Path) -> None:
+        """Dump the preamble into a format file and drop the formats of older preambles."""
+        self._format_dir.mkdir(parents=True, exist_ok=True)
+
+        with tempfile.TemporaryDirectory(prefix=".dump-", dir=self._format_dir) as work_dir:
+            (Path(work_dir) / f"{name}.tex").write_text(
+                preamble + "\\begin{document}\n\\end{document}\n",
+                encoding="utf-8"
+            )
+            subprocess.run(
+                [
+                    self._compiler, "-ini", f"-jobname={name}", "-interaction=nonstopmode",
+                    f"&{self._compiler}", "mylatexformat.ltx", f"{name}.tex"
+                ],
+                cwd=work_dir,
+                check=True,
+                capture_output=True
+            )
+            os.replace(Path(work_dir) / f"{name}.fmt", format_file)
+
+        for stale_file in self._format_dir.glob("schedule-*.fmt"):
+            if stale_file != format_file:
+                stale_file.unlink(missing_ok=True)
@@ -0,0 +1,205 @@
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from lib.paths import OutputPaths
+from lib.typing.domain.schedule import SchedulePaper
+
+
+class OutputVerification(Enum):
+    """
+    Lists how thoroughly a student's output tree is checked against its manifest.
+    """
+    MANIFEST = "manifest"   # the manifest lists every scheduled paper; no file is touched
+    STAT = "stat"           # ...and every listed file exists with its recorded size
+    DEEP = "deep"           # ...and every listed file hashes to its source's checksum
+
+
+class OutputManifest:
+    """
+    The papers the copy stage placed in a student's output tree.
+
+    The copy stage writes one JSON manifest per student under
+    `Output/manifests/`, listing each destination path with its size and
+    the SHA-256 of the source paper it was made from. Checking whether a
+    schedule was copied compares the scheduled destinations against the
+    manifest instead of walking the student's output tree; the files are
+    only re-stat'ed, or re-hashed, when a `STAT` or `DEEP` verification is
+    asked for, across a thread pool.
+    """
+
+    FORMAT_VERSION = 1
+    CHUNK_SIZE = 1 << 20
+
+    # Source checksums by (path, size, mtime), shared by every manifest of the process
+    _checksums: Dict[Tuple[Path, int, int], str] = {}
+    _checksums_lock = threading.Lock()
+
+    def __init__(self, entries: Dict[str, Tuple[int, str]]):
+        """
+        Args:
+            entries (Dict[str, Tuple[int, str]]): The size and source checksum
+                of each destination path.
+        """
+        self.entries = entries
+
+    @classmethod
+    def from_papers(cls, papers: Iterable[SchedulePaper], max_workers: Optional[int] = None) -> "OutputManifest":
+        """
+        Record the papers that are in place at their destination paths.
+
+        Args:
+            papers (Iterable[SchedulePaper]): The scheduled papers.
+            max_workers (int, optional): Threads hashing the sources.
+
+        Returns:
+            OutputManifest: The manifest of the papers whose destination exists;
+                a paper that could not be placed is left out, so the next check
+                reports the schedule as not copied.
+        """
+        sources = {paper.dest_path: paper.src_path for paper in papers}
+
+        def entry(dest_path: Path) -> Optional[Tuple[str, Tuple[int, str]]]:
+            try:
+                size = dest_path.stat().st_size
+                checksum = cls.source_checksum(sources[dest_path])
+            except OSError:
+                return None
+            return str(dest_path), (size, checksum)
+
+        with ThreadPoolExecutor(max_workers=cls._max_workers(max_workers)) as executor:
+            return cls(dict(filter(None, executor.map(entry, sources))))
+
+    @classmethod
+    def source_checksum(cls, src_path: Path) -> str:
+        """
+        Return the SHA-256 of a source paper, hashing it once per version of the file.
+
+        Args:
+            src_path (Path): The paper under `Resources/`.
+
+        Returns:
+            str: The hex digest of the file's content.
+        """
+        stat = src_path.stat()
+        key = (src_path, stat.st_size, stat.st_mtime_ns)
+
+        with cls._checksums_lock:
+            checksum = cls._checksums.get(key)
+        if checksum is None:
+            checksum = cls._file_checksum(src_path)
+            with cls._checksums_lock:
+                cls._checksums[key] = checksum
+
+        return checksum
+
+    def verify(
+        self,
+        papers: Iterable[SchedulePaper],
+        verification: OutputVerification = OutputVerification.MANIFEST,
+        max_workers: Optional[int] = None
+    ) -> bool:
+        """
+        Check the papers' destinations against the manifest.
+
+        Args:
+            papers (Iterable[SchedulePaper]): The scheduled papers.
+            verification (OutputVerification): How thoroughly to check the files.
+            max_workers (int, optional): Threads checking the files.
+
+        Returns:
+            bool: True if every paper is listed and, as asked, in place on disk.
+        """
+        dest_paths = [str(paper.dest_path) for paper in papers]
+        if not all(dest_path in self.entries for dest_path in dest_paths):
+            return False
+        if verification is OutputVerification.MANIFEST:
+            return True
+
+        deep = verification is OutputVerification.DEEP
+
+        def check(dest_path: str) -> bool:
+            size, checksum = self.entries[dest_path]
+            try:
+                if os.stat(dest_path).st_size != size:
+                    return False
+                return not deep or self._file_checksum(Path(dest_path)) == checksum
+            except OSError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=self._max_workers(max_workers)) as executor:
+            return all(executor.map(check, set(dest_paths)))
+
+    def save(self, student_id: str) -> Path:
+        """
+        Atomically write the manifest under the output directory.
+
+        Args:
+            student_id (str): The student's ID.
+
+        Returns:
+            Path: The manifest file.
+        """
+        file_path = OutputPaths().manifest_file(student_id)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = file_path.with_suffix(".tmp")
+
+        with tmp_file.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.FORMAT_VERSION,
+                    "files": {
+                        dest_path: [size, checksum]
+                        for dest_path, (size, checksum) in sorted(self.entries.items())
+                    },
+                },
+                f,
+                separators=(",", ":")
+            )
+
+        os.replace(tmp_file, file_path)
+        return file_path
+
+    @classmethod
+    def load(cls, student_id: str) -> Optional["OutputManifest"]:
+        """
+        Load a student's manifest.
+
+        Args:
+            student_id (str): The student's ID.
+
+        Returns:
+            Optional[OutputManifest]: The manifest, or None if there is no
+                readable manifest of the current format.
+        """
+        file_path = OutputPaths().manifest_file(student_id)
+        try:
+            with file_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"[OutputManifest] Could not read manifest {file_path.name}: {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != cls.FORMAT_VERSION:
+            return None
+
+        return cls({dest_path: (size, checksum) for dest_path, (size, checksum) in data["files"].items()})
+
+    @classmethod
+    def _file_checksum(cls, file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with file_path.open("rb") as f:
+            while chunk := f.read(cls.CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _max_workers(max_workers: Optional[int]) -> int:
+        # Stat'ing and hashing files is mostly waiting on the disk
+        return max_workers or min(32, (os.cpu_count() or 1) * 4)
@@ -0,0 +1,127 @@
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+import os
+from pathlib import Path
+import shutil
+import threading
+from typing import Dict, Iterable, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from lib.constants import OUTPUT_LINK_MODE
+from lib.typing.domain.schedule import SchedulePaper
+
+
+class OutputLinkMode(Enum):
+    """
+    Lists the ways papers are materialised in the output directory.
+    """
+    LINK = "link"
+    COPY = "copy"
+
+
+class OutputMaterialiser:
+    """
+    Materialises scheduled papers from `Resources/` into the students'
+    output trees.
+
+    Each paper is reflinked where the filesystem supports it (a copy-on-write
+    clone, e.g. on Btrfs or XFS), else copied; link mode also tries a
+    hardlink before copying, so a paper shared by hundreds of students is
+    stored once. Once reflinking or hardlinking fails with anything but a
+    missing source, it is not tried again by this materialiser. Files are
+    placed across a thread pool; a destination that already exists is left
+    as it is.
+    """
+
+    # ioctl request cloning a whole file on Linux (FICLONE)
+    FICLONE = 0x40049409
+
+    def __init__(self, mode: Optional[OutputLinkMode] = None, max_workers: Optional[int] = None):
+        """
+        Args:
+            mode (OutputLinkMode, optional): How to place the papers. Defaults to
+                the THINKE_OUTPUT_LINK_MODE setting.
+            max_workers (int, optional): Threads placing files. Defaults to four
+                per CPU, at most 32; placing a file is mostly waiting on the disk.
+        """
+        self._mode = mode or OutputLinkMode(OUTPUT_LINK_MODE.lower())
+        self._max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        # Cleared by whichever pool thread first finds the method unsupported
+        self._fallback_lock = threading.Lock()
+        self._reflink_supported = fcntl is not None
+        self._hardlink_supported = self._mode is OutputLinkMode.LINK
+
+    def materialise(self, papers: Iterable[SchedulePaper]) -> Dict[str, int]:
+        """
+        Place every paper at its destination path.
+
+        Args:
+            papers (Iterable[SchedulePaper]): The papers to place.
+
+        Returns:
+            Dict[str, int]: How many files were placed by each method
+                ('reflink', 'hardlink', 'copy'), already 'existing' or 'failed'.
+        """
+        # A destination is written once, even if several papers point to it
+        sources = {paper.dest_path: paper.src_path for paper in papers}
+
+        for parent in {dest.parent for dest in sources}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            return dict(Counter(executor.map(self._materialise_file, sources.values(), sources.keys())))
+
+    def _materialise_file(self, src: Path, dst: Path) -> str:
+        """Place one file, returning the method that placed it."""
+        if dst.exists():
+            return "existing"
+
+        try:
+            if self._reflink_supported and self._reflink(src, dst):
+                return "reflink"
+            if self._hardlink_supported and self._hardlink(src, dst):
+                return "hardlink"
+
+            shutil.copy2(src, dst)
+            return "copy"
+        except FileExistsError:
+            return "existing"
+        except OSError as e:
+            print(f"[OutputMaterialiser] Error copying file {src} to {dst}: {e}")
+            return "failed"
+
+    def _reflink(self, src: Path, dst: Path) -> bool:
+        """Clone src to dst, returning False if the filesystem cannot."""
+        with src.open("rb") as src_file:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+            try:
+                fcntl.ioctl(dst_fd, self.FICLONE, src_file.fileno())
+            except OSError:
+                os.close(dst_fd)
+                dst.unlink(missing_ok=True)
+                with self._fallback_lock:
+                    self._reflink_supported = False
+                return False
+            os.close(dst_fd)
+
+        shutil.copystat(src, dst)
+        return True
+
+    def _hardlink(self, src: Path, dst: Path) -> bool:
+        """Hardlink dst to src, returning False if the filesystem cannot."""
+        try:
+            os.link(src, dst)
+        except (FileExistsError, FileNotFoundError):
+            raise
+        except OSError:
+            # e.g. Output/ on another device, or too many links to the file
+            with self._fallback_lock:
+                self._hardlink_supported = False
+            return False
+
+        return True
@@ -0,0 +1,294 @@
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import fitz
+
+from lib.typing.domain.schedule import DailySchedule, ExamSchedule, MonthlySchedule
+from lib.utils import LibUtils
+
+
+class PyMuPdfScheduleDocument:
+    """
+    The PDF schedule drawn directly with PyMuPDF, without LaTeX.
+
+    Reproduces the layout of the LaTeX schedule: an A3 landscape page with
+    the header block, then one table per month with a Date column and one
+    column per subject, the pen icon marking each study day's subject, the
+    month repeated as a "(cont.)" header on every following page and a
+    closing footer. Everything is drawn in-process, so a schedule renders
+    in milliseconds.
+
+    The lines of a page are collected in one `fitz.Shape` and its text in one
+    `fitz.TextWriter`, each written to the page once. The pen icon is
+    embedded once per document and every other placement reuses it.
+    """
+
+    # Bump whenever the drawing changes, so stored source hashes go stale
+    LAYOUT_VERSION = 1
+
+    PAGE_RECT = fitz.paper_rect("a3-l")
+    MARGIN = 36                       # 0.5in
+    DATE_COLUMN_WIDTH = 70.87         # 2.5cm
+    SUBJECT_COLUMN_WIDTH = 76.54      # 2.7cm
+    ROW_HEIGHT = 34
+    ICON_SIZE = 22.68                 # 0.8cm
+    LINE_WIDTH = 0.4
+
+    BOLD_FONT = "hebo"
+    BOLD_ITALIC_FONT = "hebi"
+
+    # Fonts and their glyph advances, shared by every document of the process
+    _fonts: Dict[str, fitz.Font] = {}
+    _advances: Dict[str, Dict[str, float]] = {}
+
+    def __init__(self, schedule: ExamSchedule, icon_path: Path):
+        """
+        Args:
+            schedule (ExamSchedule): The schedule to draw.
+            icon_path (Path): The pen icon marking a subject's study day.
+        """
+        self._schedule = schedule
+        self._icon_path = icon_path
+
+        # Same subject order and month/day order as the LaTeX document
+        self._subjects = sorted({
+            ds.subject
+            for ms in schedule.monthly_schedules
+            for ds in ms.daily_schedules
+        })
+        self._months: List[Tuple[MonthlySchedule, List[DailySchedule]]] = [
+            (ms, sorted(ms.daily_schedules, key=lambda d: datetime.strptime(d.day, "%d-%m-%y")))
+            for ms in sorted(
+                schedule.monthly_schedules,
+                key=lambda ms: min(datetime.strptime(ds.day, "%d-%m-%y") for ds in ms.daily_schedules)
+            )
+        ]
+
+        table_width = self.DATE_COLUMN_WIDTH + self.SUBJECT_COLUMN_WIDTH * len(self._subjects)
+        self._table_left = (self.PAGE_RECT.width - table_width) / 2
+        self._column_edges = [self._table_left, self._table_left + self.DATE_COLUMN_WIDTH] + [
+            self._table_left + self.DATE_COLUMN_WIDTH + self.SUBJECT_COLUMN_WIDTH * (i + 1)
+            for i in range(len(self._subjects))
+        ]
+
+        self._doc: Optional[fitz.Document] = None
+        self._page: Optional[fitz.Page] = None
+        self._shape: Optional[fitz.Shape] = None
+        self._writer: Optional[fitz.TextWriter] = None
+        self._icon_rects: List[fitz.Rect] = []
+        self._y = 0.0
+        self._table_top = 0.0
+        self._icon_xref = 0
+
+    def dumps(self) -> str:
+        """
+        Describe everything drawn on the schedule as text.
+
+        Returns:
+            str: The layout version followed by the header and every table row,
+                the PyMuPDF counterpart of the LaTeX source for content hashing.
+        """
+        lines = [
+            f"pymupdf-schedule v{self.LAYOUT_VERSION}",
+            self._schedule.student_info.name,
+            self._date_range(),
+            str(self._total_papers()),
+            "|".join(self._subjects),
+        ]
+        for ms, days in self._months:
+            lines.append(f"{ms.month} {ms.year}")
+            lines.extend(f"{ds.day}|{ds.subject}" for ds in days)
+
+        return "\n".join(lines)
+
+    def save(self, path: Path) -> None:
+        """
+        Draw the schedule and write it as a PDF.
+
+        Args:
+            path (Path): Where to write the PDF.
+        """
+        self._doc = fitz.open()
+        self._new_page()
+        self._draw_header()
+
+        for ms, days in self._months:
+            self._draw_month(ms, days)
+
+        self._finish_page()
+        self._doc.save(str(path), garbage=3, deflate=True)
+        self._doc.close()
+        self._doc = self._page = self._shape = self._writer = None
+
+    def _total_papers(self) -> int:
+        return sum(len(ds.papers) for ms in self._schedule.monthly_schedules for ds in ms.daily_schedules)
+
+    def _date_range(self) -> str:
+        all_days = [datetime.strptime(ds.day, "%d-%m-%y") for _, days in self._months for ds in days]
+        return f"{min(all_days).strftime('%d %B %Y')} - {max(all_days).strftime('%d %B %Y')}"
+
+    def _new_page(self) -> None:
+        if self._page is not None:
+            self._finish_page()
+
+        self._page = self._doc.new_page(width=self.PAGE_RECT.width, height=self.PAGE_RECT.height)
+        self._shape = self._page.new_shape()
+        self._writer = fitz.TextWriter(self._page.rect)
+        self._icon_rects = []
+        self._y = self.MARGIN
+
+    def _finish_page(self) -> None:
+        """Write the page's lines and text, then place its pen icons."""
+        self._shape.commit()
+        self._writer.write_text(self._page)
+
+        for rect in self._icon_rects:
+            if self._icon_xref:
+                # Reuses the image already embedded in the document
+                self._page.insert_image(rect, xref=self._icon_xref)
+            else:
+                self._icon_xref = self._page.insert_image(rect, filename=str(self._icon_path))
+
+    def _draw_header(self) -> None:
+        """Draw the title block above the first month."""
+        center = self.PAGE_RECT.width / 2
+
+        self._y += 20.74
+        self._centered_text("Exam Preparation Schedule", center, self._y, self.BOLD_FONT, 20.74)
+        self._y += 26
+        self._centered_text(self._date_range(), center, self._y, self.BOLD_FONT, 14.4)
+        self._y += 22
+        self._centered_text(f"Total number of papers: {self._total_papers()}", center, self._y, self.BOLD_ITALIC_FONT, 10)
+        self._y += 34
+        self._centered_text(self._schedule.student_info.name, center, self._y, self.BOLD_FONT, 17.28)
+        self._y += 6
+
+        rule_width = (self.PAGE_RECT.width - 2 * self.MARGIN) * 0.4
+        self._shape.draw_line(
+            fitz.Point(center - rule_width / 2, self._y),
+            fitz.Point(center + rule_width / 2, self._y)
+        )
+        self._shape.finish(width=self.LINE_WIDTH, color=(0, 0, 0))
+        self._y += 28
+
+    def _draw_month(self, ms: MonthlySchedule, days: List[DailySchedule]) -> None:
+        """Draw a month's table, continuing it on new pages as needed."""
+        title = f"{ms.month} {ms.year}"
+        footer_height = self.ROW_HEIGHT
+
+        # Keep the month header together with at least its first day
+        if self._y + 3 * self.ROW_HEIGHT + footer_height > self.PAGE_RECT.height - self.MARGIN:
+            self._new_page()
+        self._draw_table_header(title)
+
+        for ds in days:
+            if self._y + self.ROW_HEIGHT + footer_height > self.PAGE_RECT.height - self.MARGIN:
+                self._draw_footer("Continued to next page...")
+                self._new_page()
+                self._draw_table_header(f"{title} (cont.)")
+
+            self._draw_day(ds)
+
+        self._draw_footer(f"End of schedule for {title}")
+        self._y += 14
+
+    def _draw_table_header(self, title: str) -> None:
+        """Draw the month title row spanning the table, then the column titles."""
+        left, right = self._column_edges[0], self._column_edges[-1]
+        self._table_top = self._y
+
+        self._shape.draw_line(fitz.Point(left, self._y), fitz.Point(right, self._y))
+        self._centered_text(title, (left + right) / 2, self._y + self.ROW_HEIGHT / 2 + 6, self.BOLD_ITALIC_FONT, 17.28)
+        self._end_row()
+
+        titles = ["Date", *self._subjects]
+        for title, x0, x1 in zip(titles, self._column_edges, self._column_edges[1:]):
+            self._wrapped_text(title, x0, x1, self._y, self.ROW_HEIGHT, self.BOLD_FONT, 12)
+        self._end_row()
+
+    def _draw_day(self, ds: DailySchedule) -> None:
+        """Draw a study day's row with the pen icon in its subject's column."""
+        self._wrapped_text(
+            LibUtils.format_date_with_weekday(ds.day),
+            self._column_edges[0], self._column_edges[1],
+            self._y, self.ROW_HEIGHT, self.BOLD_ITALIC_FONT, 9
+        )
+
+        if ds.subject in self._subjects:
+            column = self._subjects.index(ds.subject) + 1
+            x_center = (self._column_edges[column] + self._column_edges[column + 1]) / 2
+            y_center = self._y + self.ROW_HEIGHT / 2
+            self._icon_rects.append(fitz.Rect(
+                x_center - self.ICON_SIZE / 2, y_center - self.ICON_SIZE / 2,
+                x_center + self.ICON_SIZE / 2, y_center + self.ICON_SIZE / 2
+            ))
+
+        self._end_row()
+
+    def _end_row(self) -> None:
+        """Draw the bottom border of the current table row and move below it."""
+        self._y += self.ROW_HEIGHT
+        self._shape.draw_line(
+            fitz.Point(self._column_edges[0], self._y),
+            fitz.Point(self._column_edges[-1], self._y)
+        )
+
+    def _draw_footer(self, text: str) -> None:
+        """Close the table's column borders, then draw a right-aligned footer line under it."""
+        # The outer borders span the title row; the column separators start below it
+        for index, x in enumerate(self._column_edges):
+            top = self._table_top if index in (0, len(self._column_edges) - 1) else self._table_top + self.ROW_HEIGHT
+            self._shape.draw_line(fitz.Point(x, top), fitz.Point(x, self._y))
+        self._shape.finish(width=self.LINE_WIDTH, color=(0, 0, 0))
+
+        size = 12
+        width = self._text_width(text, self.BOLD_ITALIC_FONT, size)
+        self._writer.append(
+            fitz.Point(self._column_edges[-1] - width, self._y + 20),
+            text,
+            font=self._font(self.BOLD_ITALIC_FONT),
+            fontsize=size
+        )
+        self._y += self.ROW_HEIGHT
+
+    def _centered_text(self, text: str, x_center: float, baseline: float, font: str, size: float) -> None:
+        width = self._text_width(text, font, size)
+        self._writer.append(fitz.Point(x_center - width / 2, baseline), text, font=self._font(font), fontsize=size)
+
+    def _wrapped_text(self, text: str, x0: float, x1: float, top: float, height: float, font: str, size: float) -> None:
+        """Draw text centered in a cell, wrapped at word boundaries to the cell width."""
+        max_width = x1 - x0 - 4
+        lines: List[str] = []
+
+        for word in text.split():
+            candidate = f"{lines[-1]} {word}" if lines else word
+            if lines and self._text_width(candidate, font, size) <= max_width:
+                lines[-1] = candidate
+            else:
+                lines.append(word)
+
+        line_height = size * 1.2
+        baseline = top + (height - line_height * len(lines)) / 2 + size
+        for line in lines:
+            self._centered_text(line, (x0 + x1) / 2, baseline, font, size)
+            baseline += line_height
+
+    @classmethod
+    def _font(cls, name: str) -> fitz.Font:
+        font = cls._fonts.get(name)
+        if font is None:
+            font = cls._fonts[name] = fitz.Font(name)
+        return font
+
+    @classmethod
+    def _text_width(cls, text: str, font: str, size: float) -> float:
+        """Width of a line of text, summed from cached per-character advances."""
+        advances = cls._advances.setdefault(font, {})
+        width = 0.0
+        for char in text:
+            advance = advances.get(char)
+            if advance is None:
+                advance = advances[char] = cls._font(font).glyph_advance(ord(char))
+            width += advance
+        return width * size
@@ -1,41 +1,224 @@
+from enum import Enum
+import hashlib
 from pathlib import Path
 import shutil
 import os
-import time
+import subprocess
+import tempfile
+from typing import Optional, Tuple, Union
 from pylatex import Document, LongTable, MultiColumn, Center
 from pylatex.utils import NoEscape, bold, italic
 from pylatex.package import Package
 from datetime import datetime
-from lib.constants import BASE_DIR
+from lib.constants import BASE_DIR, PDF_PREAMBLE_FORMAT, PDF_RENDERER
 from lib.typing.domain.schedule import ExamSchedule, SchedulePaper
 from lib.utils import LibUtils
+from scheduler.exam_prep.latex_preamble_format import LatexPreambleFormat
+from scheduler.exam_prep.output_manifest import OutputManifest
+from scheduler.exam_prep.output_materialiser import OutputMaterialiser
+from scheduler.exam_prep.pymupdf_schedule_document import PyMuPdfScheduleDocument
+
+class PdfRenderer(Enum):
+    """
+    Lists the supported schedule PDF renderers.
+    """
+    LATEX = "latex"
+    PYMUPDF = "pymupdf"
+
 
 class ScheduleGenerator:
+    
+    # Pen icon marking a subject's study day in the PDF schedule
+    ICON_PATH = Path(__file__).resolve().parent / 'images' / 'write.png'
    
-    def __init__(self, schedule: ExamSchedule):
+    def __init__(
+        self,
+        schedule: ExamSchedule,
+        use_preamble_format: bool = PDF_PREAMBLE_FORMAT,
+        renderer: Optional[PdfRenderer] = None
+    ):
+        """
+        Args:
+            schedule (ExamSchedule): The schedule to generate.
+            use_preamble_format (bool): Compile from the precompiled preamble format
+                when it can be built.
+            renderer (PdfRenderer, optional): How to render the PDF. Defaults to the
+                THINKE_PDF_RENDERER setting.
+        """
         self._schedule = schedule
+        self._use_preamble_format = use_preamble_format
+        self._renderer = renderer or PdfRenderer(PDF_RENDERER.lower())
                 
     def save_schedule_to_disk(self) -> None:
-        for month_schedule in self._schedule.monthly_schedules:
-            for daily_schedule in month_schedule.daily_schedules:
-                for p in daily_schedule.papers:
-                    p.dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    LibUtils.copy_file(p.src_path, p.dest_path)
+        """
+        Link or copy the schedule's papers into the student's output directory,
+        then record them in the student's output manifest.
+        """
+        papers = [
+            p
+            for month_schedule in self._schedule.monthly_schedules
+            for daily_schedule in month_schedule.daily_schedules
+            for p in daily_schedule.papers
+        ]
+        OutputMaterialiser().materialise(papers)
+        OutputManifest.from_papers(papers).save(self._schedule.student_info.id)
     
-    def generate_pdf_schedule(self) -> None:
-        schedule = self._schedule
+    def generate_pdf_schedule(self) -> bool:
+        """
+        Render the schedule's PDF and move it into place, unless it is up to date.
+
+        The SHA-256 of the rendered source (the LaTeX source, or the PyMuPDF
+        layout description) is stored beside the PDF; when it matches the
+        current source, rendering is skipped, so only students whose schedule
+        (or the layout) changed are rebuilt.
+
+        Every build runs in a private temporary directory next to the PDF, which
+        holds its own copy of the pen icon and LaTeX's auxiliary files, so any
+        number of builds can run in parallel. The finished PDF is then renamed
+        over the target, so readers never see a partially written file.
+
+        LaTeX builds start from the precompiled preamble format when available; if
+        the build fails, it is retried without the format, and the format is only
+        discarded if that retry succeeds.
+
+        Returns:
+            bool: True if the PDF was rendered, False if it was already up to date.
+        """
+        pdf_path = self.pdf_path
         
         # Guarantee that the generated pdf parent dir exist
-        schedule.generated_pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        pdf_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        doc, source = self._build_source()
+        source_hash = self._source_hash(source)
+        
+        if pdf_path.exists() and self._read_stored_hash() == source_hash:
+            return False
+        
+        with tempfile.TemporaryDirectory(prefix='.render-', dir=pdf_path.parent) as work_dir:
+            # The full name: a student's name may contain dots, e.g. 'J. Smith'
+            work_path = Path(work_dir) / self._schedule.generated_pdf_path.name
+            work_pdf_path = work_path.with_name(work_path.name + '.pdf')
+            
+            if self._renderer is PdfRenderer.PYMUPDF:
+                doc.save(work_pdf_path)
+            else:
+                self._compile_latex(doc, source, work_path)
+            
+            os.replace(work_pdf_path, pdf_path)
+        
+        # Only stamp the hash once the PDF it describes is in place
+        tmp_hash_path = self.hash_path.with_name(self.hash_path.name + '.tmp')
+        tmp_hash_path.write_text(source_hash, encoding='utf-8')
+        os.replace(tmp_hash_path, self.hash_path)
+        
+        return True
+    
+    def _build_source(self) -> Tuple[Union[Document, PyMuPdfScheduleDocument], str]:
+        """Build the document of the selected renderer, and the source its hash is taken of."""
+        if self._renderer is PdfRenderer.PYMUPDF:
+            doc = PyMuPdfScheduleDocument(self._schedule, self.ICON_PATH)
+        else:
+            doc = self.build_document()
+        
+        return doc, doc.dumps()
+    
+    def _compile_latex(self, doc: Document, source: str, work_path: Path) -> None:
+        """Compile the LaTeX document in its work directory, from the preamble format if possible."""
+        shutil.copy2(self.ICON_PATH, work_path.parent / self.ICON_PATH.name)
+        preamble_format = self._get_preamble_format(source)
+        
+        try:
+            self._compile(doc, work_path, preamble_format)
+        except subprocess.CalledProcessError:
+            if preamble_format is None:
+                raise
+            # An error in the document itself fails this compile too, and keeps the format
+            self._compile(doc, work_path, None)
+            
+            # Only the format failed, e.g. it was dumped by another TeX version; rebuilt on next use
+            LatexPreambleFormat.instance().discard(preamble_format)
+    
+    def preamble_format(self) -> Optional[Path]:
+        """
+        Return the precompiled format of the schedule's preamble, dumping it on first use.
+
+        Returns:
+            Optional[Path]: The format file, or None if formats are disabled or unavailable,
+                or the PDF is not rendered with LaTeX.
+        """
+        if self._renderer is not PdfRenderer.LATEX:
+            return None
+        
+        return self._get_preamble_format(self.build_document().dumps())
+    
+    def _get_preamble_format(self, source: str) -> Optional[Path]:
+        if not self._use_preamble_format:
+            return None
+        
+        return LatexPreambleFormat.instance().get(source[:source.index('\\begin{document}')])
+    
+    @staticmethod
+    def _compile(doc: Document, work_path: Path, preamble_format: Optional[Path]) -> None:
+        doc.generate_pdf(
+            str(work_path), 
+            compiler='pdflatex', 
+            compiler_args=[f'-fmt={preamble_format}'] if preamble_format else [],
+            clean_tex=True
+        )
+    
+    @property
+    def pdf_path(self) -> Path:
+        """Where the schedule's PDF is generated."""
+        generated_pdf_path = self._schedule.generated_pdf_path
+        return generated_pdf_path.with_name(generated_pdf_path.name + '.pdf')
+    
+    @property
+    def hash_path(self) -> Path:
+        """The file beside the PDF holding the hash of the source it was rendered from."""
+        generated_pdf_path = self._schedule.generated_pdf_path
+        return generated_pdf_path.with_name(generated_pdf_path.name + '.sha256')
+    
+    def pdf_up_to_date(self) -> bool:
+        """
+        Check if the schedule's PDF exists and was rendered from the current source.
+
+        Returns:
+            bool: True if the PDF does not need to be regenerated.
+        """
+        if not self.pdf_path.exists():
+            return False
+        
+        return self._read_stored_hash() == self._source_hash(self._build_source()[1])
+    
+    def _read_stored_hash(self) -> str | None:
+        try:
+            return self.hash_path.read_text(encoding='utf-8').strip()
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _source_hash(source: str) -> str:
+        return hashlib.sha256(source.encode('utf-8')).hexdigest()
+    
+    def build_document(self) -> Document:
+        """
+        Build the LaTeX document of the schedule.
+
+        The pen icon is referenced by file name, relative to the build directory.
+
+        Returns:
+            Document: The schedule's document.
+        """
+        schedule = self._schedule
             
-        # Extract unique subjects
+        # Extract unique subjects, in a stable order so the source hash is reproducible
         subject_set = {
             ds.subject
             for ms in schedule.monthly_schedules
             for ds in ms.daily_schedules
         }
-        subjects = list(subject_set)
+        subjects = sorted(subject_set)
 
         # Count total papers
         total_papers = sum(
@@ -68,13 +251,6 @@ class ScheduleGenerator:
         doc.packages.append(NoEscape(r'\pagestyle{empty}'))
         doc.packages.append(NoEscape(r'\raggedbottom'))
 
-        # Copy the pen icon to the output directory
-        cwd = Path(__file__).resolve().parent
-        img_src = cwd / 'images'
-        icon_src = img_src / 'write.png'
-        icon_dest = schedule.generated_pdf_path.parent / 'write.png'
-        LibUtils.copy_file(icon_src, icon_dest)
-    
         # Header block
         doc.append(NoEscape(r'''
         \begin{center}
@@ -151,7 +327,7 @@ class ScheduleGenerator:
             table.end_table_last_footer()
 
             # Daily rows sorted by date
-            icon_filename = 'write.png'
+            icon_filename = self.ICON_PATH.name
             icon_cmd = NoEscape(r'\includegraphics[width=0.8cm, height=0.8cm]{' + icon_filename + r'}')
             
             sorted_days = sorted(
@@ -170,12 +346,5 @@ class ScheduleGenerator:
             # Center the table
             with doc.create(Center()) as centered:
                 centered.append(table)
-                
-        doc.generate_pdf(
-            schedule.generated_pdf_path, 
-            compiler='pdflatex', 
-            clean_tex=True
-        )
         
-        time.sleep(1)
-        os.remove(icon_dest)
+        return doc
@@ -0,0 +1,92 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+from typing import List, Optional
+
+from lib.constants import PDF_PREAMBLE_FORMAT
+from lib.typing.domain.schedule import ExamSchedule
+from scheduler.exam_prep.schedule_generator import PdfRenderer, ScheduleGenerator
+
+
+def _render_schedule(schedule: ExamSchedule, use_preamble_format: bool, renderer: Optional[PdfRenderer]) -> bool:
+    """Render one schedule's PDF in a worker process, unless it is up to date."""
+    return ScheduleGenerator(schedule, use_preamble_format, renderer).generate_pdf_schedule()
+
+
+class SchedulePdfRenderer:
+    """
+    Renders the PDF schedules of many students across a process pool.
+
+    Every job builds its document and renders it (with `pdflatex` or
+    PyMuPDF) in its own private working directory (see `ScheduleGenerator.generate_pdf_schedule`), so
+    jobs share no files and the pool can be sized to the cores. Rendering a
+    grade then takes roughly as long as its slowest PDF.
+
+    For LaTeX, the precompiled preamble format is dumped once in this process before
+    the jobs start, so workers never race to build it.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        use_preamble_format: bool = PDF_PREAMBLE_FORMAT,
+        renderer: Optional[PdfRenderer] = None
+    ):
+        """
+        Args:
+            max_workers (int, optional): Size of the process pool. Defaults to the
+                number of CPUs; 1 renders everything in this process.
+            use_preamble_format (bool): Compile from the precompiled preamble format
+                when it can be built.
+            renderer (PdfRenderer, optional): How to render the PDFs. Defaults to the
+                THINKE_PDF_RENDERER setting.
+        """
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._use_preamble_format = use_preamble_format
+        self._renderer = renderer
+
+    def render(self, schedules: List[ExamSchedule]) -> int:
+        """
+        Render the PDFs of the given schedules.
+
+        PDFs already rendered from the current source are skipped; a failed
+        build is reported and does not stop the others.
+
+        Args:
+            schedules (List[ExamSchedule]): The schedules to render.
+
+        Returns:
+            int: The number of PDFs rendered.
+        """
+        workers = min(self._max_workers, len(schedules))
+        rendered = 0
+
+        use_preamble_format = bool(
+            schedules
+            and self._use_preamble_format
+            and ScheduleGenerator(schedules[0], renderer=self._renderer).preamble_format() is not None
+        )
+
+        if workers <= 1:
+            for schedule in schedules:
+                try:
+                    rendered += _render_schedule(schedule, use_preamble_format, self._renderer)
+                except Exception as e:
+                    self._report_failure(schedule, e)
+            return rendered
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(_render_schedule, schedule, use_preamble_format, self._renderer): schedule
+                for schedule in schedules
+            }
+            for future in as_completed(futures):
+                try:
+                    rendered += future.result()
+                except Exception as e:
+                    self._report_failure(futures[future], e)
+
+        return rendered
+
+    @staticmethod
+    def _report_failure(schedule: ExamSchedule, error: Exception) -> None:
+        print(f"[SchedulePdfRenderer] Could not render the schedule of {schedule.student_info.name}: {error}")
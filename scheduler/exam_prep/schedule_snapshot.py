@@ -0,0 +1,297 @@
+from collections import defaultdict
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+from urllib.parse import urlparse
+
+from data.schedules.resources_index import ResourcesIndex
+from data.students.student_data_reader import StudentDataReader
+from lib.paths import OutputPaths, ResourcesPaths
+from lib.typing.domain.schedule import (
+    DailySchedule,
+    DownloadedPastPaperMetadata,
+    ExamSchedule,
+    MonthlySchedule,
+    SchedulePaper,
+    ScheduledPastPaperMetadata,
+    StudentInfo,
+    date_ordinal,
+)
+from lib.typing.domain.student import Student
+from lib.utils import LibUtils
+from scheduler.exam_prep.output_manifest import OutputManifest, OutputVerification
+
+
+class ScheduleSnapshot:
+    """
+    A student's scheduled papers, serialized once by the scheduling stage.
+
+    The scheduling stage writes one JSON snapshot per student under
+    `Output/snapshots/`. The copy, PDF and send stages load it directly and
+    rebuild the `ExamSchedule` from it, without loading the past paper
+    catalog, the grade's scheduling context or the student store.
+
+    A snapshot records the format version it was written with and the
+    store's version of the student's schedule records it was taken from;
+    a snapshot of another format, or whose records have changed in the
+    store since, is treated as missing.
+    """
+
+    FORMAT_VERSION = 1
+    RECORD_FIELDS = ("date", "grade", "subject", "year", "session", "paper", "url")
+
+    def __init__(
+        self,
+        student: Student,
+        records: List[ScheduledPastPaperMetadata],
+        records_version: Optional[tuple] = None
+    ):
+        """
+        Args:
+            student (Student): The scheduled student.
+            records (List[ScheduledPastPaperMetadata]): The student's scheduled records,
+                sorted by date.
+            records_version (tuple, optional): The store's version of those records.
+        """
+        self.student = student
+        self.records = records
+        self.records_version = records_version
+        self._exam_schedule: Optional[ExamSchedule] = None
+        self._records_by_day: Optional[Dict[str, List[ScheduledPastPaperMetadata]]] = None
+
+    @property
+    def exam_schedule(self) -> ExamSchedule:
+        """The student's schedule, grouped by month, day and subject."""
+        if self._exam_schedule is None:
+            self._exam_schedule = self._build_schedule()
+        return self._exam_schedule
+
+    def records_by_day(self, day: str) -> List[ScheduledPastPaperMetadata]:
+        """
+        Return the records scheduled on a day.
+
+        Args:
+            day (str): The study day, as 'dd-mm-yy'.
+
+        Returns:
+            List[ScheduledPastPaperMetadata]: The day's records.
+        """
+        if self._records_by_day is None:
+            self._records_by_day = defaultdict(list)
+            for record in self.records:
+                self._records_by_day[record.date].append(record)
+
+        return list(self._records_by_day.get(day, []))
+
+    def schedule_papers(self) -> List[SchedulePaper]:
+        """Return every paper of the schedule, in schedule order."""
+        return [
+            paper
+            for ms in self.exam_schedule.monthly_schedules
+            for ds in ms.daily_schedules
+            for paper in ds.papers
+        ]
+
+    def papers_exist_in_src_dir(self) -> bool:
+        """Check if all the scheduled papers have been downloaded onto disk."""
+        return ResourcesIndex.instance().contains_all(paper.src_path for paper in self.schedule_papers())
+
+    def schedule_pdf_generated(self) -> bool:
+        """Check if the schedule's PDF exists and was compiled from the current schedule."""
+        # Imported here: only this check needs the generator's PDF libraries
+        from scheduler.exam_prep.schedule_generator import ScheduleGenerator
+
+        return ScheduleGenerator(self.exam_schedule).pdf_up_to_date()
+
+    def schedule_copied_to_output_dir(
+        self,
+        verification: OutputVerification = OutputVerification.MANIFEST
+    ) -> bool:
+        """
+        Check if every scheduled paper has been copied to the output directory.
+
+        Args:
+            verification (OutputVerification): How thoroughly to check the copied
+                files; by default only the copy stage's manifest is read.
+
+        Returns:
+            bool: True if the student's manifest lists every scheduled paper and,
+                as asked, the files on disk match it.
+        """
+        manifest = OutputManifest.load(self.student.id)
+        if manifest is None:
+            return False
+
+        return manifest.verify(self.schedule_papers(), verification)
+
+    def save_output_manifest(self) -> Path:
+        """
+        Record the scheduled papers that are in place in the output directory.
+
+        Returns:
+            Path: The manifest file.
+        """
+        return OutputManifest.from_papers(self.schedule_papers()).save(self.student.id)
+
+    def save(self) -> Path:
+        """
+        Atomically write the snapshot under the output directory.
+
+        Returns:
+            Path: The snapshot file.
+        """
+        file_path = OutputPaths().snapshot_file(self.student.id)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = file_path.with_suffix(".tmp")
+
+        with tmp_file.open("w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": self.FORMAT_VERSION,
+                    "records_version": list(self.records_version) if self.records_version else None,
+                    "student": {
+                        "id": self.student.id,
+                        "name": self.student.name,
+                        "phone": self.student.phone,
+                        "grade": self.student.grade,
+                        "subjects": self.student.subjects,
+                    },
+                    "records": [
+                        [getattr(record, field) for field in self.RECORD_FIELDS]
+                        for record in self.records
+                    ],
+                },
+                f,
+                separators=(",", ":")
+            )
+
+        os.replace(tmp_file, file_path)
+        return file_path
+
+    @classmethod
+    def load(cls, student_id: str) -> Optional["ScheduleSnapshot"]:
+        """
+        Load a student's snapshot.
+
+        Args:
+            student_id (str): The student's ID.
+
+        Returns:
+            Optional[ScheduleSnapshot]: The snapshot, or None if there is no
+                readable, up-to-date snapshot of the current format.
+        """
+        return cls._read(OutputPaths().snapshot_file(student_id), StudentDataReader())
+
+    @classmethod
+    def load_all(cls, grade: Optional[str] = None) -> Iterator["ScheduleSnapshot"]:
+        """
+        Load every stored snapshot, optionally only those of one grade.
+
+        Args:
+            grade (str, optional): The students' grade, e.g. 'EGCSE'.
+
+        Yields:
+            ScheduleSnapshot: The snapshots, ordered by student ID.
+        """
+        snapshots_dir = OutputPaths().snapshots_dir
+        if not snapshots_dir.is_dir():
+            return
+
+        reader = StudentDataReader()
+        for file_path in sorted(snapshots_dir.glob("*.json")):
+            snapshot = cls._read(file_path, reader)
+            if snapshot is not None and (grade is None or snapshot.student.grade == grade):
+                yield snapshot
+
+    @classmethod
+    def _read(cls, file_path: Path, reader: StudentDataReader) -> Optional["ScheduleSnapshot"]:
+        """Read a snapshot file, treating a missing, corrupt, stale-format or outdated one as absent."""
+        try:
+            with file_path.open("r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            if not isinstance(e, FileNotFoundError):
+                print(f"[ScheduleSnapshot] Could not read snapshot {file_path.name}: {e}")
+            return None
+
+        if not isinstance(data, dict) or data.get("version") != cls.FORMAT_VERSION:
+            return None
+
+        student = Student(**data["student"])
+        records_version = data.get("records_version")
+        records_version = tuple(records_version) if records_version else None
+
+        # The records were changed in the store after the snapshot was taken
+        if records_version != reader.get_exam_schedules_version(student.id):
+            print(f"[ScheduleSnapshot] Snapshot of {student.name} is out of date; reschedule to refresh it")
+            return None
+
+        records = []
+        for row in data["records"]:
+            fields = dict(zip(cls.RECORD_FIELDS, row))
+            fields["date_ordinal"] = date_ordinal(fields.pop("date"))
+            records.append(ScheduledPastPaperMetadata(student_id=student.id, **fields))
+
+        return cls(student, records, records_version)
+
+    def _build_schedule(self) -> ExamSchedule:
+        """Group the records by year, month, date and subject into an `ExamSchedule`."""
+        output_paths = OutputPaths()
+        resources_paths = ResourcesPaths()
+
+        # Base path for destination to which the past paper will be copied
+        base_path = output_paths.grade_dir(self.student.grade)
+        generated_pdf_path = output_paths.pdf_dir / f'{self.student.name} - Exam Preparation Schedule'
+
+        # Group by year -> month -> date -> subject
+        grouped = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(list))))
+
+        for r in self.records:
+            # Append the schedule paper object to the grouping
+            if not r.url:
+                continue
+
+            year, month = LibUtils.get_date_parts(r.date)
+            filename = os.path.basename(urlparse(r.url).path)
+
+            src_path = resources_paths.grade_dir(r.grade) / r.subject / r.year / r.session / filename
+            dest_path = base_path / self.student.name / year / month / r.date / r.subject / filename
+
+            grouped[year][month][r.date][r.subject].append(SchedulePaper(
+                paper_metadata=DownloadedPastPaperMetadata(
+                    grade=r.grade,
+                    subject=r.subject,
+                    year=r.year,
+                    session=r.session,
+                    url=r.url,
+                    path=src_path,
+                ),
+                dest_path=dest_path
+            ))
+
+        # Now build the ExamSchedule data structure
+        monthly_schedules = []
+        for year, months in sorted(grouped.items()):
+            for month, dates in sorted(months.items()):
+                daily_schedules = [
+                    DailySchedule(day=date, subject=subject, papers=papers)
+                    for date, subjects in sorted(dates.items())
+                    for subject, papers in sorted(subjects.items())
+                ]
+                monthly_schedules.append(MonthlySchedule(
+                    year=year,
+                    month=month,
+                    daily_schedules=daily_schedules
+                ))
+
+        return ExamSchedule(
+            student_info=StudentInfo(
+                id=self.student.id,
+                name=self.student.name,
+                grade=self.student.grade
+            ),
+            base_path=base_path,
+            generated_pdf_path=generated_pdf_path,
+            monthly_schedules=monthly_schedules
+        )
@@ -3,20 +3,20 @@ from itertools import cycle
 import os
 import re
 from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path, PurePosixPath
 from collections import defaultdict
 from urllib.parse import urlparse
 
-from data.schedules.exam_schedule_data_reader import ExamSchedulerDataReader
+from data.schedules.downloaded_paper_ledger import DownloadedPaperLedger
 from data.students.student_data_writer import StudentDataWriter
 from lib.constants import BASE_DIR
 from lib.exam_council import ExamCouncil
 from lib.grade import EceswaGrade, CambridgeGrade
 from lib.subject import EceswaJcSubject
 from lib.typing.data.schedule import DayOfWeek, ScheduleInputData
-from lib.typing.domain.schedule import DailySchedule, DownloadedPastPaperMetadata, ExamSchedule, MonthlySchedule, SchedulePaper, ScheduledPastPaperMetadata, PastPaperMetadata, StudentInfo
+from lib.typing.domain.schedule import DailySchedule, DownloadedPastPaperMetadata, ExamSchedule, MonthlySchedule, SchedulePaper, ScheduleCursor, ScheduledPastPaperMetadata, PastPaperMetadata, StudentInfo, date_ordinal
 from lib.typing.domain.student import Student, StudentRecord
 from lib.utils import LibUtils
 
@@ -26,7 +26,9 @@ from typing import Dict, List, Any
 
 from lib.typing.data.schedule import ScheduleInputData
 from data.students.student_data_reader import StudentDataReader
-from data.subjects.past_paper_metadata_reader import PastPaperMetadataReader
+from scheduler.exam_prep.grade_scheduling_context import GradeSchedulingContext
+from scheduler.exam_prep.output_manifest import OutputVerification
+from scheduler.exam_prep.schedule_snapshot import ScheduleSnapshot
 
 class ExamScheduler:
     """
@@ -41,35 +43,60 @@ class ExamScheduler:
     - Verifying if a student has a complete schedule.
     """
 
-    def __init__(self, student: Student):
+    def __init__(self, student: Student, context: Optional[GradeSchedulingContext] = None):
         """
         Initialize the ExamScheduler.
+
+        Args:
+            student (Student): The student to schedule for.
+            context (GradeSchedulingContext, optional): The shared context of the
+                student's grade. Built on the spot if not given; pass one in when
+                scheduling many students of the same grade.
         """
         self._student = student
+        self._context = context or GradeSchedulingContext.build(EceswaGrade[self._student.grade])
+        
+        if self._context is None:
+            raise ValueError(f"No exam schedule input data found for grade: {self._student.grade}")
         
         # Readers
         self._student_reader = StudentDataReader()
-        self._schedule_reader = ExamSchedulerDataReader(EceswaGrade[self._student.grade])
         
-        self._input_data = self._schedule_reader.get_schedule_input_data()
-       
-        self._past_paper_readers = {
-                grade.value: PastPaperMetadataReader(grade.value) 
-                for grade in list(list(EceswaGrade) + list(CambridgeGrade))
-        }
+        # Memoized views of the student's stored schedule, rebuilt only when
+        # the store's version of it changes, whoever wrote the records
+        self._scheduled_records_version: Optional[tuple] = None
+        self._scheduled_records: Optional[list[ScheduledPastPaperMetadata]] = None
+        self._snapshot: Optional[ScheduleSnapshot] = None
+        
+        self._input_data = self._context.input_data
         
         # Derived data: subjects + prioritized councils
         self._student_subjects_with_councils = [
             {
-                'subject': council.subject,
-                'councils': [ExamCouncil.from_value(c) for c in council.councils]
+                'subject': subject,
+                'councils': councils
             }
-            for council in self._input_data.prioritized_councils
-            if council.subject in self._student.subjects
+            for subject, councils in self._context.subject_councils.items()
+            if subject in self._student.subjects
         ]
 
         # Paper tracking
         self._assigned_paper_urls = self._load_assigned_paper_urls()
+        
+        # Per-subject position in the context's Cambridge paper groups
+        self._cambridge_group_cursors: Dict[str, int] = {}
+        
+        # Per-(subject, grade) position in the context's ECESWA paper group queues,
+        # and the queues that are exhausted without being resettable
+        self._eceswa_group_cursors: Dict[tuple[str, str], int] = {}
+        self._eceswa_exhausted_queues: set[tuple[str, str]] = set()
+        
+        # Study day being assigned, and the day of the latest ECESWA reset per grade
+        self._current_day: Optional[str] = None
+        self._reset_days: Dict[str, str] = {}
+        
+        # Where the latest rolling-window extension stopped
+        self.schedule_cursor: Optional[ScheduleCursor] = None
    
         # Cached past papers per subject
         self._subject_paper_cache = self._cache_all_subject_papers()
@@ -79,19 +106,30 @@ class ExamScheduler:
         Get all scheduled exam records for the current student,
         sorted by date in ascending order (oldest first).
 
+        The records are read and sorted once and reused until the store's
+        version of the student's schedule changes. Callers must not mutate
+        the returned list.
+
         Returns:
             list[ScheduledPastPaperMetadata]: Sorted scheduled records.
         """
-        records = [
-            record 
-            for record in self._student_reader.get_exam_schedules_by_id(self._student.id)
-            if record.url
-        ]
+        version = self._student_reader.get_exam_schedules_version(self._student.id)
+        
+        if self._scheduled_records is None or version != self._scheduled_records_version:
+            records = [
+                record 
+                for record in self._student_reader.get_exam_schedules_by_id(self._student.id)
+                if record.url
+            ]
+            
+            self._scheduled_records = sorted(
+                records,
+                key=lambda r: r.date_ordinal
+            )
+            self._scheduled_records_version = version
+            self._snapshot = None
 
-        return sorted(
-            records,
-            key=lambda r: datetime.strptime(r.date, "%d-%m-%y")
-        )
+        return self._scheduled_records
     
     def get_scheduled_records_by_day(self, day: str) -> list[ScheduledPastPaperMetadata]:
         return [
@@ -100,52 +138,41 @@ class ExamScheduler:
             if record.date == day
         ]
     
-    def _generate_monthly_schedules(self) -> list[Dict]:
-        """
-        Generate a list of monthly blocks containing valid study days.
-
-        Returns:
-            List[Dict]: A list of dictionaries where each contains a year, month name, and
-                        a list of valid study days formatted as 'dd-mm-yy'.
-        """
-        
-        start_date = datetime.strptime(self._input_data.start_date, "%d-%m-%y")
-        end_date = datetime.strptime(self._input_data.end_date, "%d-%m-%y")
-
-        delta = timedelta(days=1)
-        current = start_date
-        monthly_schedules: Dict[str, Dict] = {}
-
-        while current <= end_date:
-            weekday_name = current.strftime('%A')
-            if weekday_name not in self._input_data.excluded_days:
-                year = current.year
-                month_name = current.strftime('%B')
-                day_formatted = current.strftime('%d-%m-%y')
-
-                key = f"{year}-{month_name}"
-                if key not in monthly_schedules:
-                    monthly_schedules[key] = {
-                        'year': year,
-                        'month': month_name,
-                        'days': []
-                    }
-
-                monthly_schedules[key]['days'].append(day_formatted)
-
-            current += delta
-
-        return list(monthly_schedules.values())
-
-    def _load_assigned_paper_urls(self) -> set[str]:
+    def _load_assigned_paper_urls(self, reset_days: Optional[Dict[str, str]] = None) -> set[str]:
         """
         Load previously assigned past paper URLs for the student.
 
+        Args:
+            reset_days (Dict[str, str], optional): The study day of the latest ECESWA
+                reset per grade. ECESWA papers of that grade assigned before the reset
+                were released by it and are left out.
+
         Returns:
             set[str]: A set of URLs that have already been assigned to avoid duplication.
         """
-  
-        return { record.url for record in self._get_scheduled_records() }
+        if not reset_days:
+            return { record.url for record in self._get_scheduled_records() }
+        
+        released_before = {
+            grade: (
+                date_ordinal(day),
+                {
+                    url
+                    for subject in self._student.subjects
+                    for url in self._context.eceswa_paper_urls.get(subject, {}).get(grade, frozenset())
+                }
+            )
+            for grade, day in reset_days.items()
+        }
+        
+        assigned_urls = set()
+        for record in self._get_scheduled_records():
+            reset = released_before.get(record.grade)
+            if reset and record.url in reset[1] and record.date_ordinal < reset[0]:
+                continue
+            assigned_urls.add(record.url)
+        
+        return assigned_urls
 
     def _get_subject_papers(self, subject: str) -> List[PastPaperMetadata]:
         """
@@ -162,21 +189,16 @@ class ExamScheduler:
 
     def _cache_all_subject_papers(self) -> Dict[str, Dict[str, List[PastPaperMetadata]]]:
         """
-        Load and cache all past papers for the student's subjects across all available readers.
+        Borrow the cached past papers of the student's subjects from the grade context.
 
         Returns:
             Dict[str, Dict[str, List[PastPaperMetadata]]]: Nested dictionary of cached papers
             by subject and grade.
         """
-        
-        cache: Dict[str, Dict[str, List[PastPaperMetadata]]] = {}
-        for subject in self._student.subjects:
-            cache[subject] = {}
-            for grade_key, reader in self._past_paper_readers.items():
-                papers = reader.get_subject_metadata(subject)
-                if papers:
-                    cache[subject][grade_key] = papers
-        return cache
+        return {
+            subject: self._context.subject_papers.get(subject, {})
+            for subject in self._student.subjects
+        }
 
     def _get_next_cambridge_igcse_unassigned_paper(
         self,
@@ -186,7 +208,10 @@ class ExamScheduler:
         Return the next unassigned Cambridge IGCSE paper group for a subject.
 
         Papers are grouped by grade, subject, year, session, and filename stem to ensure
-        related documents (e.g., QP and IN) are assigned together.
+        related documents (e.g., QP and IN) are assigned together. The groups are
+        precomputed once per grade; a per-subject cursor skips past groups that are
+        already (partly) assigned. Cambridge URLs are never released again, so a
+        skipped group can never become eligible later and the cursor only moves forward.
 
         Args:
             subject (str): The subject to fetch papers for.
@@ -195,39 +220,20 @@ class ExamScheduler:
             List[PastPaperMetadata]: A list of unassigned papers in the next group, or empty if none are found.
         """
         
-        grade = CambridgeGrade.IGCSE.value
-        all_papers = self._subject_paper_cache.get(subject, {}).get(grade, [])
-        grouped_papers = defaultdict(list)
-
-        def extract_group_key(paper: PastPaperMetadata) -> Optional[str]:
-            try:
-                filename = PurePosixPath(paper.url).name
-                normalized = re.sub(r'_(qp|in)_', '_', filename)
-                return f"{paper.grade}::{paper.subject}::{paper.year}::{paper.session}::{normalized}"
-            except Exception:
-                return []
-
-        # Group papers by metadata + normalized filename stem
-        for paper in all_papers:
-            key = extract_group_key(paper)
-            if key:
-                grouped_papers[key].append(
-                    PastPaperMetadata(
-                        grade=paper.grade,
-                        subject=paper.subject,
-                        year=paper.year,
-                        session=paper.session,
-                        url=paper.url,
-                        paper=LibUtils.extract_paper_label(paper.url)
-                    )
-                )
-
-        for paper_group in grouped_papers.values():
+        paper_groups = self._context.cambridge_paper_groups.get(subject, [])
+        cursor = self._cambridge_group_cursors.get(subject, 0)
+        
+        while cursor < len(paper_groups):
+            paper_group = paper_groups[cursor]
+            cursor += 1
+            
             if all(p.url not in self._assigned_paper_urls for p in paper_group):
                 for p in paper_group:
                     self._assigned_paper_urls.add(p.url)
-                return paper_group 
-
+                self._cambridge_group_cursors[subject] = cursor
+                return list(paper_group)
+        
+        self._cambridge_group_cursors[subject] = cursor
         return []
     
     def _get_next_eceswa_unassigned_paper(self, subject: str, grade: str) -> list[PastPaperMetadata]:
@@ -235,6 +241,9 @@ class ExamScheduler:
         Return the next unassigned ECESWA paper group for the given subject and grade.
 
         Groups papers by year, session, and paper number. Prioritizes latest year and lowest paper number.
+        The sorted groups are precomputed once per grade and consumed as a queue: a
+        per-(subject, grade) cursor skips groups that are already (partly) assigned.
+        URLs are only released by a grade-wide reset, which also rewinds the cursors.
 
         Args:
             subject (str): Subject to find papers for.
@@ -244,43 +253,20 @@ class ExamScheduler:
             list[PastPaperMetadata]: A list of unassigned papers or [].
         """
         
-        def extract_paper_number(url: str) -> Optional[int]:
-            """
-            Extracts the paper number from the filename in the URL.
-            Returns an integer (e.g., 1, 2) or None if not found.
-            """
-            match = re.search(r"Paper\s*(\d+)", url, re.IGNORECASE)
-            if match:
-                return int(match.group(1))
-            return None
-        
-        subject_papers = self._subject_paper_cache.get(subject, {}).get(grade, [])
-        grouped: Dict[tuple[int, str, Optional[int]], list[PastPaperMetadata]] = defaultdict(list)
-
-        # Group by (year, session, paper_number)
-        for paper in subject_papers:
-            paper_number = extract_paper_number(paper.url)
-            group_key = (paper.year, paper.session, paper_number)
-            grouped[group_key].append(
-                PastPaperMetadata(
-                    grade=paper.grade,
-                    subject=paper.subject,
-                    year=paper.year,
-                    session=paper.session,
-                    url=paper.url,
-                    paper=LibUtils.extract_paper_label(paper.url)
-                )
-            )
-
-        # Sort groups by year descending, then paper number ascending
-        sorted_groups = sorted(grouped.items(), key=lambda x: (-x[0][0], x[0][2] or 0))
-
-        for (_, _, _), papers in sorted_groups:
+        paper_groups = self._context.eceswa_paper_groups.get(subject, {}).get(grade, [])
+        cursor = self._eceswa_group_cursors.get((subject, grade), 0)
+        
+        while cursor < len(paper_groups):
+            papers = paper_groups[cursor]
+            cursor += 1
+            
             if all(p.url not in self._assigned_paper_urls for p in papers):
                 for p in papers:
                     self._assigned_paper_urls.add(p.url)
-                return papers
-
+                self._eceswa_group_cursors[(subject, grade)] = cursor
+                return list(papers)
+        
+        self._eceswa_group_cursors[(subject, grade)] = cursor
         return []
 
     def _get_next_eceswa_egcse_unassigned_paper(self, subject: str) -> list[PastPaperMetadata]:
@@ -315,16 +301,13 @@ class ExamScheduler:
         Returns:
             set[str]: Set of valid study day strings in 'dd-mm-yy' format.
         """
-        return {
-            day
-            for month_block in self._generate_monthly_schedules()
-            for day in month_block["days"]
-        }
+        return set(self._context.study_days)
         
     def _get_next_eceswa_with_reset(self, subject: str, grade: str) -> list[PastPaperMetadata]:
         """
         Get the next ECESWA unassigned paper group for the given subject and grade.
-        Resets ECESWA assigned papers if exhausted.
+        Resets ECESWA assigned papers if exhausted, so the queue wraps around to its
+        first group.
 
         Args:
             subject (str): Subject to fetch papers for.
@@ -334,35 +317,43 @@ class ExamScheduler:
             list[PastPaperMetadata]: The next unassigned paper group.
         """
         
-        def reset_eceswa_assigned_urls(grade: str):
-            """
-            Reset assigned paper URLs for ECESWA papers of a given grade.
-
-            Args:
-                grade (str): The ECESWA grade (e.g., JC or EGCSE).
-            """
-            eceswa_urls = {
-                paper.url
-                for subject, grades in self._subject_paper_cache.items()
-                for g, papers in grades.items()
-                if g == grade
-                for paper in papers
-            }
-            self._assigned_paper_urls -= eceswa_urls
-        
         papers = self._get_next_eceswa_unassigned_paper(subject, grade)
-        if not papers:
+        
+        # A queue whose remaining groups are only partly assigned cannot be
+        # reset, and stays that way until another subject resets the grade
+        if not papers and (subject, grade) not in self._eceswa_exhausted_queues:
+            subject_urls = self._context.eceswa_paper_urls.get(subject, {}).get(grade, frozenset())
+            
             # Check if all ECESWA papers for this grade are already assigned
-            all_papers = [
-                p for g, papers in self._subject_paper_cache.get(subject, {}).items()
-                if g == grade for p in papers
-            ]
-            all_urls = {p.url for p in all_papers}
-            if all_urls.issubset(self._assigned_paper_urls):
-                reset_eceswa_assigned_urls(grade)
+            if subject_urls <= self._assigned_paper_urls:
+                self._reset_eceswa_queues(grade)
                 papers = self._get_next_eceswa_unassigned_paper(subject, grade)
+            else:
+                self._eceswa_exhausted_queues.add((subject, grade))
+        
         return papers
     
+    def _reset_eceswa_queues(self, grade: str) -> None:
+        """
+        Release the assigned ECESWA paper URLs of a grade across all the student's
+        subjects and rewind those subjects' group queues to the start.
+
+        Args:
+            grade (str): The ECESWA grade (e.g., JC or EGCSE).
+        """
+        for subject in self._student.subjects:
+            self._assigned_paper_urls -= self._context.eceswa_paper_urls.get(subject, {}).get(grade, frozenset())
+        
+        for key in list(self._eceswa_group_cursors):
+            if key[1] == grade:
+                del self._eceswa_group_cursors[key]
+        
+        self._eceswa_exhausted_queues = {
+            key for key in self._eceswa_exhausted_queues if key[1] != grade
+        }
+        
+        self._reset_days[grade] = self._current_day
+    
     def get_new_scheduled_papers_for_student(self) -> list[ScheduledPastPaperMetadata]:
         """
         Generate a strict one-subject-per-day exam preparation schedule for the student.
@@ -379,6 +370,111 @@ class ExamScheduler:
                 List of scheduled papers (or empty placeholders) for each study day.
         """
 
+        subjects_order = [s_w_c["subject"] for s_w_c in self._student_subjects_with_councils]
+        
+        assigned_rows, _ = self._assign_days(
+            self._context.study_days,
+            subject_index=0,
+            council_indices={subject: 0 for subject in subjects_order}
+        )
+        
+        return assigned_rows
+    
+    def extend_schedule(self, window_weeks: int, today: Optional[date] = None) -> list[ScheduledPastPaperMetadata]:
+        """
+        Materialise the student's schedule up to `window_weeks` weeks ahead of today.
+
+        Scheduling resumes where the stored `ScheduleCursor` stopped: the subject
+        rotation and each subject's council rotation continue from the cursor, and
+        the assigned papers are recovered from the stored records (minus those
+        released by the ECESWA resets recorded in the cursor). Paper positions are
+        re-derived rather than stored, so catalog changes between runs are picked up.
+        Extending `end_date` or adding a subject therefore only schedules the new days.
+
+        Without a cursor, scheduling starts after the last stored study day, or on
+        the first study day if the student has no schedule yet.
+
+        The new cursor is left in `schedule_cursor`; persist it together with the
+        returned records.
+
+        Args:
+            window_weeks (int): How many weeks ahead of today to materialise.
+            today (date, optional): The reference day. Defaults to today.
+
+        Returns:
+            list[ScheduledPastPaperMetadata]: The records of the newly materialised
+                days, or [] if the window is already materialised.
+        """
+        subjects_order = [s_w_c["subject"] for s_w_c in self._student_subjects_with_councils]
+        
+        end = self._context.window_end(window_weeks, today)
+        cursor = self._student_reader.get_schedule_cursor(self._student.id)
+        start = self._materialised_days(cursor)
+        
+        if cursor is not None:
+            subject_index = cursor.subject_index
+            council_indices = {s: cursor.council_indices.get(s, 0) for s in subjects_order}
+            reset_days = dict(cursor.reset_days)
+        else:
+            subject_index = start
+            council_indices = {subject: 0 for subject in subjects_order}
+            reset_days = {}
+        
+        self.schedule_cursor = cursor
+        
+        if start >= end:
+            return []
+        
+        # Start from the stored state rather than anything assigned earlier in memory
+        self._assigned_paper_urls = self._load_assigned_paper_urls(reset_days)
+        self._reset_days = reset_days
+        self._cambridge_group_cursors = {}
+        self._eceswa_group_cursors = {}
+        self._eceswa_exhausted_queues = set()
+        
+        assigned_rows, subject_index = self._assign_days(
+            self._context.study_days[start:end],
+            subject_index,
+            council_indices
+        )
+        
+        self.schedule_cursor = ScheduleCursor(
+            student_id=self._student.id,
+            last_day=self._context.study_days[end - 1],
+            subject_index=subject_index,
+            council_indices=council_indices,
+            reset_days=dict(self._reset_days)
+        )
+        
+        return assigned_rows
+    
+    def _materialised_days(self, cursor: Optional[ScheduleCursor]) -> int:
+        """Return the number of study days already scheduled, per the cursor or the stored records."""
+        if cursor is not None:
+            return self._context.study_days_through(cursor.last_day)
+        
+        records = self._get_scheduled_records()
+        return self._context.study_days_through(records[-1].date) if records else 0
+    
+    def _assign_days(
+        self,
+        days: list[str],
+        subject_index: int,
+        council_indices: Dict[str, int]
+    ) -> tuple[list[ScheduledPastPaperMetadata], int]:
+        """
+        Assign one subject, and its next paper group, to each of the given study days.
+
+        Args:
+            days (list[str]): The study days to assign, in order, as 'dd-mm-yy'.
+            subject_index (int): Position in the subject rotation for the first day.
+            council_indices (Dict[str, int]): Next council to try per subject; updated in place.
+
+        Returns:
+            tuple[list[ScheduledPastPaperMetadata], int]: The scheduled records and the
+                subject rotation position for the day after the last one.
+        """
+
         def get_papers_for_subject(subject: str, councils: list[ExamCouncil]) -> list[PastPaperMetadata]:
             """
             Get the next available paper(s) for a subject, rotating through councils.
@@ -416,12 +512,6 @@ class ExamScheduler:
             council_indices[subject] = (council_indices[subject] + 1) % len(councils)
             return []
 
-        # All valid schedule days (already excludes weekends and configured off-days)
-        all_days = sorted(
-            self._get_all_days(),
-            key=lambda d: datetime.strptime(d, "%d-%m-%y")
-        )
-
         # Fixed order list of subjects
         subjects_order = [
             s_w_c["subject"]
@@ -434,13 +524,10 @@ class ExamScheduler:
             for s_w_c in self._student_subjects_with_councils
         }
 
-        # Track which council index to use next for each subject
-        council_indices = {subject: 0 for subject in subjects_order}
-
         assigned_rows = []
-        subject_index = 0
 
-        for day in all_days:
+        for day in days:
+            self._current_day = day
             subject = subjects_order[subject_index % len(subjects_order)]
             councils = councils_map[subject]
 
@@ -451,7 +538,7 @@ class ExamScheduler:
             for p in papers:
                 assigned_rows.append(ScheduledPastPaperMetadata(
                     student_id=self._student.id,
-                    date=day,
+                    date_ordinal=date_ordinal(day),
                     grade=p.grade,
                     subject=p.subject,
                     year=p.year,
@@ -464,7 +551,7 @@ class ExamScheduler:
             if not papers:
                 assigned_rows.append(ScheduledPastPaperMetadata(
                     student_id=self._student.id,
-                    date=day,
+                    date_ordinal=date_ordinal(day),
                     grade="",
                     subject=subject,
                     year=0,
@@ -475,9 +562,7 @@ class ExamScheduler:
 
             subject_index += 1  # Move to the next subject for the next day
 
-        return assigned_rows
-
-
+        return assigned_rows, subject_index
 
     def has_complete_schedule(self) -> bool:
         """
@@ -502,116 +587,53 @@ class ExamScheduler:
         Checks if the exam schedule is written to database.
         """
       
-        all_downloaded_past_papers_urls = [
-            record.url 
-            for record in self._schedule_reader.get_downloaded_paper_metadata_records()
-        ]
-        
-        all_scheduled_papers_urls = [record.url for record in self._get_scheduled_records()]
+        ledger = DownloadedPaperLedger.instance(self._student.grade)
         
-        return set(all_scheduled_papers_urls).issubset(set(all_downloaded_past_papers_urls))
+        return ledger.contains_all(record.url for record in self._get_scheduled_records())
     
     def papers_exist_in_src_dir(self) -> bool:
         """
         Check if the all the assigned past papers have been downloaded 
         onto disk
         """
-        return all([
-            paper.src_path.exists()
-            for monthly_schedule in self.get_schedule().monthly_schedules
-            for daily_schedule in monthly_schedule.daily_schedules 
-            for paper in daily_schedule.papers
-        ])
+        return self.get_snapshot().papers_exist_in_src_dir()
         
     def schedule_pdf_generated(self) -> bool:
-        path = self.get_schedule().generated_pdf_path
-        return Path(path).with_suffix('.pdf').resolve().exists()
+        return self.get_snapshot().schedule_pdf_generated()
     
-    def schedule_copied_to_output_dir(self) -> bool:
-        
-        schedule_base_path = self.get_schedule().base_path / self._student.name
-        copied_papers_paths = list(schedule_base_path.rglob("*.pdf"))
-        
-        
-        scheduled_papers_paths = [
-            paper.dest_path
-            for ms in self.get_schedule().monthly_schedules
-            for ds in ms.daily_schedules
-            for paper in ds.papers
-        ]
-        
-        return set(scheduled_papers_paths).issubset(set(copied_papers_paths))
+    def schedule_copied_to_output_dir(
+        self,
+        verification: OutputVerification = OutputVerification.MANIFEST
+    ) -> bool:
+        return self.get_snapshot().schedule_copied_to_output_dir(verification)
     
     def get_exam_schedule_papers(self) -> list[SchedulePaper]:
-        return [
-            paper 
-            for ms in self.get_schedule().monthly_schedules
-            for ds in ms.daily_schedules
-            for paper in ds.papers
-        ]
+        return self.get_snapshot().schedule_papers()
     
     def get_schedule(self) -> ExamSchedule:
+        """
+        Return the student's exam schedule, grouped by month, day and subject.
+
+        The schedule is built once and reused until the scheduled records change.
+
+        Returns:
+            ExamSchedule: The student's schedule.
+        """
+        return self.get_snapshot().exam_schedule
     
+    def get_snapshot(self) -> ScheduleSnapshot:
+        """
+        Return a snapshot of the student's stored schedule.
+
+        The snapshot is taken once and reused until the scheduled records change;
+        `ScheduleSnapshot.save()` hands it to the copy, PDF and send stages.
+
+        Returns:
+            ScheduleSnapshot: The student's schedule snapshot.
+        """
+        records = self._get_scheduled_records()
         
-        # Base path for destination to which the past paper will be copied
-        base_path = BASE_DIR / "Output" / self._student.grade
-        generated_pdf_path = BASE_DIR / "Output" / "pdf" / f'{self._student.name} - Exam Preparation Schedule'
-        
-        # Group by year -> month -> date -> subject
-        grouped = defaultdict(lambda: defaultdict(lambda: defaultdict(lambda: defaultdict(list))))
-        
-        for r in self._get_scheduled_records():
-            year, month = LibUtils.get_date_parts(r.date)
-            
-            filename = os.path.basename(urlparse(r.url).path)
-            
-            src_path = BASE_DIR / "Resources" / r.grade / r.subject / r.year / r.session / filename
-            dest_path = base_path / self._student.name / year / month / r.date / r.subject / filename
-        
-            # Append the schedule paper object to the grouping
-            if r.url:
-                grouped[year][month][r.date][r.subject].append(SchedulePaper(
-                    paper_metadata=DownloadedPastPaperMetadata(
-                        grade=r.grade,
-                        subject=r.subject,
-                        year=r.year,
-                        session=r.session,
-                        url=r.url,
-                        path=src_path,
-                    ),
-                    src_path=src_path,
-                    dest_path=dest_path
-                ))
+        if self._snapshot is None:
+            self._snapshot = ScheduleSnapshot(self._student, records, self._scheduled_records_version)
         
-        # Now build the ExamSchedule data structure
-        monthly_schedules = []
-        for year, months in sorted(grouped.items()):
-            for month, dates in sorted(months.items()):
-                daily_schedules = []
-                for date, subjects in sorted(dates.items()):
-                    for subject, papers in sorted(subjects.items()):
-                        daily_schedule = DailySchedule(
-                            day=date,
-                            subject=subject,
-                            papers=papers
-                        )
-                        daily_schedules.append(daily_schedule)
-                        
-                monthly_schedule = MonthlySchedule(
-                    year=year,
-                    month=month,
-                    daily_schedules=daily_schedules
-                )
-                monthly_schedules.append(monthly_schedule)
-        
-        return ExamSchedule(
-            student_info=StudentInfo(
-                id=self._student.id,
-                name=self._student.name,
-                grade=self._student.grade
-            ),
-            base_path=base_path,
-            generated_pdf_path=generated_pdf_path,
-            monthly_schedules=monthly_schedules
-        )
-            
\ No newline at end of file
+        return self._snapshot
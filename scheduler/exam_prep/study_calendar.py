@@ -0,0 +1,85 @@
+import calendar
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+
+from lib.typing.data.schedule import DayOfWeek, ScheduleInputData
+
+
+class StudyCalendar:
+    """
+    The study days of a grade, built on a NumPy business-day calendar.
+
+    The weekmask comes from the grade's excluded days and the holidays from
+    its optional public-holiday list; all study days between the start and
+    end dates are then selected in one vectorised `np.is_busday` pass.
+    Built once per grade and shared by every student's scheduler.
+
+    Attributes:
+        days (np.ndarray): The study days as a sorted `datetime64[D]` array.
+        labels (List[str]): The same days formatted as 'dd-mm-yy'.
+        months (List[np.ndarray]): The study days split into one array per month.
+    """
+
+    # Day order of NumPy weekmasks
+    WEEKDAYS = (
+        DayOfWeek.MONDAY,
+        DayOfWeek.TUESDAY,
+        DayOfWeek.WEDNESDAY,
+        DayOfWeek.THURSDAY,
+        DayOfWeek.FRIDAY,
+        DayOfWeek.SATURDAY,
+        DayOfWeek.SUNDAY,
+    )
+
+    def __init__(self, input_data: ScheduleInputData):
+        excluded_days = {getattr(day, "value", day) for day in input_data.excluded_days}
+        weekmask = [day.value not in excluded_days for day in self.WEEKDAYS]
+
+        start = self._to_datetime64(input_data.start_date)
+        end = self._to_datetime64(input_data.end_date)
+
+        if any(weekmask) and start <= end:
+            busdaycalendar = np.busdaycalendar(
+                weekmask=weekmask,
+                holidays=[self._to_datetime64(day) for day in input_data.holidays]
+            )
+            all_days = np.arange(start, end + np.timedelta64(1, "D"), dtype="datetime64[D]")
+            self.days = all_days[np.is_busday(all_days, busdaycal=busdaycalendar)]
+        else:
+            self.days = np.array([], dtype="datetime64[D]")
+
+        iso_days = np.datetime_as_string(self.days, unit="D")
+        self.labels = [f"{day[8:10]}-{day[5:7]}-{day[2:4]}" for day in iso_days]
+
+        day_months = self.days.astype("datetime64[M]")
+        boundaries = np.flatnonzero(day_months[1:] != day_months[:-1]) + 1
+        self.months = np.split(self.days, boundaries) if len(self.days) else []
+        self._month_boundaries = [0, *boundaries.tolist(), len(self.days)]
+
+    def monthly_schedules(self) -> List[Dict]:
+        """
+        Group the study days by month.
+
+        Returns:
+            List[Dict]: A list of dictionaries where each contains a year, month name, and
+                        a list of valid study days formatted as 'dd-mm-yy'.
+        """
+        blocks = []
+
+        for month_days, start, end in zip(self.months, self._month_boundaries, self._month_boundaries[1:]):
+            month = month_days[0].astype("datetime64[M]")
+            year = int(month.astype("datetime64[Y]").astype(int)) + 1970
+            blocks.append({
+                'year': year,
+                'month': calendar.month_name[int(month.astype(int)) % 12 + 1],
+                'days': self.labels[start:end]
+            })
+
+        return blocks
+
+    @staticmethod
+    def _to_datetime64(day: str) -> np.datetime64:
+        """Convert a 'dd-mm-yy' date to a `datetime64[D]`."""
+        return np.datetime64(datetime.strptime(day, "%d-%m-%y").date(), "D")
@@ -0,0 +1,41 @@
+import pytest
+
+from data.storage.storage_backend import StorageBackendType
+from data.storage.storage_backend_factory import StorageBackendFactory
+from lib.paths import DatabasePaths, OutputPaths, ResourcesPaths, StudentCSVPaths
+from lib.shared_instance import SharedInstance
+from scheduler.exam_prep.output_manifest import OutputManifest
+
+
+def _reset_shared_state() -> None:
+    """Drop every process-wide backend, index and cache built by a previous test."""
+    StorageBackendFactory._backends.clear()
+    for shared_class in SharedInstance.__subclasses__():
+        shared_class._instances.clear()
+    OutputManifest._checksums.clear()
+
+
+@pytest.fixture(autouse=True)
+def workspace(tmp_path, monkeypatch):
+    """Point `database/`, `Resources/` and `Output/` at a fresh temporary directory."""
+    monkeypatch.chdir(tmp_path)
+
+    # These paths are fixed when lib.paths is imported, not when they are used
+    for paths, base_dir in (
+        (StudentCSVPaths, tmp_path / "database" / "students"),
+        (DatabasePaths, tmp_path / "database"),
+        (ResourcesPaths, tmp_path / "Resources"),
+        (OutputPaths, tmp_path / "Output"),
+    ):
+        monkeypatch.setattr(paths.__init__, "__defaults__", (base_dir,))
+
+    _reset_shared_state()
+    yield tmp_path
+    _reset_shared_state()
+
+
+@pytest.fixture(params=[StorageBackendType.CSV, StorageBackendType.SQLITE], ids=lambda t: t.value)
+def backend(request, monkeypatch):
+    """The configured storage backend, once per backend type."""
+    monkeypatch.setattr("data.storage.storage_backend_factory.STORAGE_BACKEND", request.param.value)
+    return StorageBackendFactory.get()
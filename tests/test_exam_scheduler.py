@@ -0,0 +1,107 @@
+from datetime import date
+
+from data.students.student_data_writer import StudentDataWriter
+from lib.exam_council import ExamCouncil
+from lib.grade import EceswaGrade
+from lib.typing.data.schedule import DayOfWeek, PrioritizedCouncil, ScheduleInputData
+from lib.typing.domain.schedule import PastPaperMetadata
+from lib.typing.domain.student import Student
+from scheduler.exam_prep.batch_scheduler import BatchExamScheduler
+from scheduler.exam_prep.grade_scheduling_context import GradeSchedulingContext
+from scheduler.exam_prep.scheduler import ExamScheduler
+
+ANN = Student(name="Ann Dlamini", phone="26876000001", grade="EGCSE", subjects=["Mathematics"], id="s1")
+
+ECESWA_URLS = [f"https://e/Mathematics/2020/EGCSE Mathematics Paper {number}.pdf" for number in (1, 2)]
+
+
+def make_context(councils: list[ExamCouncil], papers: dict[str, list[PastPaperMetadata]]) -> GradeSchedulingContext:
+    # Monday 4 to Friday 8 August 2025: five study days
+    input_data = ScheduleInputData(
+        start_date="04-08-25",
+        end_date="10-08-25",
+        excluded_days=[DayOfWeek.SATURDAY, DayOfWeek.SUNDAY],
+        prioritized_councils=[PrioritizedCouncil("Mathematics", [council.value for council in councils])],
+    )
+    return GradeSchedulingContext.from_data(EceswaGrade.EGCSE, input_data, {"Mathematics": papers})
+
+
+def eceswa_context() -> GradeSchedulingContext:
+    papers = [
+        PastPaperMetadata(grade="EGCSE", subject="Mathematics", year=2020, url=url, session="November", paper=f"Paper {number}")
+        for number, url in enumerate(ECESWA_URLS, 1)
+    ]
+    return make_context([ExamCouncil.ECESWA], {"EGCSE": papers})
+
+
+def test_eceswa_queue_rewinds_once_every_group_is_assigned():
+    records = ExamScheduler(ANN, eceswa_context()).get_new_scheduled_papers_for_student()
+
+    assert [record.url for record in records] == [ECESWA_URLS[i] for i in (0, 1, 0, 1, 0)]
+
+
+def test_cambridge_groups_keep_question_paper_and_insert_together():
+    stem = "https://c/0580/2020/0580_s20_{kind}_1{variant}.pdf"
+    papers = [
+        PastPaperMetadata(grade="IGCSE", subject="Mathematics", year=2020, url=stem.format(kind=kind, variant=variant), session="June", paper="Paper 1")
+        for variant in (1, 2)
+        for kind in ("qp", "in")
+    ]
+    context = make_context([ExamCouncil.CAMBRIDGE], {"IGCSE": papers})
+
+    records = ExamScheduler(ANN, context).get_new_scheduled_papers_for_student()
+
+    by_day = {}
+    for record in records:
+        by_day.setdefault(record.date, []).append(record.url)
+
+    assert list(by_day.values()) == [
+        [papers[0].url, papers[1].url],
+        [papers[2].url, papers[3].url],
+        [""],
+        [""],
+        [""],
+    ]
+
+
+def test_extend_schedule_resumes_from_the_cursor_across_a_reset():
+    context = eceswa_context()
+    writer = StudentDataWriter()
+    full_schedule = ExamScheduler(ANN, context).get_new_scheduled_papers_for_student()
+
+    # Through Wednesday: the queue has already been rewound once
+    scheduler = ExamScheduler(ANN, context)
+    first = scheduler.extend_schedule(window_weeks=0, today=date(2025, 8, 6))
+    assert scheduler.schedule_cursor.last_day == "06-08-25"
+    assert scheduler.schedule_cursor.reset_days == {"EGCSE": "06-08-25"}
+    writer.write_exam_schedule_records(first, strict=True)
+    writer.write_schedule_cursors([scheduler.schedule_cursor])
+
+    scheduler = ExamScheduler(ANN, context)
+    second = scheduler.extend_schedule(window_weeks=0, today=date(2025, 8, 8))
+    writer.write_exam_schedule_records(second, strict=True)
+    writer.write_schedule_cursors([scheduler.schedule_cursor])
+
+    assert first + second == full_schedule
+    assert ExamScheduler(ANN, context).extend_schedule(window_weeks=0, today=date(2025, 8, 8)) == []
+
+
+def test_window_end_counts_study_days_through_the_horizon():
+    context = eceswa_context()
+
+    assert context.window_end(0, date(2025, 8, 3)) == 0
+    assert context.window_end(0, date(2025, 8, 6)) == 3
+    assert context.window_end(1, date(2025, 8, 6)) == 5
+    assert context.study_days_through("08-08-25") == 5
+
+
+def test_batch_skips_students_whose_cursor_covers_the_window(monkeypatch):
+    # The whole calendar lies in the past, so any window covers all of it
+    batch = BatchExamScheduler(eceswa_context(), max_workers=1, window_weeks=1)
+    assert batch.schedule([ANN]) == 5
+
+    def fail(*args):
+        raise AssertionError("a fully scheduled student was scheduled again")
+
+    monkeypatch.setattr(BatchExamScheduler, "schedule_students", fail)
+    assert batch.schedule([ANN]) == 0
@@ -0,0 +1,82 @@
+from data.storage.csv_storage_backend import CsvStorageBackend
+from data.storage.migration import CsvToSqliteMigration
+from data.storage.sqlite_storage_backend import SqliteStorageBackend
+from lib.paths import DatabasePaths
+from lib.typing.domain.schedule import MsgRecord, ScheduleCursor
+from lib.typing.domain.student import Student
+
+from tests.test_storage_backends import make_download, make_record
+
+
+def populate_csv_database() -> CsvStorageBackend:
+    csv_backend = CsvStorageBackend()
+    csv_backend.write_students([
+        Student(name="Ann Dlamini", phone="26876000001", grade="EGCSE", subjects=["Mathematics"], id="s1"),
+        Student(name="Ben Nkosi", phone="26876000002", grade="JC", subjects=["Biology", "Geography"], id="s2"),
+    ])
+    csv_backend.write_exam_schedule_records(
+        [make_record("s1", day, paper) for paper, day in enumerate(["04-08-25", "05-08-25", "06-08-25"], 1)]
+    )
+    csv_backend.write_schedule_cursors([
+        ScheduleCursor(student_id="s1", last_day="06-08-25", subject_index=3, reset_days={"EGCSE": "06-08-25"})
+    ])
+    csv_backend.write_msg_records([
+        MsgRecord("s1", "04-08-25", "ECESWA", "Mathematics", "November", "https://e/a.pdf")
+    ])
+    csv_backend.write_downloaded_paper_metadata_records(
+        "EGCSE",
+        [make_download("https://e/1.pdf"), make_download("https://e/2.pdf")]
+    )
+    csv_backend.write_past_paper_urls({
+        "EGCSE,Mathematics,2020,November": [
+            "https://e/Mathematics/2020/EGCSE Mathematics Paper 1.pdf",
+            "https://e/Mathematics/2020/EGCSE Mathematics Paper 2.pdf",
+        ],
+    })
+    return csv_backend
+
+
+def test_migration_copies_every_table():
+    csv_backend = populate_csv_database()
+
+    counts = CsvToSqliteMigration().run()
+
+    assert counts == {
+        "students": 2,
+        "assigned_schedules": 3,
+        "schedule_cursors": 1,
+        "sent_msgs": 1,
+        "downloaded_papers": 2,
+        "past_papers": 2,
+    }
+
+    sqlite_backend = SqliteStorageBackend(DatabasePaths().sqlite_file)
+    assert sqlite_backend.get_all_students() == csv_backend.get_all_students()
+    assert sqlite_backend.get_all_exam_schedules() == csv_backend.get_all_exam_schedules()
+    assert sqlite_backend.get_all_schedule_cursors() == csv_backend.get_all_schedule_cursors()
+    assert sqlite_backend.get_all_msg_records() == csv_backend.get_all_msg_records()
+    assert (
+        [record.url for record in sqlite_backend.get_downloaded_paper_metadata_records("EGCSE")]
+        == [record.url for record in csv_backend.get_downloaded_paper_metadata_records("EGCSE")]
+    )
+    # The catalog writer names subject files in lower case
+    catalog = csv_backend.get_subject_metadata("EGCSE", "mathematics")
+    assert len(catalog) == 2
+    assert sqlite_backend.get_subject_metadata("EGCSE", "mathematics") == catalog
+
+
+def test_migration_can_be_rerun():
+    populate_csv_database()
+
+    CsvToSqliteMigration().run()
+    counts = CsvToSqliteMigration().run()
+
+    # Cursors are replaced rather than skipped; every other table is unchanged
+    assert {table: count for table, count in counts.items() if table != "schedule_cursors"} == {
+        "students": 0,
+        "assigned_schedules": 0,
+        "sent_msgs": 0,
+        "downloaded_papers": 0,
+        "past_papers": 0,
+    }
+    assert len(SqliteStorageBackend(DatabasePaths().sqlite_file).get_all_schedule_cursors()) == 1
@@ -0,0 +1,73 @@
+from dataclasses import replace
+
+from lib.paths import OutputPaths, ResourcesPaths
+from lib.typing.domain.schedule import SchedulePaper
+from scheduler.exam_prep.output_manifest import OutputManifest, OutputVerification
+from scheduler.exam_prep.output_materialiser import OutputLinkMode, OutputMaterialiser
+
+from tests.test_storage_backends import make_download
+
+
+def make_papers(count: int = 2) -> list[SchedulePaper]:
+    papers = []
+    for number in range(1, count + 1):
+        src = ResourcesPaths().grade_dir("EGCSE") / f"Paper {number}.pdf"
+        src.parent.mkdir(parents=True, exist_ok=True)
+        src.write_bytes(f"paper {number}".encode())
+
+        metadata = replace(make_download(f"https://e/Paper {number}.pdf"), path=src)
+        papers.append(SchedulePaper(metadata, OutputPaths().grade_dir("EGCSE") / "s1" / src.name))
+    return papers
+
+
+def copy_and_record(papers: list[SchedulePaper]) -> OutputManifest:
+    OutputMaterialiser(OutputLinkMode.COPY).materialise(papers)
+    OutputManifest.from_papers(papers).save("s1")
+    return OutputManifest.load("s1")
+
+
+def test_manifest_verifies_copied_papers():
+    papers = make_papers()
+    manifest = copy_and_record(papers)
+
+    for verification in OutputVerification:
+        assert manifest.verify(papers, verification)
+
+
+def test_manifest_misses_unlisted_papers():
+    papers = make_papers(3)
+    manifest = copy_and_record(papers[:2])
+
+    assert not manifest.verify(papers)
+
+
+def test_manifest_leaves_out_papers_that_were_not_placed():
+    papers = make_papers()
+    OutputMaterialiser(OutputLinkMode.COPY).materialise(papers[:1])
+
+    manifest = OutputManifest.from_papers(papers)
+
+    assert manifest.verify(papers[:1])
+    assert not manifest.verify(papers)
+
+
+def test_stat_verification_catches_a_removed_file():
+    papers = make_papers()
+    manifest = copy_and_record(papers)
+    papers[0].dest_path.unlink()
+
+    assert manifest.verify(papers, OutputVerification.MANIFEST)
+    assert not manifest.verify(papers, OutputVerification.STAT)
+
+
+def test_deep_verification_catches_changed_content():
+    papers = make_papers()
+    manifest = copy_and_record(papers)
+    papers[0].dest_path.write_bytes(b"PAPER 1")  # same size, other content
+
+    assert manifest.verify(papers, OutputVerification.STAT)
+    assert not manifest.verify(papers, OutputVerification.DEEP)
+
+
+def test_missing_manifest_loads_as_none():
+    assert OutputManifest.load("s1") is None
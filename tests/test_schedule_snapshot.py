@@ -0,0 +1,56 @@
+import json
+
+from data.students.student_data_reader import StudentDataReader
+from lib.paths import OutputPaths
+from lib.typing.domain.student import Student
+from scheduler.exam_prep.schedule_snapshot import ScheduleSnapshot
+
+from tests.test_storage_backends import make_record
+
+ANN = Student(name="Ann Dlamini", phone="26876000001", grade="EGCSE", subjects=["Mathematics"], id="s1")
+
+
+def take_snapshot(backend) -> ScheduleSnapshot:
+    backend.write_exam_schedule_records([make_record("s1", "04-08-25", 1), make_record("s1", "05-08-25", 2)])
+    snapshot = ScheduleSnapshot(
+        ANN,
+        backend.get_exam_schedules_by_id("s1"),
+        StudentDataReader().get_exam_schedules_version("s1")
+    )
+    snapshot.save()
+    return snapshot
+
+
+def test_snapshot_round_trip(backend):
+    snapshot = take_snapshot(backend)
+
+    loaded = ScheduleSnapshot.load("s1")
+
+    assert loaded.student == ANN
+    assert loaded.records == snapshot.records
+    assert loaded.records_by_day("05-08-25") == snapshot.records[1:]
+    assert [snapshot.student.id for snapshot in ScheduleSnapshot.load_all("EGCSE")] == ["s1"]
+    assert list(ScheduleSnapshot.load_all("JC")) == []
+
+
+def test_snapshot_is_stale_once_the_records_change(backend):
+    take_snapshot(backend)
+
+    backend.write_exam_schedule_records([make_record("s1", "06-08-25", 3)])
+
+    assert ScheduleSnapshot.load("s1") is None
+    assert list(ScheduleSnapshot.load_all()) == []
+
+
+def test_snapshot_of_another_format_is_ignored(backend):
+    take_snapshot(backend)
+    snapshot_file = OutputPaths().snapshot_file("s1")
+    data = json.loads(snapshot_file.read_text(encoding="utf-8"))
+    data["version"] = ScheduleSnapshot.FORMAT_VERSION + 1
+    snapshot_file.write_text(json.dumps(data), encoding="utf-8")
+
+    assert ScheduleSnapshot.load("s1") is None
+
+
+def test_missing_snapshot_loads_as_none(backend):
+    assert ScheduleSnapshot.load("s1") is None
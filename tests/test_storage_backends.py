@@ -0,0 +1,132 @@
+from pathlib import Path
+
+from data.schedules.downloaded_paper_ledger import DownloadedPaperLedger
+from lib.typing.domain.schedule import (
+    DownloadedPastPaperMetadata,
+    MsgRecord,
+    ScheduleCursor,
+    ScheduledPastPaperMetadata,
+    date_ordinal,
+)
+from lib.typing.domain.student import Student, StudentRecord
+
+
+def make_record(student_id: str, day: str, paper: int) -> ScheduledPastPaperMetadata:
+    return ScheduledPastPaperMetadata(
+        grade="EGCSE",
+        subject="Mathematics",
+        year="2020",
+        url=f"https://e/Mathematics/2020/EGCSE Mathematics Paper {paper}.pdf",
+        session="November",
+        paper=f"Paper {paper}",
+        student_id=student_id,
+        date_ordinal=date_ordinal(day),
+    )
+
+
+def make_download(url: str) -> DownloadedPastPaperMetadata:
+    return DownloadedPastPaperMetadata(
+        grade="EGCSE",
+        subject="Mathematics",
+        year="2020",
+        session="November",
+        url=url,
+        path=Path("Resources") / "EGCSE" / url.rsplit("/", 1)[-1],
+    )
+
+
+def test_students_round_trip(backend):
+    ann = Student(name="Ann Dlamini", phone="26876000001", grade="EGCSE", subjects=["Mathematics", "Biology"], id="s1")
+    ben = Student(name="Ben Nkosi", phone="26876000002", grade="JC", subjects=["English Language"], id="s2")
+
+    assert backend.write_students([ann, ben]) == 2
+    assert backend.write_students([ann]) == 0
+
+    assert backend.get_student_by_id("s1") == ann
+    assert backend.get_students_by_grade("JC") == [ben]
+    assert {student.id for student in backend.get_all_students()} == {"s1", "s2"}
+
+    # A known name and grade keeps its ID
+    record = StudentRecord(name="Ann Dlamini", phone="26876000001", grade="EGCSE", subjects=["Mathematics"])
+    assert backend.write_student_record(record) == "s1"
+
+
+def test_schedule_records_round_trip(backend):
+    records = [make_record("s1", "04-08-25", 1), make_record("s1", "05-08-25", 2)]
+
+    assert backend.get_exam_schedules_version("s1") is None
+    assert backend.write_exam_schedule_records(records) == 2
+    version = backend.get_exam_schedules_version("s1")
+    assert version is not None
+
+    # Duplicates are dropped and leave the version alone
+    assert backend.write_exam_schedule_records(records[:1]) == 0
+    assert backend.get_exam_schedules_version("s1") == version
+
+    assert backend.get_exam_schedules_by_id("s1") == records
+    assert backend.get_exam_schedules_by_id_and_day("s1", "05-08-25") == records[1:]
+    assert backend.exam_schedule_record_exists(records[0])
+
+    assert backend.write_exam_schedule_records([make_record("s1", "06-08-25", 3)]) == 1
+    assert backend.get_exam_schedules_version("s1") != version
+
+
+def test_schedule_cursor_is_replaced(backend):
+    first = ScheduleCursor(student_id="s1", last_day="05-08-25", subject_index=2, council_indices={"Mathematics": 1})
+    second = ScheduleCursor(
+        student_id="s1",
+        last_day="12-08-25",
+        subject_index=7,
+        council_indices={"Mathematics": 0},
+        reset_days={"EGCSE": "11-08-25"},
+    )
+
+    backend.write_schedule_cursors([first])
+    backend.write_schedule_cursors([second])
+
+    assert backend.get_schedule_cursor("s1") == second
+    assert backend.get_all_schedule_cursors() == [second]
+    assert backend.get_schedule_cursor("s2") is None
+
+
+def test_msg_records_round_trip(backend):
+    msg = MsgRecord(
+        student_id="s1",
+        date="04-08-25",
+        exam_council="ECESWA",
+        subject="Mathematics",
+        session="November",
+        attached_url="https://e/a.pdf",
+    )
+
+    assert backend.write_msg_records([msg, msg]) == 1
+    assert backend.get_all_msg_records() == [msg]
+    assert backend.msgs_for_id_and_day_exist("s1", "04-08-25")
+    assert not backend.msgs_for_id_and_day_exist("s1", "05-08-25")
+
+
+def test_downloaded_papers_round_trip(backend):
+    records = [make_download("https://e/1.pdf"), make_download("https://e/2.pdf")]
+
+    assert backend.get_downloaded_papers_version("EGCSE") is None
+    assert backend.write_downloaded_paper_metadata_records("EGCSE", records + records[:1]) == 2
+    assert backend.get_downloaded_papers_version("EGCSE") is not None
+
+    stored = backend.get_downloaded_paper_metadata_records("EGCSE")
+    assert [record.url for record in stored] == ["https://e/1.pdf", "https://e/2.pdf"]
+    assert backend.get_downloaded_paper_metadata_records("JC") == []
+
+
+def test_ledgers_do_not_append_a_url_twice(backend):
+    # Two ledgers loaded before either flushes, as in two downloader processes
+    first, second = DownloadedPaperLedger("EGCSE"), DownloadedPaperLedger("EGCSE")
+
+    assert first.add([make_download("https://e/1.pdf"), make_download("https://e/2.pdf")]) == 2
+    assert second.add([make_download("https://e/2.pdf"), make_download("https://e/3.pdf")]) == 2
+
+    assert first.flush() == 2
+    assert second.flush() == 1
+    assert second.contains_all(["https://e/1.pdf", "https://e/2.pdf", "https://e/3.pdf"])
+
+    stored = backend.get_downloaded_paper_metadata_records("EGCSE")
+    assert sorted(record.url for record in stored) == ["https://e/1.pdf", "https://e/2.pdf", "https://e/3.pdf"]